@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Downscale and recompress oversized PNG/JPEG media in an unpacked Office document.
+
+Each picture's rendered size is read from the XML that places it (a:xfrm/a:ext
+of the picture or shape, wp:extent in Word documents), including group scaling
+and a:srcRect cropping. Images are resampled so they keep no more pixels than
+the target DPI needs at their largest use; aspect ratio is preserved, so crop
+rectangles (stored as percentages) stay valid. Images whose use cannot be
+measured (tiled fills, bullets, charts, inherited placeholders, ...) are left
+alone, and a re-encoded image only replaces the original if it is smaller.
+
+Example usage:
+    python optimize_images.py <unpacked_dir> [--dpi 150] [--quality 85] [--jobs N]
+"""
+
+import argparse
+import io
+import os
+import posixpath
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import lxml.etree
+from PIL import Image
+
+EMUS_PER_INCH = 914400
+
+RELATIONSHIPS_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/relationships"
+OFFICE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+)
+DRAWINGML_NAMESPACE = "http://schemas.openxmlformats.org/drawingml/2006/main"
+WORD_DRAWING_NAMESPACE = (
+    "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+)
+
+EMBED_ATTRIBUTE = f"{{{OFFICE_RELATIONSHIPS_NAMESPACE}}}embed"
+BLIP_TAG = f"{{{DRAWINGML_NAMESPACE}}}blip"
+OPTIMIZABLE_EXTENSIONS = {".png", ".jpg", ".jpeg"}
+
+# Skip re-encoding when an image is already within this factor of its target
+MIN_DOWNSCALE = 0.9
+
+_XML_PARSER = lxml.etree.XMLParser(
+    resolve_entities=False, no_network=True, huge_tree=True
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Downscale and recompress oversized images in an unpacked Office document"
+    )
+    parser.add_argument("input_directory", help="Unpacked Office document directory")
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=150,
+        help="Target resolution at the rendered size (default: 150)",
+    )
+    parser.add_argument(
+        "--quality",
+        type=int,
+        default=85,
+        help="JPEG quality for resampled photos (default: 85)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for re-encoding (0 = all CPUs)",
+    )
+    args = parser.parse_args()
+
+    input_dir = Path(args.input_directory)
+    if not input_dir.is_dir():
+        sys.exit(f"Error: {input_dir} is not a directory")
+
+    results = optimize_images(
+        input_dir, dpi=args.dpi, quality=args.quality, jobs=args.jobs
+    )
+    if not results:
+        print("No images needed optimization")
+        return
+
+    saved = 0
+    for part_name, (old_size, new_size) in sorted(results.items()):
+        print(f"  {part_name}: {old_size:,} -> {new_size:,} bytes")
+        saved += old_size - new_size
+    print(f"Optimized {len(results)} images, saved {saved:,} bytes")
+
+
+def optimize_images(input_dir, dpi=150, quality=85, jobs=1):
+    """Optimize images of an unpacked document in place.
+
+    Returns:
+        dict: part_name -> (old_size, new_size) for every rewritten image
+    """
+    input_dir = Path(input_dir)
+    results = {}
+    for part_name, data in recompress_images(input_dir, dpi, quality, jobs).items():
+        path = input_dir / part_name
+        results[part_name] = (path.stat().st_size, len(data))
+        path.write_bytes(data)
+    return results
+
+
+def recompress_images(
+    input_dir, dpi=150, quality=85, jobs=1, part_names=None, merged=None
+):
+    """Re-encode oversized images without touching the source directory.
+
+    Args:
+        input_dir: Unpacked Office document directory
+        dpi: Target resolution at each image's largest rendered size
+        quality: JPEG quality used when re-encoding photos
+        jobs: Worker processes; 1 works serially, 0 or None uses all CPUs
+        part_names: Optional subset of media parts that may be rewritten
+        merged: Optional {part_name: part_name it was merged into} for media
+            deduplicated while packing, so their uses count for the kept part
+
+    Returns:
+        dict: part_name -> new image bytes, only for images that got smaller
+    """
+    input_dir = Path(input_dir)
+    targets = plan_image_targets(input_dir, dpi, merged)
+    if part_names is not None:
+        part_names = set(part_names)
+        targets = {k: v for k, v in targets.items() if k in part_names}
+    if not jobs:
+        jobs = os.cpu_count() or 1
+
+    tasks = [
+        (input_dir / part_name, target, quality)
+        for part_name, target in sorted(targets.items())
+    ]
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            encoded = list(pool.map(_optimize_task, tasks))
+    else:
+        encoded = [_optimize_task(task) for task in tasks]
+
+    return {
+        part_name: data
+        for part_name, data in zip(sorted(targets), encoded)
+        if data is not None
+    }
+
+
+def plan_image_targets(input_dir, dpi=150, merged=None):
+    """Compute the pixel size each optimizable image needs at the target DPI.
+
+    Uses of parts listed in merged ({part_name: kept part_name}) are counted
+    for the part they were merged into.
+
+    Returns:
+        dict: media part name -> (width_px, height_px), the largest size at
+        which the image is shown. Images with any use that cannot be measured
+        are omitted.
+    """
+    input_dir = Path(input_dir)
+    needed = {}
+    unknown = set()
+
+    for rels_path in sorted(input_dir.rglob("*")):
+        if not rels_path.name.endswith(".rels"):
+            continue
+        rels_name = rels_path.relative_to(input_dir).as_posix()
+        source_dir = posixpath.dirname(posixpath.dirname(rels_name))
+        source_name = posixpath.join(source_dir, rels_path.name[: -len(".rels")])
+
+        media = _media_relationships(rels_path, source_dir)
+        if merged:
+            media = {rid: merged.get(target, target) for rid, target in media.items()}
+        if not media:
+            continue
+
+        source_path = input_dir / source_name
+        if not source_path.is_file() or not source_name.endswith(".xml"):
+            unknown.update(media.values())
+            continue
+
+        measured = set()
+        root = lxml.etree.parse(str(source_path), _XML_PARSER).getroot()
+        for blip in root.iter(BLIP_TAG):
+            rid = blip.get(EMBED_ATTRIBUTE)
+            if rid not in media:
+                continue
+            extent = rendered_extent(blip)
+            if extent is None:
+                unknown.add(media[rid])
+                continue
+            measured.add(rid)
+            width_px = extent[0] * dpi / EMUS_PER_INCH
+            height_px = extent[1] * dpi / EMUS_PER_INCH
+            previous = needed.get(media[rid], (0, 0))
+            needed[media[rid]] = (
+                max(previous[0], width_px),
+                max(previous[1], height_px),
+            )
+
+        # Media used any other way (VML, links, bullets, ...) is left alone
+        unknown.update(target for rid, target in media.items() if rid not in measured)
+
+    return {
+        part_name: size
+        for part_name, size in needed.items()
+        if part_name not in unknown
+        and posixpath.splitext(part_name)[1].lower() in OPTIMIZABLE_EXTENSIONS
+    }
+
+
+def _media_relationships(rels_path, source_dir):
+    """Return rId -> media part name for internal relationships to media files."""
+    root = lxml.etree.parse(str(rels_path), _XML_PARSER).getroot()
+    media = {}
+    for rel in root.iter(f"{{{RELATIONSHIPS_NAMESPACE}}}Relationship"):
+        target = rel.get("Target")
+        if not target or rel.get("TargetMode") == "External":
+            continue
+        if target.startswith("/"):
+            resolved = posixpath.normpath(target.lstrip("/"))
+        else:
+            resolved = posixpath.normpath(posixpath.join(source_dir, target))
+        if posixpath.basename(posixpath.dirname(resolved)) == "media":
+            media[rel.get("Id")] = resolved
+    return media
+
+
+def rendered_extent(blip):
+    """Return the (cx, cy) EMU size of the source image as it is rendered.
+
+    The size of the visible area is taken from the enclosing picture or shape,
+    scaled by any enclosing groups, and divided by the visible fraction of the
+    a:srcRect crop so it describes the whole (uncropped) image. Returns None
+    when the use cannot be measured.
+    """
+    blip_fill = blip.getparent()
+    if blip_fill is None or lxml.etree.QName(blip_fill).localname != "blipFill":
+        return None
+    if any(lxml.etree.QName(child).localname == "tile" for child in blip_fill):
+        return None
+
+    # Word drawings are sized by wp:extent; other parts by the shape's xfrm
+    frame = extent = None
+    for ancestor in blip.iterancestors(
+        f"{{{WORD_DRAWING_NAMESPACE}}}inline", f"{{{WORD_DRAWING_NAMESPACE}}}anchor"
+    ):
+        frame = ancestor
+        extent = ancestor.find(f"{{{WORD_DRAWING_NAMESPACE}}}extent")
+        break
+    if frame is None:
+        for ancestor in blip.iterancestors():
+            if lxml.etree.QName(ancestor).localname in ("pic", "sp"):
+                frame, extent = ancestor, _shape_ext(ancestor)
+                break
+    if extent is None:
+        return None
+
+    try:
+        cx = int(extent.get("cx"))
+        cy = int(extent.get("cy"))
+    except (TypeError, ValueError):
+        return None
+
+    scale_x, scale_y = _group_scale(frame)
+    cx *= scale_x
+    cy *= scale_y
+
+    src_rect = blip_fill.find(f"{{{DRAWINGML_NAMESPACE}}}srcRect")
+    if src_rect is not None:
+        visible_x = 1 - (_percent(src_rect, "l") + _percent(src_rect, "r"))
+        visible_y = 1 - (_percent(src_rect, "t") + _percent(src_rect, "b"))
+        if visible_x <= 0 or visible_y <= 0:
+            return None
+        # Negative insets pad the image; they never call for more pixels
+        cx /= min(visible_x, 1)
+        cy /= min(visible_y, 1)
+
+    return cx, cy
+
+
+def _shape_ext(shape):
+    """Return the a:xfrm/a:ext element of a picture or shape, if present."""
+    for child in shape:
+        if lxml.etree.QName(child).localname == "spPr":
+            return child.find(
+                f"{{{DRAWINGML_NAMESPACE}}}xfrm/{{{DRAWINGML_NAMESPACE}}}ext"
+            )
+    return None
+
+
+def _group_scale(frame):
+    """Return the x/y scale applied to a shape by its enclosing groups."""
+    scale_x = scale_y = 1.0
+    for ancestor in frame.iterancestors():
+        if lxml.etree.QName(ancestor).localname != "grpSp":
+            continue
+        xfrm = None
+        for child in ancestor:
+            if lxml.etree.QName(child).localname == "grpSpPr":
+                xfrm = child.find(f"{{{DRAWINGML_NAMESPACE}}}xfrm")
+                break
+        if xfrm is None:
+            continue
+        ext = xfrm.find(f"{{{DRAWINGML_NAMESPACE}}}ext")
+        ch_ext = xfrm.find(f"{{{DRAWINGML_NAMESPACE}}}chExt")
+        if ext is None or ch_ext is None:
+            continue
+        try:
+            if int(ch_ext.get("cx")) > 0:
+                scale_x *= int(ext.get("cx")) / int(ch_ext.get("cx"))
+            if int(ch_ext.get("cy")) > 0:
+                scale_y *= int(ext.get("cy")) / int(ch_ext.get("cy"))
+        except (TypeError, ValueError):
+            continue
+    return scale_x, scale_y
+
+
+def _percent(src_rect, side):
+    """Return a srcRect inset (stored in 1/1000ths of a percent) as a fraction."""
+    try:
+        return int(src_rect.get(side, "0")) / 100000
+    except ValueError:
+        return 0.0
+
+
+def _optimize_task(task):
+    path, target, quality = task
+    try:
+        return optimize_image_bytes(path.read_bytes(), target, quality)
+    except Exception:
+        # Unreadable or unusual images are kept as they are
+        return None
+
+
+def optimize_image_bytes(data, target, quality=85):
+    """Downscale and re-encode one image.
+
+    Args:
+        data: PNG or JPEG bytes
+        target: (width_px, height_px) the image needs to provide
+        quality: JPEG quality
+
+    Returns:
+        bytes or None: The re-encoded image, or None if it would not be smaller
+    """
+    with Image.open(io.BytesIO(data)) as img:
+        image_format = img.format
+        if image_format not in ("PNG", "JPEG"):
+            return None
+
+        width, height = img.size
+        scale = max(target[0] / width, target[1] / height)
+        # Rotated EXIF orientations swap the displayed width and height
+        if img.getexif().get(0x0112) in (5, 6, 7, 8):
+            scale = max(scale, target[0] / height, target[1] / width)
+
+        resized = img
+        if scale < MIN_DOWNSCALE:
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            if img.mode == "P":
+                img = img.convert("RGBA")
+            resized = img.resize(size, Image.LANCZOS)
+        elif image_format == "JPEG":
+            # Re-encoding a JPEG at the same size only loses quality
+            return None
+
+        save_options = {}
+        if img.info.get("icc_profile"):
+            save_options["icc_profile"] = img.info["icc_profile"]
+        if image_format == "JPEG":
+            exif = img.info.get("exif")
+            if exif:
+                save_options["exif"] = exif
+            save_options.update(quality=quality, optimize=True)
+            if resized.mode not in ("RGB", "L", "CMYK"):
+                resized = resized.convert("RGB")
+        else:
+            save_options["optimize"] = True
+
+        output = io.BytesIO()
+        resized.save(output, format=image_format, **save_options)
+
+    encoded = output.getvalue()
+    return encoded if len(encoded) < len(data) else None
+
+
+if __name__ == "__main__":
+    main()
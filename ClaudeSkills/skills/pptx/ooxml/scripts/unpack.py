@@ -1,29 +1,138 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""
+Unpack and format XML contents of Office files (.docx, .pptx, .xlsx).
 
+Example usage:
+    python unpack.py <office_file> <output_dir>
+    python unpack.py <office_file> <output_dir> --only ppt/slides --jobs 0
+
+With --only, just the parts under the given prefixes are pretty-printed; every
+other part is extracted byte-for-byte.
+"""
+
+import argparse
+import os
 import random
 import sys
-import defusedxml.minidom
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
-
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
-
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+import lxml.etree
+
+from pack import XML_PARSER, strip_formatting
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Unpack and format XML contents of an Office file"
+    )
+    parser.add_argument("input_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="PREFIX",
+        help="Only pretty-print parts under this prefix (e.g. ppt/slides); may be repeated",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for formatting parts (0 = all CPUs)",
+    )
+    args = parser.parse_args()
+
+    try:
+        unpack_document(args.input_file, args.output_dir, only=args.only, jobs=args.jobs)
+    except (ValueError, zipfile.BadZipFile) as e:
+        sys.exit(f"Error: {e}")
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.input_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(input_file, output_dir, only=None, jobs=1):
+    """Extract an Office file and pretty-print its XML parts.
+
+    Args:
+        input_file: Path to the .docx/.pptx/.xlsx file
+        output_dir: Directory to extract into (created if missing)
+        only: Optional part-name prefixes; when given, only XML parts under
+            these prefixes are pretty-printed and the rest stay byte-exact
+        jobs: Worker processes used for formatting; 1 formats serially,
+            0 or None uses all CPUs
+
+    Returns:
+        list: Names of the parts that were pretty-printed
+    """
+    input_file = Path(input_file)
+    output_path = Path(output_dir)
+    if not zipfile.is_zipfile(input_file):
+        raise ValueError(f"{input_file} is not an Office file")
+    if not jobs:
+        jobs = os.cpu_count() or 1
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(input_file) as zf:
+        zf.extractall(output_path)
+        part_names = [info.filename for info in zf.infolist() if not info.is_dir()]
+
+    prefixes = [prefix.strip("/") for prefix in only] if only else None
+    formatted = [
+        name
+        for name in part_names
+        if name.endswith((".xml", ".rels")) and _selected(name, prefixes)
+    ]
+    paths = [output_path / name for name in formatted]
+
+    if jobs > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+            list(pool.map(pretty_print_file, paths, chunksize=max(1, len(paths) // (jobs * 4))))
+    else:
+        for path in paths:
+            pretty_print_file(path)
+
+    return formatted
+
+
+def _selected(part_name, prefixes):
+    """Check whether a part falls under one of the requested prefixes."""
+    if prefixes is None:
+        return True
+    return any(
+        part_name == prefix or part_name.startswith(prefix + "/") or not prefix
+        for prefix in prefixes
+    )
+
+
+def pretty_print_file(xml_file):
+    """Pretty-print one extracted XML part in place."""
+    xml_file = Path(xml_file)
+    xml_file.write_bytes(pretty_print_xml_bytes(xml_file.read_bytes()))
+
+
+def pretty_print_xml_bytes(data):
+    """Return the XML indented with two spaces, one element per line.
+
+    Existing formatting whitespace is normalised first so re-unpacking is
+    stable, while the content of text elements (w:t, a:t, ...) is kept as is.
+    Output is ASCII with character references so it is safe to edit anywhere.
+    """
+    tree = lxml.etree.ElementTree(lxml.etree.fromstring(data, XML_PARSER))
+    root = tree.getroot()
+    strip_formatting(root, remove_comments=False)
+    lxml.etree.indent(root, space="  ")
+    return lxml.etree.tostring(
+        tree,
+        xml_declaration=True,
+        encoding="ascii",
+        standalone=tree.docinfo.standalone,
+    ) + b"\n"
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Command line tool to validate Office document XML files against XSD schemas and
 
 Usage:
     python validate.py <dir> --original <original_file>
+    python validate.py <packed_file> --original <original_file>
 """
 
 import argparse
@@ -17,7 +18,7 @@ def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
         "unpacked_dir",
-        help="Path to unpacked Office document directory",
+        help="Path to unpacked Office document directory, or a packed .docx/.pptx/.xlsx",
     )
     parser.add_argument(
         "--original",
@@ -36,7 +37,9 @@ def main():
     unpacked_dir = Path(args.unpacked_dir)
     original_file = Path(args.original)
     file_extension = original_file.suffix.lower()
-    assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
+    assert unpacked_dir.is_dir() or unpacked_dir.is_file(), (
+        f"Error: {unpacked_dir} is not a directory or a packed Office file"
+    )
     assert original_file.is_file(), f"Error: {original_file} is not a file"
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
@@ -55,9 +58,9 @@ def main():
     # Run validators
     success = True
     for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+        with V(unpacked_dir, original_file, verbose=args.verbose) as validator:
+            if not validator.validate():
+                success = False
 
     if success:
         print("All validations PASSED!")
@@ -6,10 +6,24 @@ from .base import BaseSchemaValidator
 from .docx import DOCXSchemaValidator
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
+from .rules import (
+    RelationshipIdRule,
+    Rule,
+    RuleEngine,
+    UniqueIdRule,
+    UuidIdRule,
+    WhitespacePreservationRule,
+)
 
 __all__ = [
     "BaseSchemaValidator",
     "DOCXSchemaValidator",
     "PPTXSchemaValidator",
     "RedliningValidator",
+    "RelationshipIdRule",
+    "Rule",
+    "RuleEngine",
+    "UniqueIdRule",
+    "UuidIdRule",
+    "WhitespacePreservationRule",
 ]
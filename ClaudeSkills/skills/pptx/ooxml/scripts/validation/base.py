@@ -2,11 +2,16 @@
 Base validator with common validation logic for document files.
 """
 
+import fnmatch
+import posixpath
 import re
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 
 import lxml.etree
 
+from .package import ZipPackage, open_package
+from .rules import RelationshipIdRule, RuleEngine, UniqueIdRule
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -104,26 +109,75 @@ class BaseSchemaValidator:
     }
 
     def __init__(self, unpacked_dir, original_file, verbose=False):
+        """
+        Args:
+            unpacked_dir: Unpacked document directory, or a packed .docx/.pptx/.xlsx
+                file whose members are validated in place without extracting
+            original_file: Original Office file used as the XSD error baseline
+            verbose: Enable verbose output
+        """
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
 
+        # Parts are addressed by package-relative names in both modes
+        self.package = open_package(self.unpacked_dir)
+        self._original_package = None
+        self._schema_cache = {}
+
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
         # Get all XML and .rels files
-        patterns = ["*.xml", "*.rels"]
+        self.part_names = self.package.part_names()
         self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
+            name
+            for suffix in (".xml", ".rels")
+            for name in self.part_names
+            if name.name.endswith(suffix)
         ]
 
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+    def parse_part(self, name, package=None):
+        """Parse a part of the document (or of another package) into an lxml tree."""
+        with (package or self.package).open(name) as f:
+            return lxml.etree.parse(f)
+
+    def parts_in(self, directory, pattern="*"):
+        """Return the parts directly inside a package directory matching a pattern."""
+        directory = PurePosixPath(directory)
+        return [
+            name
+            for name in self.part_names
+            if name.parent == directory and fnmatch.fnmatchcase(name.name, pattern)
+        ]
+
+    @property
+    def original_package(self):
+        """The original Office file, opened once and read member by member."""
+        if self._original_package is None:
+            self._original_package = ZipPackage(self.original_file)
+        return self._original_package
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def close(self):
+        """Close the document and the original file, if they were opened."""
+        self.package.close()
+        if self._original_package is not None:
+            self._original_package.close()
+            self._original_package = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
@@ -131,17 +185,11 @@ class BaseSchemaValidator:
         for xml_file in self.xml_files:
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                self.parse_part(xml_file)
             except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
+                errors.append(f"  {xml_file}: Line {e.lineno}: {e.msg}")
             except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
-                )
+                errors.append(f"  {xml_file}: Unexpected error: {str(e)}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
@@ -159,7 +207,7 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.parse_part(xml_file).getroot()
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -167,8 +215,7 @@ class BaseSchemaValidator:
                 ]:
                     undeclared = set(attr_val.split()) - declared
                     errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
+                        f"  {xml_file}: Namespace '{ns}' in Ignorable but not declared"
                         for ns in undeclared
                     )
             except lxml.etree.XMLSyntaxError:
@@ -183,96 +230,34 @@ class BaseSchemaValidator:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
-    def validate_unique_ids(self):
-        """Validate that specific IDs are unique according to OOXML requirements."""
-        errors = []
-        global_ids = {}  # Track globally unique IDs across all files
+    def structural_rules(self):
+        """Return the element-level rules checked in the shared streaming pass.
 
+        Subclasses extend this list with format-specific rules.
+        """
+        return [
+            UniqueIdRule(self.UNIQUE_ID_REQUIREMENTS),
+            self._relationship_id_rule(),
+        ]
+
+    def run_rules(self, rules):
+        """Dispatch rules from one streaming pass per XML file and report each."""
+        engine = RuleEngine(rules)
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
+            with self.package.open(xml_file) as f:
+                engine.scan(f, xml_file)
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
-                    )
+        # Report every rule, even after the first failure
+        results = [rule.report(self.verbose) for rule in rules]
+        return all(results)
 
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+    def validate_structure(self):
+        """Run all structural rules, traversing each XML file only once."""
+        return self.run_rules(self.structural_rules())
 
-        if errors:
-            print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All required IDs are unique")
-            return True
+    def validate_unique_ids(self):
+        """Validate that specific IDs are unique according to OOXML requirements."""
+        return self.run_rules([UniqueIdRule(self.UNIQUE_ID_REQUIREMENTS)])
 
     def validate_file_references(self):
         """
@@ -281,22 +266,19 @@ class BaseSchemaValidator:
         errors = []
 
         # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+        rels_files = [name for name in self.part_names if name.name.endswith(".rels")]
 
         if not rels_files:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        # Get all files in the unpacked directory (excluding reference files)
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
-            ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
+        # Get all parts in the package (excluding reference files)
+        all_files = [
+            name
+            for name in self.part_names
+            if name.name != "[Content_Types].xml" and not name.name.endswith(".rels")
+        ]  # These parts are not referenced by .rels
 
         # Track all files that are referenced by any .rels file
         all_referenced_files = set()
@@ -310,13 +292,9 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Get the directory where this .rels file is located
-                rels_dir = rels_file.parent
+                rels_root = self.parse_part(rels_file).getroot()
 
                 # Find all relationships and their targets
-                referenced_files = set()
                 broken_refs = []
 
                 for rel in rels_root.findall(
@@ -327,46 +305,28 @@ class BaseSchemaValidator:
                     if target and not target.startswith(
                         ("http", "mailto:")
                     ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
+                        target_part = self._resolve_target(rels_file, target)
+                        if target_part is not None and self.package.exists(
+                            target_part
+                        ):
+                            all_referenced_files.add(target_part)
                         else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
                             broken_refs.append((target, rel.sourceline))
 
                 # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
+                for broken_ref, line_num in broken_refs:
+                    errors.append(
+                        f"  {rels_file}: Line {line_num}: Broken reference to {broken_ref}"
+                    )
 
             except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+                errors.append(f"  Error parsing {rels_file}: {e}")
 
         # Check for unreferenced files (files that exist but are not referenced anywhere)
         unreferenced_files = set(all_files) - all_referenced_files
 
-        if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+        for unref_file in sorted(unreferenced_files):
+            errors.append(f"  Unreferenced file: {unref_file}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
@@ -385,103 +345,54 @@ class BaseSchemaValidator:
                 )
             return True
 
+    @staticmethod
+    def _resolve_target(rels_file, target):
+        """Resolve a relationship target to a part name, or None if it leaves the package.
+
+        Targets in the root _rels/.rels are relative to the package root; targets
+        in dir/_rels/file.xml.rels are relative to dir/. Absolute targets start
+        at the package root.
+        """
+        if target.startswith("/"):
+            base_dir = ""
+        else:
+            base_dir = rels_file.parent.parent.as_posix()
+            if base_dir == ".":
+                base_dir = ""
+        resolved = posixpath.normpath(posixpath.join(base_dir, target.lstrip("/")))
+        if resolved.startswith("..") or resolved == ".":
+            return None
+        return PurePosixPath(resolved)
+
     def validate_all_relationship_ids(self):
         """
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
-        errors = []
-
-        # Process each XML file that might contain r:id references
-        for xml_file in self.xml_files:
-            # Skip .rels files themselves
-            if xml_file.suffix == ".rels":
-                continue
-
-            # Determine the corresponding .rels file
-            # For dir/file.xml, it's dir/_rels/file.xml.rels
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
-
-            # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
-                continue
-
-            try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
-
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        # Check for duplicate rIds
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
-                            )
-                        # Extract just the type name from the full URL
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
-
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        )
+        return self.run_rules([self._relationship_id_rule()])
+
+    def _relationship_id_rule(self):
+        """Build the r:id reference rule for this validator's relationship types."""
+        return RelationshipIdRule(
+            self._load_part_rels,
+            self._get_expected_relationship_type
+            if self.ELEMENT_RELATIONSHIP_TYPES
+            else None,
+        )
 
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
-                            )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
+    def _load_part_rels(self, part_name):
+        """Parse the .rels file belonging to a part.
 
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
+        For dir/file.xml this is dir/_rels/file.xml.rels.
 
-        if errors:
-            print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
-            for error in errors:
-                print(error)
-            print("\nThese ID mismatches will cause the document to appear corrupt!")
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All relationship ID references are valid")
-            return True
+        Returns:
+            tuple: (rels_part_name, rels_root), or None if the part has no .rels file
+        """
+        part_name = PurePosixPath(part_name)
+        rels_file = part_name.parent / "_rels" / f"{part_name.name}.rels"
+        if not self.package.exists(rels_file):
+            return None
+        return str(rels_file), self.parse_part(rels_file).getroot()
 
     def _get_expected_relationship_type(self, element_name):
         """
@@ -524,14 +435,14 @@ class BaseSchemaValidator:
         errors = []
 
         # Find [Content_Types].xml file
-        content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        content_types_file = "[Content_Types].xml"
+        if not self.package.exists(content_types_file):
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self.parse_part(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -575,15 +486,9 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
-
             # Check all XML files for Override declarations
             for xml_file in self.xml_files:
-                path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
-                    "\\", "/"
-                )
+                path_str = str(xml_file)
 
                 # Skip non-content files
                 if any(
@@ -593,7 +498,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self.parse_part(xml_file).getroot().tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -605,7 +510,7 @@ class BaseSchemaValidator:
                     continue  # Skip unparseable files
 
             # Check all non-XML files for Default extension declarations
-            for file_path in all_files:
+            for file_path in self.part_names:
                 # Skip XML files and metadata files (already checked above)
                 if file_path.suffix.lower() in {".xml", ".rels"}:
                     continue
@@ -618,9 +523,8 @@ class BaseSchemaValidator:
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
                     if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
                         errors.append(
-                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
+                            f'  {file_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
                         )
 
         except Exception as e:
@@ -642,19 +546,17 @@ class BaseSchemaValidator:
         """Validate a single XML file against XSD schema, comparing with original.
 
         Args:
-            xml_file: Path to XML file to validate
+            xml_file: Package-relative name of the XML part to validate
             verbose: Enable verbose output
 
         Returns:
             tuple: (is_valid, new_errors_set) where is_valid is True/False/None (skipped)
         """
-        # Resolve both paths to handle symlinks
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
+        xml_file = PurePosixPath(xml_file)
 
         # Validate current file
         is_valid, current_errors = self._validate_single_file_xsd(
-            xml_file, unpacked_dir
+            xml_file, self.package
         )
 
         if is_valid is None:
@@ -671,8 +573,7 @@ class BaseSchemaValidator:
 
         if new_errors:
             if verbose:
-                relative_path = xml_file.relative_to(unpacked_dir)
-                print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
+                print(f"FAILED - {xml_file}: {len(new_errors)} new error(s)")
                 for error in list(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
@@ -693,7 +594,7 @@ class BaseSchemaValidator:
         skipped_count = 0
 
         for xml_file in self.xml_files:
-            relative_path = str(xml_file.relative_to(self.unpacked_dir))
+            relative_path = str(xml_file)
             is_valid, new_file_errors = self.validate_file_against_xsd(
                 xml_file, verbose=False
             )
@@ -823,34 +724,35 @@ class BaseSchemaValidator:
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+    def _load_schema(self, schema_path):
+        """Load and compile an XSD schema, reusing it for later files."""
+        if schema_path not in self._schema_cache:
+            with open(schema_path, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(
+                    xsd_file, parser=parser, base_url=str(schema_path)
+                )
+                self._schema_cache[schema_path] = lxml.etree.XMLSchema(xsd_doc)
+        return self._schema_cache[schema_path]
+
+    def _validate_single_file_xsd(self, xml_file, package):
+        """Validate a single XML part against XSD schema. Returns (is_valid, errors_set)."""
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
         try:
             # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            schema = self._load_schema(schema_path)
 
             # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            xml_doc = self.parse_part(xml_file, package)
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
             # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
-            if (
-                relative_path.parts
-                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
-            ):
+            if xml_file.parts and xml_file.parts[0] in self.MAIN_CONTENT_FOLDERS:
                 xml_doc = self._clean_ignorable_namespaces(xml_doc)
 
             # Validate
@@ -870,38 +772,21 @@ class BaseSchemaValidator:
         """Get XSD validation errors from a single file in the original document.
 
         Args:
-            xml_file: Path to the XML file in unpacked_dir to check
+            xml_file: Package-relative name of the XML part to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
-        # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
-
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
-
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        # Read the corresponding member straight from the original zip
+        if not self.original_package.exists(xml_file):
+            # File didn't exist in original, so no original errors
+            return set()
+
+        # Validate the specific file in original
+        is_valid, errors = self._validate_single_file_xsd(
+            xml_file, self.original_package
+        )
+        return errors if errors else set()
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
@@ -2,13 +2,10 @@
 Validator for Word document XML files against XSD schemas.
 """
 
-import re
-import tempfile
-import zipfile
-
 import lxml.etree
 
 from .base import BaseSchemaValidator
+from .rules import WhitespacePreservationRule
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
@@ -32,94 +29,48 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         if not self.validate_namespaces():
             all_valid = False
 
-        # Test 2: Unique IDs
-        if not self.validate_unique_ids():
+        # Tests 2-4: Unique IDs, whitespace preservation and relationship ID
+        # references, checked together in one streaming pass per file
+        if not self.validate_structure():
             all_valid = False
 
-        # Test 3: Relationship and file reference validation
+        # Test 5: Relationship and file reference validation
         if not self.validate_file_references():
             all_valid = False
 
-        # Test 4: Content type declarations
+        # Test 6: Content type declarations
         if not self.validate_content_types():
             all_valid = False
 
-        # Test 5: XSD schema validation
+        # Test 7: XSD schema validation
         if not self.validate_against_xsd():
             all_valid = False
 
-        # Test 6: Whitespace preservation
-        if not self.validate_whitespace_preservation():
-            all_valid = False
-
-        # Test 7: Deletion validation
+        # Test 8: Deletion validation
         if not self.validate_deletions():
             all_valid = False
 
-        # Test 8: Insertion validation
+        # Test 9: Insertion validation
         if not self.validate_insertions():
             all_valid = False
 
-        # Test 9: Relationship ID reference validation
-        if not self.validate_all_relationship_ids():
-            all_valid = False
-
         # Count and compare paragraphs
         self.compare_paragraph_counts()
 
         return all_valid
 
+    def structural_rules(self):
+        """Return the element-level rules checked in the shared streaming pass."""
+        return super().structural_rules() + [self._whitespace_rule()]
+
     def validate_whitespace_preservation(self):
         """
         Validate that w:t elements with whitespace have xml:space='preserve'.
         """
-        errors = []
+        return self.run_rules([self._whitespace_rule()])
 
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All whitespace is properly preserved")
-            return True
+    def _whitespace_rule(self):
+        return WhitespacePreservationRule(f"{{{self.WORD_2006_NAMESPACE}}}t")
 
     def validate_deletions(self):
         """
@@ -134,7 +85,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.parse_part(xml_file).getroot()
 
                 # Find all w:t elements that are descendants of w:del elements
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
@@ -151,13 +102,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                             else repr(t_elem.text)
                         )
                         errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                            f"  {xml_file}: "
                             f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
                         )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    f"  {xml_file}: Error: {e}"
                 )
 
         if errors:
@@ -180,7 +131,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.parse_part(xml_file).getroot()
                 # Count all w:p elements
                 paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
                 count = len(paragraphs)
@@ -194,19 +145,14 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
+            # Parse document.xml straight from the original zip
+            root = self.parse_part(
+                "word/document.xml", self.original_package
+            ).getroot()
 
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Count all w:p elements
+            paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+            count = len(paragraphs)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -225,7 +171,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.parse_part(xml_file).getroot()
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
 
                 # Find w:delText in w:ins that are NOT within w:del
@@ -241,13 +187,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                         else repr(elem.text or "")
                     )
                     errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"  {xml_file}: "
                         f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
                     )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    f"  {xml_file}: Error: {e}"
                 )
 
         if errors:
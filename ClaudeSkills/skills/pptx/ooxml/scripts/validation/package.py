@@ -0,0 +1,86 @@
+"""
+Read-only access to the parts of an Office document, unpacked or packed.
+
+Validators address parts by their package-relative names (e.g.
+ppt/slides/slide1.xml) so the same checks run against an unpacked directory
+or directly against the members of a .docx/.pptx/.xlsx zip, without extracting
+anything to disk.
+"""
+
+import zipfile
+from pathlib import Path, PurePosixPath
+
+
+class DirectoryPackage:
+    """Parts stored as files in an unpacked document directory."""
+
+    def __init__(self, root):
+        self.root = Path(root).resolve()
+        self._names = sorted(
+            PurePosixPath(path.relative_to(self.root).as_posix())
+            for path in self.root.rglob("*")
+            if path.is_file()
+        )
+        self._name_set = set(self._names)
+
+    def part_names(self):
+        """Return the names of all parts, sorted."""
+        return list(self._names)
+
+    def exists(self, name):
+        return PurePosixPath(name) in self._name_set
+
+    def open(self, name):
+        """Open a part for binary reading."""
+        return open(self.root / str(name), "rb")
+
+    def read(self, name):
+        return (self.root / str(name)).read_bytes()
+
+    def close(self):
+        pass
+
+
+class ZipPackage:
+    """Parts read lazily from the members of a packed Office file."""
+
+    def __init__(self, path):
+        self.root = Path(path)
+        self._zip = zipfile.ZipFile(self.root)
+        self._names = sorted(
+            PurePosixPath(info.filename)
+            for info in self._zip.infolist()
+            if not info.is_dir()
+        )
+        self._name_set = set(self._names)
+
+    def part_names(self):
+        """Return the names of all parts, sorted."""
+        return list(self._names)
+
+    def exists(self, name):
+        return PurePosixPath(name) in self._name_set
+
+    def open(self, name):
+        """Open a member for binary reading, decompressing on the fly."""
+        return self._zip.open(str(name))
+
+    def read(self, name):
+        return self._zip.read(str(name))
+
+    def close(self):
+        self._zip.close()
+
+
+def open_package(path):
+    """Open an unpacked directory or a packed Office file as a package."""
+    path = Path(path)
+    if path.is_dir():
+        return DirectoryPackage(path)
+    if zipfile.is_zipfile(path):
+        return ZipPackage(path)
+    raise ValueError(f"{path} is neither a directory nor an Office file")
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -2,9 +2,8 @@
 Validator for PowerPoint presentation XML files against XSD schemas.
 """
 
-import re
-
 from .base import BaseSchemaValidator
+from .rules import UuidIdRule
 
 
 class PPTXSchemaValidator(BaseSchemaValidator):
@@ -36,94 +35,44 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         if not self.validate_namespaces():
             all_valid = False
 
-        # Test 2: Unique IDs
-        if not self.validate_unique_ids():
-            all_valid = False
-
-        # Test 3: UUID ID validation
-        if not self.validate_uuid_ids():
+        # Tests 2-4: Unique IDs, UUID IDs and relationship ID references,
+        # checked together in one streaming pass per file
+        if not self.validate_structure():
             all_valid = False
 
-        # Test 4: Relationship and file reference validation
+        # Test 5: Relationship and file reference validation
         if not self.validate_file_references():
             all_valid = False
 
-        # Test 5: Slide layout ID validation
+        # Test 6: Slide layout ID validation
         if not self.validate_slide_layout_ids():
             all_valid = False
 
-        # Test 6: Content type declarations
+        # Test 7: Content type declarations
         if not self.validate_content_types():
             all_valid = False
 
-        # Test 7: XSD schema validation
+        # Test 8: XSD schema validation
         if not self.validate_against_xsd():
             all_valid = False
 
-        # Test 8: Notes slide reference validation
+        # Test 9: Notes slide reference validation
         if not self.validate_notes_slide_references():
             all_valid = False
 
-        # Test 9: Relationship ID reference validation
-        if not self.validate_all_relationship_ids():
-            all_valid = False
-
         # Test 10: Duplicate slide layout references validation
         if not self.validate_no_duplicate_slide_layouts():
             all_valid = False
 
         return all_valid
 
+    def structural_rules(self):
+        """Return the element-level rules checked in the shared streaming pass."""
+        return super().structural_rules() + [UuidIdRule()]
+
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
-        import lxml.etree
-
-        errors = []
-        # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
-        uuid_pattern = re.compile(
-            r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
-        )
-
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Check all elements for ID attributes
-                for elem in root.iter():
-                    for attr, value in elem.attrib.items():
-                        # Check if this is an ID attribute
-                        attr_name = attr.split("}")[-1].lower()
-                        if attr_name == "id" or attr_name.endswith("id"):
-                            # Check if value looks like a UUID (has the right length and pattern structure)
-                            if self._looks_like_uuid(value):
-                                # Validate that it contains only hex characters in the right positions
-                                if not uuid_pattern.match(value):
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
-                                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} UUID ID validation errors:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - All UUID-like IDs contain valid hex values")
-            return True
-
-    def _looks_like_uuid(self, value):
-        """Check if a value has the general structure of a UUID."""
-        # Remove common UUID delimiters
-        clean_value = value.strip("{}()").replace("-", "")
-        # Check if it's 32 hex-like characters (could include invalid hex chars)
-        return len(clean_value) == 32 and all(c.isalnum() for c in clean_value)
+        return self.run_rules([UuidIdRule()])
 
     def validate_slide_layout_ids(self):
         """Validate that sldLayoutId elements in slide masters reference valid slide layouts."""
@@ -132,7 +81,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         errors = []
 
         # Find all slide master files
-        slide_masters = list(self.unpacked_dir.glob("ppt/slideMasters/*.xml"))
+        slide_masters = self.parts_in("ppt/slideMasters", "*.xml")
 
         if not slide_masters:
             if self.verbose:
@@ -142,20 +91,20 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for slide_master in slide_masters:
             try:
                 # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                root = self.parse_part(slide_master).getroot()
 
                 # Find the corresponding _rels file for this slide master
                 rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
 
-                if not rels_file.exists():
+                if not self.package.exists(rels_file):
                     errors.append(
-                        f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
+                        f"  {slide_master}: "
+                        f"Missing relationships file: {rels_file}"
                     )
                     continue
 
                 # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self.parse_part(rels_file).getroot()
 
                 # Build a set of valid relationship IDs that point to slide layouts
                 valid_layout_rids = set()
@@ -177,14 +126,14 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
                     if r_id and r_id not in valid_layout_rids:
                         errors.append(
-                            f"  {slide_master.relative_to(self.unpacked_dir)}: "
+                            f"  {slide_master}: "
                             f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
                             f"references r:id='{r_id}' which is not found in slide layout relationships"
                         )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
-                    f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}"
+                    f"  {slide_master}: Error: {e}"
                 )
 
         if errors:
@@ -205,11 +154,11 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         import lxml.etree
 
         errors = []
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels_files = self.parts_in("ppt/slides/_rels", "*.xml.rels")
 
         for rels_file in slide_rels_files:
             try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self.parse_part(rels_file).getroot()
 
                 # Find all slideLayout relationships
                 layout_rels = [
@@ -222,12 +171,12 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
                 if len(layout_rels) > 1:
                     errors.append(
-                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
+                        f"  {rels_file}: has {len(layout_rels)} slideLayout references"
                     )
 
             except Exception as e:
                 errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    f"  {rels_file}: Error: {e}"
                 )
 
         if errors:
@@ -248,7 +197,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         notes_slide_references = {}  # Track which slides reference each notesSlide
 
         # Find all slide relationship files
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels_files = self.parts_in("ppt/slides/_rels", "*.xml.rels")
 
         if not slide_rels_files:
             if self.verbose:
@@ -258,7 +207,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for rels_file in slide_rels_files:
             try:
                 # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self.parse_part(rels_file).getroot()
 
                 # Find all notesSlide relationships
                 for rel in root.findall(
@@ -284,7 +233,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    f"  {rels_file}: Error: {e}"
                 )
 
         # Check for duplicate references
@@ -295,7 +244,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                     f"  Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}"
                 )
                 for slide_name, rels_file in references:
-                    errors.append(f"    - {rels_file.relative_to(self.unpacked_dir)}")
+                    errors.append(f"    - {rels_file}")
 
         if errors:
             print(
@@ -4,9 +4,11 @@ Validator for tracked changes in Word documents.
 
 import subprocess
 import tempfile
-import zipfile
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
+from .package import ZipPackage, open_package
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
@@ -21,18 +23,35 @@ class RedliningValidator:
 
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
-        # Verify unpacked directory exists and has correct structure
-        modified_file = self.unpacked_dir / "word" / "document.xml"
-        if not modified_file.exists():
-            print(f"FAILED - Modified document.xml not found at {modified_file}")
+        # Works on an unpacked directory or directly on a packed .docx
+        package = open_package(self.unpacked_dir)
+        try:
+            return self._validate_package(package)
+        finally:
+            package.close()
+
+    def close(self):
+        """Nothing to close: packages are only open during validate()."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _validate_package(self, package):
+        # Verify the document has the expected structure
+        document_part = "word/document.xml"
+        if not package.exists(document_part):
+            print(
+                f"FAILED - Modified document.xml not found at {self.unpacked_dir / document_part}"
+            )
             return False
 
         # First, check if there are any tracked changes by Claude to validate
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
+            with package.open(document_part) as f:
+                root = ET.parse(f).getroot()
 
             # Check for w:del or w:ins tags authored by Claude
             del_elements = root.findall(".//w:del", self.namespaces)
@@ -60,20 +79,15 @@ class RedliningValidator:
             # If we can't parse the XML, continue with full validation
             pass
 
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
+        # Read the original document.xml straight from the original docx
+        try:
+            original_package = ZipPackage(self.original_docx)
+        except Exception as e:
+            print(f"FAILED - Error unpacking original docx: {e}")
+            return False
 
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
+        try:
+            if not original_package.exists(document_part):
                 print(
                     f"FAILED - Original document.xml not found in {self.original_docx}"
                 )
@@ -81,35 +95,33 @@ class RedliningValidator:
 
             # Parse both XML files using xml.etree.ElementTree for redlining validation
             try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
+                with package.open(document_part) as f:
+                    modified_root = ET.parse(f).getroot()
+                with original_package.open(document_part) as f:
+                    original_root = ET.parse(f).getroot()
             except ET.ParseError as e:
                 print(f"FAILED - Error parsing XML files: {e}")
                 return False
+        finally:
+            original_package.close()
 
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
+        # Remove Claude's tracked changes from both documents
+        self._remove_claude_tracked_changes(original_root)
+        self._remove_claude_tracked_changes(modified_root)
 
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
+        # Extract and compare text content
+        modified_text = self._extract_text_content(modified_root)
+        original_text = self._extract_text_content(original_root)
 
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(original_text, modified_text)
+            print(error_message)
+            return False
 
-            if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
-            return True
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
 
     def _generate_detailed_diff(self, original_text, modified_text):
         """Generate detailed word-level differences using git word diff."""
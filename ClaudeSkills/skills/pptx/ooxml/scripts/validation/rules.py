@@ -0,0 +1,361 @@
+"""
+Streaming rule engine for element-level structural checks.
+
+Rules register the elements they care about and are dispatched from a single
+``iterparse`` pass per part, so every part is traversed once no matter how many
+checks run, and memory stays bounded because finished elements are discarded.
+"""
+
+import os
+import re
+
+import lxml.etree
+
+MC_NAMESPACE = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+OFFICE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+)
+
+ALTERNATE_CONTENT_TAG = f"{{{MC_NAMESPACE}}}AlternateContent"
+
+
+def local_name(name):
+    """Return the local part of a Clark-notation tag or attribute name."""
+    return name.split("}")[-1] if "}" in name else name
+
+
+class PartScan:
+    """State of the part currently being scanned, shared with every rule."""
+
+    def __init__(self, name):
+        self.name = name  # Part name relative to the package root
+        self.alternate_content_depth = 0  # Nesting level of mc:AlternateContent
+
+    @property
+    def in_alternate_content(self):
+        return self.alternate_content_depth > 0
+
+
+class Rule:
+    """Base class for checks dispatched by RuleEngine.
+
+    Subclasses set ``tags`` to the Clark-notation tags they handle (None means
+    every element) and ``event`` to "start" when only attributes are needed or
+    "end" when element text is needed. Errors are collected in ``self.errors``
+    and printed by ``report``.
+    """
+
+    tags = None
+    event = "start"
+    failure_message = "FAILED - Found {count} violations:"
+    success_message = "PASSED"
+    failure_hint = None
+
+    def __init__(self):
+        self.errors = []
+
+    def start_part(self, part):
+        """Prepare for a part; return False to skip its elements."""
+        return True
+
+    def handle(self, elem, part):
+        """Check a single element."""
+        raise NotImplementedError("Subclasses must implement the handle method")
+
+    def end_part(self, part):
+        """Finish a part after all of its elements were handled."""
+
+    def part_error(self, part, error):
+        """Record a part that could not be parsed."""
+        self.errors.append(f"  {part.name}: Error: {error}")
+
+    def error_count(self):
+        return len(self.errors)
+
+    def report(self, verbose=False):
+        """Print the result of this rule and return True if it passed."""
+        if self.errors:
+            print(self.failure_message.format(count=self.error_count()))
+            for error in self.errors:
+                print(error)
+            if self.failure_hint:
+                print(self.failure_hint)
+            return False
+        if verbose:
+            print(self.success_message)
+        return True
+
+
+class RuleEngine:
+    """Dispatch element handlers from one iterparse pass per part."""
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+
+    def scan(self, source, part_name):
+        """Run all rules over one part.
+
+        Args:
+            source: Filename or binary file object containing the part's XML
+            part_name: Name used in error messages (e.g. ppt/slides/slide1.xml)
+        """
+        if isinstance(source, os.PathLike):
+            source = os.fspath(source)
+        part = PartScan(str(part_name))
+        active = [rule for rule in self.rules if rule.start_part(part)]
+        if not active:
+            return
+
+        start_handlers, end_handlers = self._dispatch_tables(active)
+        try:
+            for event, elem in lxml.etree.iterparse(
+                source, events=("start", "end")
+            ):
+                tag = elem.tag
+                if event == "start":
+                    if tag == ALTERNATE_CONTENT_TAG:
+                        part.alternate_content_depth += 1
+                    for rule in start_handlers.get(tag, start_handlers[None]):
+                        rule.handle(elem, part)
+                    continue
+
+                for rule in end_handlers.get(tag, end_handlers[None]):
+                    rule.handle(elem, part)
+                if tag == ALTERNATE_CONTENT_TAG:
+                    part.alternate_content_depth -= 1
+
+                # Discard finished elements so memory stays bounded
+                parent = elem.getparent()
+                if parent is not None:
+                    elem.clear(keep_tail=True)
+                    while elem.getprevious() is not None:
+                        del parent[0]
+        except Exception as e:
+            for rule in active:
+                rule.part_error(part, e)
+            return
+
+        for rule in active:
+            rule.end_part(part)
+
+    @staticmethod
+    def _dispatch_tables(rules):
+        """Build tag -> rules lookups; the None key holds rules for any tag."""
+        tables = {"start": {None: []}, "end": {None: []}}
+        tagged = {"start": set(), "end": set()}
+        for rule in rules:
+            if rule.tags is None:
+                tables[rule.event][None].append(rule)
+            else:
+                tagged[rule.event].update(rule.tags)
+
+        for event, table in tables.items():
+            for tag in tagged[event]:
+                table[tag] = [
+                    rule
+                    for rule in rules
+                    if rule.event == event and (rule.tags is None or tag in rule.tags)
+                ]
+        return tables["start"], tables["end"]
+
+
+class UniqueIdRule(Rule):
+    """IDs that must be unique within their part or across the package."""
+
+    failure_message = "FAILED - Found {count} ID uniqueness violations:"
+    success_message = "PASSED - All required IDs are unique"
+
+    def __init__(self, requirements):
+        super().__init__()
+        self.requirements = requirements  # element_name -> (attribute_name, scope)
+        self.global_ids = {}
+        self.file_ids = {}
+
+    def start_part(self, part):
+        self.file_ids = {}
+        return True
+
+    def handle(self, elem, part):
+        # Content inside mc:AlternateContent is alternative markup, not extra shapes
+        if part.in_alternate_content:
+            return
+
+        tag = local_name(elem.tag).lower()
+        if tag not in self.requirements:
+            return
+        attr_name, scope = self.requirements[tag]
+
+        id_value = None
+        for attr, value in elem.attrib.items():
+            if local_name(attr).lower() == attr_name:
+                id_value = value
+                break
+        if id_value is None:
+            return
+
+        if scope == "global":
+            if id_value in self.global_ids:
+                prev_file, prev_line, prev_tag = self.global_ids[id_value]
+                self.errors.append(
+                    f"  {part.name}: "
+                    f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
+                    f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                )
+            else:
+                self.global_ids[id_value] = (part.name, elem.sourceline, tag)
+        elif scope == "file":
+            seen = self.file_ids.setdefault((tag, attr_name), {})
+            if id_value in seen:
+                self.errors.append(
+                    f"  {part.name}: "
+                    f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                    f"(first occurrence at line {seen[id_value]})"
+                )
+            else:
+                seen[id_value] = elem.sourceline
+
+
+class RelationshipIdRule(Rule):
+    """r:id attributes must reference relationships in the part's .rels file."""
+
+    failure_message = "FAILED - Found {count} relationship ID reference errors:"
+    success_message = "PASSED - All relationship ID references are valid"
+    failure_hint = "\nThese ID mismatches will cause the document to appear corrupt!"
+
+    RID_ATTRIBUTE = f"{{{OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
+
+    def __init__(self, load_rels, expected_type=None):
+        """
+        Args:
+            load_rels: Callable taking a part name and returning a
+                (rels_part_name, rels_root) tuple, or None if the part has no .rels
+            expected_type: Optional callable mapping an element name to the
+                relationship type it must point to (or None)
+        """
+        super().__init__()
+        self.load_rels = load_rels
+        self.expected_type = expected_type
+        self.rid_to_type = {}
+
+    def start_part(self, part):
+        if part.name.endswith(".rels"):
+            return False
+        try:
+            rels = self.load_rels(part.name)
+        except Exception as e:
+            self.part_error(part, e)
+            return False
+        if rels is None:
+            return False
+
+        rels_name, rels_root = rels
+        self.rid_to_type = {}
+        for rel in rels_root.iter(f"{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"):
+            rid = rel.get("Id")
+            if not rid:
+                continue
+            if rid in self.rid_to_type:
+                self.errors.append(
+                    f"  {rels_name}: Line {rel.sourceline}: "
+                    f"Duplicate relationship ID '{rid}' (IDs must be unique)"
+                )
+            rel_type = rel.get("Type", "")
+            self.rid_to_type[rid] = rel_type.split("/")[-1] if "/" in rel_type else rel_type
+        return True
+
+    def handle(self, elem, part):
+        rid = elem.get(self.RID_ATTRIBUTE)
+        if not rid:
+            return
+
+        elem_name = local_name(elem.tag)
+        if rid not in self.rid_to_type:
+            valid_ids = sorted(self.rid_to_type.keys())
+            self.errors.append(
+                f"  {part.name}: Line {elem.sourceline}: "
+                f"<{elem_name}> references non-existent relationship '{rid}' "
+                f"(valid IDs: {', '.join(valid_ids[:5])}{'...' if len(valid_ids) > 5 else ''})"
+            )
+        elif self.expected_type:
+            expected = self.expected_type(elem_name)
+            actual = self.rid_to_type[rid]
+            if expected and expected not in actual.lower():
+                self.errors.append(
+                    f"  {part.name}: Line {elem.sourceline}: "
+                    f"<{elem_name}> references '{rid}' which points to '{actual}' "
+                    f"but should point to a '{expected}' relationship"
+                )
+
+    def part_error(self, part, error):
+        self.errors.append(f"  Error processing {part.name}: {error}")
+
+
+class UuidIdRule(Rule):
+    """ID attributes that look like UUIDs must contain only hex digits."""
+
+    failure_message = "FAILED - Found {count} UUID ID validation errors:"
+    success_message = "PASSED - All UUID-like IDs contain valid hex values"
+
+    # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
+    UUID_PATTERN = re.compile(
+        r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
+    )
+
+    def handle(self, elem, part):
+        for attr, value in elem.attrib.items():
+            if not local_name(attr).lower().endswith("id"):
+                continue
+            if self.looks_like_uuid(value) and not self.UUID_PATTERN.match(value):
+                self.errors.append(
+                    f"  {part.name}: "
+                    f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
+                )
+
+    @staticmethod
+    def looks_like_uuid(value):
+        """Check if a value has the general structure of a UUID."""
+        # Remove common UUID delimiters
+        clean_value = value.strip("{}()").replace("-", "")
+        # Check if it's 32 hex-like characters (could include invalid hex chars)
+        return len(clean_value) == 32 and all(c.isalnum() for c in clean_value)
+
+
+class WhitespacePreservationRule(Rule):
+    """Text elements with leading/trailing whitespace need xml:space='preserve'."""
+
+    event = "end"
+    failure_message = "FAILED - Found {count} whitespace preservation violations:"
+    success_message = "PASSED - All whitespace is properly preserved"
+
+    XML_SPACE_ATTRIBUTE = f"{{{XML_NAMESPACE}}}space"
+
+    def __init__(self, text_tag, part_filename="document.xml", label="w:t"):
+        super().__init__()
+        self.tags = {text_tag}
+        self.part_filename = part_filename
+        self.label = label
+
+    def start_part(self, part):
+        return part.name.rsplit("/", 1)[-1] == self.part_filename
+
+    def handle(self, elem, part):
+        text = elem.text
+        if not text or not (text[0].isspace() or text[-1].isspace()):
+            return
+        if elem.get(self.XML_SPACE_ATTRIBUTE) == "preserve":
+            return
+
+        # Show a preview of the text
+        text_preview = repr(text)[:50] + "..." if len(repr(text)) > 50 else repr(text)
+        self.errors.append(
+            f"  {part.name}: "
+            f"Line {elem.sourceline}: {self.label} element with whitespace missing xml:space='preserve': {text_preview}"
+        )
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Assemble a presentation from slides of several template decks.
+
+Usage:
+    python assemble.py output.pptx covers.pptx:0 charts.pptx:3 charts.pptx:5 closing.pptx:1
+
+Each source is a template path and a 0-based slide index, in output order. The
+base deck (the first source unless --base is given) supplies the slide size,
+theme and document properties; its own slides are kept only where listed.
+
+Slides are copied with everything they relate to: layouts, masters, images,
+media, charts with their embedded workbooks, and notes. Masters, layouts and
+media whose content matches a part already in the output are shared rather
+than stored again. Every source deck is opened once and the output is written
+once.
+"""
+
+import argparse
+import hashlib
+import posixpath
+import sys
+from copy import deepcopy
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+from pptx import Presentation
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part, PartFactory, XmlPart
+from pptx.opc.packuri import PackURI
+from pptx.oxml.ns import qn
+
+# Parts shared by content instead of being copied with every slide
+SHARED_CONTENT_TYPES = {CT.PML_SLIDE_MASTER, CT.PML_SLIDE_LAYOUT}
+SHARED_MEDIA_PREFIXES = ("image/", "audio/", "video/")
+
+# Slide master and layout ids share one range, starting at 2^31
+MIN_LAYOUT_ID = 2147483648
+MIN_SLIDE_ID = 256
+
+# Attributes in this namespace (r:id, r:embed, r:link, ...) refer to relationships
+R_ATTRIBUTE_PREFIX = (
+    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Assemble a presentation from slides of several template decks.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python assemble.py output.pptx covers.pptx:0 charts.pptx:3 closing.pptx:1
+    Creates output.pptx from the first slide of covers.pptx, the fourth slide
+    of charts.pptx and the second slide of closing.pptx
+
+  python assemble.py output.pptx --base brand.pptx covers.pptx:2 charts.pptx:0
+    Uses brand.pptx for slide size, theme and document properties
+
+Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
+        """,
+    )
+
+    parser.add_argument("output", help="Path for output PPTX file")
+    parser.add_argument(
+        "slides",
+        nargs="+",
+        help="Source slides as path:index (0-based), in output order",
+    )
+    parser.add_argument(
+        "--base",
+        help="Deck providing slide size, theme and properties (default: first source)",
+    )
+
+    args = parser.parse_args()
+
+    # Parse the source slides
+    slides = []
+    for spec in args.slides:
+        path, _, index = spec.rpartition(":")
+        try:
+            slides.append((Path(path), int(index)))
+        except ValueError:
+            print(
+                f"Error: Invalid source slide '{spec}'. Use path:index (e.g., deck.pptx:3)"
+            )
+            sys.exit(1)
+
+    # Check sources exist
+    for path in {path for path, _ in slides} | (
+        {Path(args.base)} if args.base else set()
+    ):
+        if not path.exists():
+            print(f"Error: Template file not found: {path}")
+            sys.exit(1)
+
+    # Create output directory if needed
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        assemble_presentation(slides, output_path, base_path=args.base)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error processing presentation: {e}")
+        sys.exit(1)
+
+
+def part_element(part: XmlPart):
+    """Return the root element of an XML part.
+
+    python-pptx has no public accessor for the XML of parts in general, so this
+    is the one place the cloner reaches into python-pptx internals.
+    """
+    return part._element
+
+
+def is_shared_part(part: Part) -> bool:
+    """Check whether a part is shared by content rather than copied per slide."""
+    return part.content_type in SHARED_CONTENT_TYPES or part.content_type.startswith(
+        SHARED_MEDIA_PREFIXES
+    )
+
+
+def rename_rIds(element, new_rIds: Dict[str, str]):
+    """Point relationship references in an XML tree at renumbered relationships."""
+    for node in element.iter(etree.Element):
+        for name, value in node.attrib.items():
+            if name.startswith(R_ATTRIBUTE_PREFIX) and value in new_rIds:
+                node.set(name, new_rIds[value])
+
+
+class PartCloner:
+    """Copy parts, and the parts they relate to, into a destination presentation.
+
+    Slides, notes, charts, embedded workbooks and other per-slide parts are
+    always copied. Masters, layouts, images and media are shared: a part that
+    already belongs to the destination package is reused as is, and a part from
+    another package is matched by content hash against the destination's parts
+    and only copied when nothing matches. Copied masters and layouts are
+    registered in presentation.xml and their master's layout list.
+    """
+
+    def __init__(self, prs):
+        self.prs = prs
+        self.package = prs.part.package
+        self._partnames = {str(part.partname) for part in self.package.iter_parts()}
+        self._counters: Dict[str, int] = {}
+        self._keys: Dict[Part, Tuple[str, str]] = {}
+        self._shared: Optional[Dict[Tuple[str, str], Part]] = None
+        self._next_layout_id: Optional[int] = None
+        self._next_slide_id: Optional[int] = None
+        self._slide_copies: Dict[Part, Part] = {}
+        # Links from copied slides to other slides, resolved by finish(); the
+        # copies refer to them by placeholder until then
+        self._slide_links: List[Tuple[Part, str, Part]] = []
+
+    def clone_slide(self, slide_part: Part) -> Part:
+        """Copy a slide part and return the copy; the caller adds it to the slide list."""
+        clone = self._clone(slide_part, {})
+        self._slide_copies.setdefault(slide_part, clone)
+        return clone
+
+    def add_slide(self, slide_part: Part) -> Part:
+        """Copy a slide part and append the copy to the end of the slide list."""
+        clone = self.clone_slide(slide_part)
+        sld_id_lst = self.prs.element.get_or_add_sldIdLst()
+        if self._next_slide_id is None:
+            ids = [sld_id.id for sld_id in sld_id_lst]
+            self._next_slide_id = max([MIN_SLIDE_ID - 1, *ids]) + 1
+        rId = self.prs.part.relate_to(clone, RT.SLIDE)
+        etree.SubElement(
+            sld_id_lst,
+            qn("p:sldId"),
+            {"id": str(self._next_slide_id), qn("r:id"): rId},
+        )
+        self._next_slide_id += 1
+        return clone
+
+    def finish(self):
+        """Point links between slides at the copies, or at slides already in the deck.
+
+        Links to slides that are in neither are removed along with the
+        hyperlinks that use them.
+        """
+        in_deck = {
+            rel.target_part
+            for rel in self.prs.part.rels.values()
+            if rel.reltype == RT.SLIDE
+        }
+        for clone, placeholder, source in self._slide_links:
+            element = part_element(clone)
+            target = self._slide_copies.get(source)
+            if target is None and source in in_deck:
+                target = source
+            if target is not None:
+                rename_rIds(element, {placeholder: clone.relate_to(target, RT.SLIDE)})
+                continue
+            for node in element.xpath(f'.//*[@r:id="{placeholder}"]'):
+                node.getparent().remove(node)
+        self._slide_links = []
+
+    def content_key(self, part: Part) -> Tuple[str, str]:
+        """Return a hash identifying a part's content and what it relates to.
+
+        A slide master's layouts are left out, so one master matches another
+        with the same look whatever layouts each deck kept.
+        """
+        key = self._keys.get(part)
+        if key is None:
+            digest = hashlib.sha1(self._comparable_blob(part))
+            for rId, rel in sorted(part.rels.items()):
+                if rel.reltype == RT.SLIDE_LAYOUT:
+                    continue
+                target = (
+                    rel.target_ref
+                    if rel.is_external
+                    else "/".join(self.content_key(rel.target_part))
+                )
+                digest.update(f"\0{rId}\0{rel.reltype}\0{target}".encode())
+            key = (part.content_type, digest.hexdigest())
+            self._keys[part] = key
+        return key
+
+    @staticmethod
+    def _comparable_blob(part: Part) -> bytes:
+        if part.content_type != CT.PML_SLIDE_MASTER:
+            return part.blob
+        element = deepcopy(part_element(part))
+        for layout_list in element.xpath("p:sldLayoutIdLst"):
+            element.remove(layout_list)
+        return etree.tostring(element)
+
+    def _shared_parts(self) -> Dict[Tuple[str, str], Part]:
+        """Return the destination's shareable parts by content key, built on first use."""
+        if self._shared is None:
+            self._shared = {}
+            for part in self.package.iter_parts():
+                if is_shared_part(part):
+                    self._shared.setdefault(self.content_key(part), part)
+        return self._shared
+
+    def _shared_part(self, part: Part) -> Part:
+        if part.package is self.package:
+            if self._shared is not None:
+                self._shared.setdefault(self.content_key(part), part)
+            return part
+        key = self.content_key(part)
+        shared = self._shared_parts().get(key)
+        if shared is None:
+            shared = self._clone(part, {})
+            self._shared[key] = shared
+        return shared
+
+    def _target(self, part: Part, copies: Dict[Part, Part]) -> Part:
+        """Return the destination part for a relationship to a source part."""
+        if part in copies:
+            return copies[part]
+        if part.content_type == CT.PML_NOTES_MASTER:
+            # A presentation has a single notes master
+            return self.prs.part.notes_master_part
+        if is_shared_part(part):
+            return self._shared_part(part)
+        return self._clone(part, copies)
+
+    def _clone(self, part: Part, copies: Dict[Part, Part]) -> Part:
+        """Copy one part and, through its relationships, everything it needs.
+
+        The copy gets new relationships, and references to them in its XML are
+        rewritten to the new rIds.
+        """
+        clone = PartFactory(
+            self._new_partname(part.partname),
+            part.content_type,
+            self.package,
+            part.blob,
+        )
+        copies[part] = clone
+
+        is_master = part.content_type == CT.PML_SLIDE_MASTER
+        new_rIds: Dict[str, str] = {}
+        for rId, rel in part.rels.items():
+            if rel.is_external:
+                new_rIds[rId] = clone.relate_to(
+                    rel.target_ref, rel.reltype, is_external=True
+                )
+                continue
+            target = rel.target_part
+            if is_master and rel.reltype == RT.SLIDE_LAYOUT:
+                continue  # Layouts join the master as they are copied
+            if rel.reltype == RT.SLIDE and target not in copies:
+                # Not an rId, so it cannot clash with the copy's relationships
+                placeholder = f"slide-link-{len(self._slide_links)}"
+                self._slide_links.append((clone, placeholder, target))
+                new_rIds[rId] = placeholder
+                continue
+            new_rIds[rId] = clone.relate_to(self._target(target, copies), rel.reltype)
+        if isinstance(clone, XmlPart):
+            rename_rIds(part_element(clone), new_rIds)
+
+        if is_master:
+            self._register_master(clone)
+        elif part.content_type == CT.PML_SLIDE_LAYOUT:
+            self._register_layout(clone)
+        return clone
+
+    def _new_partname(self, partname: str) -> PackURI:
+        """Return an unused partname numbered like the given one, e.g. chart7.xml."""
+        base, ext = posixpath.splitext(partname)
+        stem = base.rstrip("0123456789")
+        number = self._counters.get(stem, 1)
+        while f"{stem}{number}{ext}" in self._partnames:
+            number += 1
+        self._counters[stem] = number + 1
+        new_partname = f"{stem}{number}{ext}"
+        self._partnames.add(new_partname)
+        return PackURI(new_partname)
+
+    def _layout_id(self) -> int:
+        if self._next_layout_id is None:
+            ids = self.prs.element.xpath("p:sldMasterIdLst/p:sldMasterId/@id")
+            for master in self.prs.slide_masters:
+                ids += master.element.xpath("p:sldLayoutIdLst/p:sldLayoutId/@id")
+            self._next_layout_id = max([MIN_LAYOUT_ID - 1, *map(int, ids)]) + 1
+        self._next_layout_id += 1
+        return self._next_layout_id - 1
+
+    def _register_master(self, master_part: Part):
+        # Layouts are listed again as they are copied
+        element = part_element(master_part)
+        for layout_list in element.xpath("p:sldLayoutIdLst"):
+            element.remove(layout_list)
+        rId = self.prs.part.relate_to(master_part, RT.SLIDE_MASTER)
+        etree.SubElement(
+            self.prs.element.get_or_add_sldMasterIdLst(),
+            qn("p:sldMasterId"),
+            {"id": str(self._layout_id()), qn("r:id"): rId},
+        )
+
+    def _register_layout(self, layout_part: Part):
+        master_part = layout_part.part_related_by(RT.SLIDE_MASTER)
+        rId = master_part.relate_to(layout_part, RT.SLIDE_LAYOUT)
+        etree.SubElement(
+            part_element(master_part).get_or_add_sldLayoutIdLst(),
+            qn("p:sldLayoutId"),
+            {"id": str(self._layout_id()), qn("r:id"): rId},
+        )
+
+
+def assemble_presentation(slides, output_path, base_path=None):
+    """
+    Create a new presentation from slides of one or more template decks.
+
+    Args:
+        slides: List of (template path, slide index) pairs (0-based), in output order
+        output_path: Path for output PPTX file
+        base_path: Deck providing slide size, theme and properties (default:
+            the first template)
+    """
+    if not slides:
+        raise ValueError("No slides to assemble")
+    base_path = Path(base_path or slides[0][0])
+
+    # Open each deck once; the base deck is also the destination
+    prs = Presentation(base_path)
+    decks = {base_path.resolve(): prs}
+    for path, _ in slides:
+        if Path(path).resolve() not in decks:
+            decks[Path(path).resolve()] = Presentation(path)
+    source_slides = {
+        key: [slide.part for slide in deck.slides] for key, deck in decks.items()
+    }
+
+    # Validate indices and slide sizes
+    for path, idx in slides:
+        total = len(source_slides[Path(path).resolve()])
+        if idx < 0 or idx >= total:
+            raise ValueError(
+                f"Slide index {idx} out of range for {path} (0-{total - 1})"
+            )
+    for key, deck in decks.items():
+        if (deck.slide_width, deck.slide_height) != (prs.slide_width, prs.slide_height):
+            print(
+                f"Warning: {key.name} has a different slide size than {base_path.name}"
+            )
+
+    # Start from the base deck without its slides
+    sld_id_lst = prs.element.get_or_add_sldIdLst()
+    for sld_id in list(sld_id_lst):
+        sld_id_lst.remove(sld_id)
+        prs.part.drop_rel(sld_id.rId)
+
+    print(f"Assembling {len(slides)} slides from {len(decks)} template(s)...")
+    cloner = PartCloner(prs)
+    for i, (path, idx) in enumerate(slides):
+        cloner.add_slide(source_slides[Path(path).resolve()][idx])
+        print(f"  [{i}] Slide {idx} of {Path(path).name}")
+    cloner.finish()
+
+    # Save the presentation (accessing slides renumbers the slide parts)
+    final_count = len(prs.slides)
+    prs.save(output_path)
+    print(f"\nSaved assembled presentation to: {output_path}")
+    print(f"Final presentation has {final_count} slides")
+
+
+if __name__ == "__main__":
+    main()
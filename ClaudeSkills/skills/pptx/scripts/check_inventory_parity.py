@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Check that the inventory engines agree on a set of presentations.
+
+The XML engine is the default for inventory.py on the grounds that it produces
+the same inventory as the python-pptx engine. This script extracts each deck
+with both engines, and with the XML engine in parallel, and reports every
+difference. Run it on the bundled decks (and any deck that shows a difference)
+after changing either engine.
+
+Usage:
+    python check_inventory_parity.py deck.pptx [deck.pptx ...] [--jobs N]
+
+Exits with status 1 if any deck's inventories differ.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Iterator, List
+
+from inventory import get_inventory_as_dict
+
+MAX_REPORTED = 20  # Differences listed per comparison
+
+
+def differences(expected: Any, actual: Any, path: str = "") -> Iterator[str]:
+    """Yield a description of each place where two JSON values differ."""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in [*expected, *(key for key in actual if key not in expected)]:
+            if key not in actual:
+                yield f"{path}/{key}: missing"
+            elif key not in expected:
+                yield f"{path}/{key}: unexpected"
+            else:
+                yield from differences(expected[key], actual[key], f"{path}/{key}")
+        # Slides and shapes are listed in a meaningful order
+        if list(expected) != list(actual) and expected.keys() == actual.keys():
+            yield f"{path}: keys in a different order"
+    elif isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            yield f"{path}: {len(expected)} items != {len(actual)} items"
+        for index, (a, b) in enumerate(zip(expected, actual)):
+            yield from differences(a, b, f"{path}[{index}]")
+    elif expected != actual or type(expected) is not type(actual):
+        yield f"{path}: {expected!r} != {actual!r}"
+
+
+def check_deck(pptx_path: Path, jobs: int) -> List[str]:
+    """Return the differences between engines for one deck, for both modes."""
+    problems = []
+    for issues_only in (False, True):
+        reference = get_inventory_as_dict(
+            pptx_path, issues_only=issues_only, engine="python-pptx"
+        )
+        runs = {"xml": dict(jobs=1), f"xml --jobs {jobs}": dict(jobs=jobs)}
+        for name, options in runs.items():
+            inventory = get_inventory_as_dict(
+                pptx_path, issues_only=issues_only, engine="xml", **options
+            )
+            label = f"{name}{' --issues-only' if issues_only else ''}"
+            for index, difference in enumerate(differences(reference, inventory)):
+                if index == MAX_REPORTED:
+                    problems.append(f"{label}: ...")
+                    break
+                problems.append(f"{label}: {difference}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check that the inventory engines agree on presentations."
+    )
+    parser.add_argument("decks", nargs="+", help="PowerPoint files (.pptx)")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=2,
+        help="Worker processes for the parallel XML run (default: 2)",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for deck in args.decks:
+        problems = check_deck(Path(deck), max(2, args.jobs))
+        if problems:
+            failed = True
+            print(f"{deck}: {len(problems)} difference(s)")
+            for problem in problems:
+                print(f"  {problem}")
+        else:
+            print(f"{deck}: identical")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,9 +13,11 @@ This module provides functionality to:
 Classes:
     ParagraphData: Represents a text paragraph with formatting
     ShapeData: Represents a shape with position and text content
+    XmlPresentation: Reads slide XML directly, without the python-pptx object model
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
+    get_inventory_as_dict: Extract JSON-ready data, optionally in parallel
     save_inventory: Save extracted data to JSON
 
 Usage:
@@ -24,15 +26,24 @@ Usage:
 
 import argparse
 import json
-import platform
+import os
+import posixpath
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from PIL import Image, ImageDraw, ImageFont
+from fonts import find_font_path, get_font
+from lxml import etree
+from measure import get_measurer, wrap_line
 from pptx import Presentation
-from pptx.enum.text import PP_ALIGN
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.enum.text import MSO_UNDERLINE, PP_ALIGN
 from pptx.shapes.base import BaseShape
 
 # Type aliases for cleaner signatures
@@ -60,6 +71,12 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.json --jobs 0
+    Extracts slides in parallel on all CPUs (same output as a serial run)
+
+  python inventory.py presentation.pptx inventory.json --engine python-pptx
+    Extracts through the python-pptx object model instead of raw slide XML
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -76,6 +93,19 @@ The output JSON includes:
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for extracting slides (0 = all CPUs)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="xml",
+        help="Read slide XML directly (default) or go through python-pptx objects",
+    )
 
     args = parser.parse_args()
 
@@ -94,11 +124,13 @@ The output JSON includes:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
+        inventory = get_inventory_as_dict(
+            input_path, issues_only=args.issues_only, jobs=args.jobs, engine=args.engine
+        )
 
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_inventory(inventory, output_path)
+        save_inventory_dict(inventory, output_path)
 
         print(f"Output saved to: {args.output}")
 
@@ -137,13 +169,30 @@ class ShapeWithPosition:
 class ParagraphData:
     """Data structure for paragraph properties extracted from a PowerPoint paragraph."""
 
+    __slots__ = (
+        "text",
+        "bullet",
+        "level",
+        "alignment",
+        "space_before",
+        "space_after",
+        "font_name",
+        "font_size",
+        "bold",
+        "italic",
+        "underline",
+        "color",
+        "theme_color",
+        "line_spacing",
+    )
+
     def __init__(self, paragraph: Any):
         """Initialize from a PowerPoint paragraph object.
 
         Args:
             paragraph: The PowerPoint paragraph object
         """
-        self.text: str = paragraph.text.strip()
+        self.text: str = ""
         self.bullet: bool = False
         self.level: Optional[int] = None
         self.alignment: Optional[str] = None
@@ -157,6 +206,11 @@ class ParagraphData:
         self.color: Optional[str] = None
         self.theme_color: Optional[str] = None
         self.line_spacing: Optional[float] = None
+        self._extract(paragraph)
+
+    def _extract(self, paragraph: Any) -> None:
+        """Read text and formatting through the python-pptx paragraph proxy."""
+        self.text = paragraph.text.strip()
 
         # Check for bullet formatting
         if (
@@ -196,7 +250,7 @@ class ParagraphData:
             if hasattr(first_run, "font"):
                 font = first_run.font
                 if font.name:
-                    self.font_name = font.name
+                    self.font_name = sys.intern(font.name)
                 if font.size:
                     self.font_size = font.size.pt
                 if font.bold is not None:
@@ -210,7 +264,7 @@ class ParagraphData:
                 try:
                     # Try RGB color first
                     if font.color.rgb:
-                        self.color = str(font.color.rgb)
+                        self.color = sys.intern(str(font.color.rgb))
                 except (AttributeError, TypeError):
                     # Fall back to theme color
                     try:
@@ -263,8 +317,58 @@ class ParagraphData:
         return result
 
 
+def master_default_font_size(
+    master_element: Any, placeholder_type: Optional[str]
+) -> int:
+    """Return the master's title or body text size in points (14 if not set).
+
+    Args:
+        master_element: The p:sldMaster element of the slide master
+        placeholder_type: Placeholder type name; titles use the titleStyle
+    """
+    # Determine theme style based on placeholder type
+    style_name = "bodyStyle"  # Default
+    if placeholder_type and "TITLE" in placeholder_type:
+        style_name = "titleStyle"
+
+    # Find font size in theme styles
+    for child in master_element.iter():
+        tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
+        if tag == style_name:
+            for elem in child.iter():
+                if "sz" in elem.attrib:
+                    return int(elem.attrib["sz"]) // 100
+    return 14
+
+
 class ShapeData:
-    """Data structure for shape properties extracted from a PowerPoint shape."""
+    """Data structure for shape properties extracted from a PowerPoint shape.
+
+    Positions are kept as integer EMUs (inches are derived on access) and the
+    paragraphs are extracted once, so a record stays small and serializes
+    without going back to the shape. The shape reference itself is optional:
+    extract_text_inventory(keep_shapes=False) drops it so the presentation
+    can be freed while the inventory is still in use.
+    """
+
+    __slots__ = (
+        "shape",
+        "shape_id",
+        "slide_width_emu",
+        "slide_height_emu",
+        "placeholder_type",
+        "default_font_size",
+        "left_emu",
+        "top_emu",
+        "width_emu",
+        "height_emu",
+        "paragraphs",
+        "frame_overflow_bottom",
+        "slide_overflow_right",
+        "slide_overflow_bottom",
+        "overlapping_shapes",
+        "warnings",
+    )
 
     @staticmethod
     def emu_to_inches(emu: int) -> float:
@@ -286,61 +390,7 @@ class ShapeData:
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
-        # Common font file variations to try
-        font_variations = [
-            font_name,
-            font_name.lower(),
-            font_name.replace(" ", ""),
-            font_name.replace(" ", "-"),
-        ]
-
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
-
-            # First try exact matches
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
-
-            # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
-
-        return None
+        return find_font_path(font_name)
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -436,22 +486,31 @@ class ShapeData:
             else (shape.top if hasattr(shape, "top") else 0)
         )
 
-        self.left: float = round(self.emu_to_inches(left_emu), 2)  # type: ignore
-        self.top: float = round(self.emu_to_inches(top_emu), 2)  # type: ignore
-        self.width: float = round(
-            self.emu_to_inches(shape.width if hasattr(shape, "width") else 0),
-            2,  # type: ignore
-        )
-        self.height: float = round(
-            self.emu_to_inches(shape.height if hasattr(shape, "height") else 0),
-            2,  # type: ignore
+        self._set_geometry(
+            left_emu,  # type: ignore
+            top_emu,  # type: ignore
+            shape.width if hasattr(shape, "width") else 0,  # type: ignore
+            shape.height if hasattr(shape, "height") else 0,  # type: ignore
         )
 
-        # Store EMU positions for overflow calculations
-        self.left_emu = left_emu
-        self.top_emu = top_emu
-        self.width_emu = shape.width if hasattr(shape, "width") else 0
-        self.height_emu = shape.height if hasattr(shape, "height") else 0
+    def _set_geometry(
+        self, left_emu: int, top_emu: int, width_emu: int, height_emu: int
+    ) -> None:
+        """Store position and size, read the text, then run the issue checks."""
+        # Plain ints: python-pptx lengths are int subclasses with a __dict__
+        self.left_emu = int(left_emu)
+        self.top_emu = int(top_emu)
+        self.width_emu = int(width_emu)
+        self.height_emu = int(height_emu)
+
+        # Extract each non-blank paragraph once, for both the checks and to_dict
+        frame = [
+            (text, self._paragraph_data(paragraph) if text.strip() else None)
+            for text, paragraph in self._frame_paragraphs()
+        ]
+        self.paragraphs: List[ParagraphData] = [
+            para_data for _, para_data in frame if para_data is not None
+        ]
 
         # Calculate overflow status
         self.frame_overflow_bottom: Optional[float] = None
@@ -461,21 +520,47 @@ class ShapeData:
             str, float
         ] = {}  # Dict of shape_id -> overlap area in sq inches
         self.warnings: List[str] = []
-        self._estimate_frame_overflow()
+        self._estimate_frame_overflow(frame)
         self._calculate_slide_overflow()
-        self._detect_bullet_issues()
+        self._detect_bullet_issues(frame)
+
+    @property
+    def left(self) -> float:
+        """Left position in inches, rounded to 2 decimals."""
+        return round(self.emu_to_inches(self.left_emu), 2)
+
+    @property
+    def top(self) -> float:
+        """Top position in inches, rounded to 2 decimals."""
+        return round(self.emu_to_inches(self.top_emu), 2)
+
+    @property
+    def width(self) -> float:
+        """Width in inches, rounded to 2 decimals."""
+        return round(self.emu_to_inches(self.width_emu), 2)
 
     @property
-    def paragraphs(self) -> List[ParagraphData]:
-        """Calculate paragraphs from the shape's text frame."""
+    def height(self) -> float:
+        """Height in inches, rounded to 2 decimals."""
+        return round(self.emu_to_inches(self.height_emu), 2)
+
+    def _frame_paragraphs(self) -> List[Tuple[str, Any]]:
+        """Return (text, paragraph) for every paragraph of the shape's text frame."""
         if not self.shape or not hasattr(self.shape, "text_frame"):
             return []
 
-        paragraphs = []
-        for paragraph in self.shape.text_frame.paragraphs:  # type: ignore
-            if paragraph.text.strip():
-                paragraphs.append(ParagraphData(paragraph))
-        return paragraphs
+        text_frame = self.shape.text_frame  # type: ignore
+        if not text_frame:
+            return []
+        return [(paragraph.text, paragraph) for paragraph in text_frame.paragraphs]
+
+    def _paragraph_data(self, paragraph: Any) -> ParagraphData:
+        """Extract the properties of a paragraph returned by _frame_paragraphs."""
+        return ParagraphData(paragraph)
+
+    def _frame_margins(self) -> Any:
+        """Return an object with the text frame's margin_* attributes."""
+        return self.shape.text_frame  # type: ignore
 
     def _get_default_font_size(self) -> int:
         """Get default font size from theme text styles or use conservative default."""
@@ -489,18 +574,7 @@ class ShapeData:
             if not hasattr(slide_master, "element"):
                 return 14
 
-            # Determine theme style based on placeholder type
-            style_name = "bodyStyle"  # Default
-            if self.placeholder_type and "TITLE" in self.placeholder_type:
-                style_name = "titleStyle"
-
-            # Find font size in theme styles
-            for child in slide_master.element.iter():
-                tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-                if tag == style_name:
-                    for elem in child.iter():
-                        if "sz" in elem.attrib:
-                            return int(elem.attrib["sz"]) // 100
+            return master_default_font_size(slide_master.element, self.placeholder_type)
         except Exception:
             pass
 
@@ -531,82 +605,49 @@ class ShapeData:
             self.inches_to_pixels(usable_height),
         )
 
-    def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
+    def _wrap_text_line(self, line: str, max_width_px: int, font) -> List[str]:
         """Wrap a single line of text to fit within max_width_px."""
-        if not line:
-            return [""]
-
-        # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
-            return [line]
-
-        # Need to wrap - split into words
-        wrapped = []
-        words = line.split(" ")
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
-                current_line = test_line
-            else:
-                if current_line:
-                    wrapped.append(current_line)
-                current_line = word
-
-        if current_line:
-            wrapped.append(current_line)
+        return wrap_line(line, max_width_px, get_measurer(font))
 
-        return wrapped
+    def _estimate_frame_overflow(
+        self, paragraphs: List[Tuple[str, Optional[ParagraphData]]]
+    ) -> None:
+        """Estimate if text overflows the shape bounds using PIL text measurement.
 
-    def _estimate_frame_overflow(self) -> None:
-        """Estimate if text overflows the shape bounds using PIL text measurement."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return
-
-        text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
+        Args:
+            paragraphs: (text, ParagraphData) for every paragraph of the text
+                frame; the data is None for blank paragraphs
+        """
+        if not paragraphs:
             return
 
         # Get usable dimensions after accounting for margins
-        usable_width_px, usable_height_px = self._get_usable_dimensions(text_frame)
+        usable_width_px, usable_height_px = self._get_usable_dimensions(
+            self._frame_margins()
+        )
         if usable_width_px <= 0 or usable_height_px <= 0:
             return
 
-        # Set up PIL for text measurement
-        dummy_img = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
-
         # Get default font size from placeholder or use conservative estimate
         default_font_size = self._get_default_font_size()
 
         # Calculate total height of all paragraphs
         total_height_px = 0
 
-        for para_idx, paragraph in enumerate(text_frame.paragraphs):
-            if not paragraph.text.strip():
+        for para_idx, (text, para_data) in enumerate(paragraphs):
+            if para_data is None:
                 continue
 
-            para_data = ParagraphData(paragraph)
-
             # Load font for this paragraph
             font_name = para_data.font_name or "Arial"
             font_size = int(para_data.font_size or default_font_size)
 
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
+            font = get_font(font_name, font_size)
 
             # Wrap all lines in this paragraph
             all_wrapped_lines = []
-            for line in paragraph.text.split("\n"):
-                wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
+            for line in text.split("\n"):
+                wrapped = self._wrap_text_line(line, usable_width_px, font)
                 all_wrapped_lines.extend(wrapped)
 
             if all_wrapped_lines:
@@ -657,20 +698,15 @@ class ShapeData:
             if overflow_inches > 0.01:  # Only report significant overflows
                 self.slide_overflow_bottom = overflow_inches
 
-    def _detect_bullet_issues(self) -> None:
+    def _detect_bullet_issues(
+        self, paragraphs: List[Tuple[str, Optional[ParagraphData]]]
+    ) -> None:
         """Detect bullet point formatting issues in paragraphs."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return
-
-        text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
-            return
-
         # Common bullet symbols that indicate manual bullets
         bullet_symbols = ["•", "●", "○"]
 
-        for paragraph in text_frame.paragraphs:
-            text = paragraph.text.strip()
+        for text, _ in paragraphs:
+            text = text.strip()
             # Check for manual bullet symbols
             if text and any(text.startswith(symbol + " ") for symbol in bullet_symbols):
                 self.warnings.append(
@@ -879,40 +915,56 @@ def calculate_overlap(
     return False, 0
 
 
-def detect_overlaps(shapes: List[ShapeData]) -> None:
+def detect_overlaps(shapes: List[ShapeData], tolerance: float = 0.05) -> None:
     """Detect overlapping shapes and update their overlapping_shapes dictionaries.
 
     This function requires each ShapeData to have its shape_id already set.
     It modifies the shapes in-place, adding shape IDs with overlap areas in square inches.
 
+    Shapes are swept left to right, so only pairs whose horizontal extents
+    overlap by more than the tolerance are compared, instead of every pair.
+
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
+        tolerance: Minimum overlap in inches to consider as overlapping (default: 0.05")
     """
-    n = len(shapes)
-
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
-
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
-
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
-
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
+    for i, shape in enumerate(shapes):
+        # Ensure shape IDs are set
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
+
+    rects = [(shape.left, shape.top, shape.width, shape.height) for shape in shapes]
+    order = sorted(range(len(shapes)), key=lambda index: rects[index][0])
+
+    pairs = []
+    active: List[int] = []  # Shapes whose right edge may still overlap the sweep
+    for j in order:
+        left, top, width, height = rects[j]
+        # Shapes ending within tolerance of this left edge cannot overlap it or
+        # any later shape, since lefts only increase
+        active = [i for i in active if rects[i][0] + rects[i][2] - left > tolerance]
+        for i in active:
+            other_top, other_height = rects[i][1], rects[i][3]
+            if (
+                min(top + height, other_top + other_height) - max(top, other_top)
+                > tolerance
+            ):
+                pairs.append((i, j) if i < j else (j, i))
+        active.append(j)
 
-            if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+    # Record pairs in index order so each dictionary matches a pairwise scan
+    for i, j in sorted(pairs):
+        overlaps, overlap_area = calculate_overlap(rects[i], rects[j], tolerance)
+        if overlaps:
+            # Add shape IDs with overlap area in square inches
+            shapes[i].overlapping_shapes[shapes[j].shape_id] = overlap_area
+            shapes[j].overlapping_shapes[shapes[i].shape_id] = overlap_area
 
 
 def extract_text_inventory(
-    pptx_path: Path, prs: Optional[Any] = None, issues_only: bool = False
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    keep_shapes: bool = True,
 ) -> InventoryData:
     """Extract text content from all slides in a PowerPoint presentation.
 
@@ -920,6 +972,8 @@ def extract_text_inventory(
         pptx_path: Path to the PowerPoint file
         prs: Optional Presentation object to use. If not provided, will load from pptx_path.
         issues_only: If True, only include shapes that have overflow or overlap issues
+        keep_shapes: If False, the ShapeData objects do not reference their
+            python-pptx shapes, so the presentation can be garbage collected
 
     Returns a nested dictionary: {slide-N: {shape-N: ShapeData}}
     Shapes are sorted by visual position (top-to-bottom, left-to-right).
@@ -931,50 +985,689 @@ def extract_text_inventory(
     inventory: InventoryData = {}
 
     for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+        slide_inventory = extract_slide_inventory(slide, issues_only, keep_shapes)
+        if slide_inventory:
+            inventory[f"slide-{slide_idx}"] = slide_inventory
 
-        if not shapes_with_positions:
-            continue
+    return inventory
 
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
+
+def extract_slide_inventory(
+    slide: Any, issues_only: bool = False, keep_shapes: bool = True
+) -> Dict[str, "ShapeData"]:
+    """Extract the text shapes of one slide as {shape-N: ShapeData}.
+
+    Returns an empty dictionary if the slide has no (matching) text shapes.
+    """
+    # Collect all valid shapes from this slide with absolute positions
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    if not shapes_with_positions:
+        return {}
+
+    # Convert to ShapeData with absolute positions and slide reference
+    shape_data_list = [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+        )
+        for swp in shapes_with_positions
+    ]
+    if not keep_shapes:
+        for shape_data in shape_data_list:
+            shape_data.shape = None
+    return _build_slide_inventory(shape_data_list, issues_only)
+
+
+def _build_slide_inventory(
+    shape_data_list: List[ShapeData], issues_only: bool
+) -> Dict[str, ShapeData]:
+    """Sort a slide's shapes, assign IDs, detect overlaps and filter issues."""
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
+
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
+
+    # Filter for issues only if requested (after overlap detection)
+    if issues_only:
+        sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+
+    # Create slide inventory using the stable shape IDs
+    return {shape_data.shape_id: shape_data for shape_data in sorted_shapes}
+
+
+# Raw-XML extraction: reads the slide XML with lxml instead of building the
+# python-pptx object model. It mirrors python-pptx's reading rules (placeholder
+# inheritance, default margins, colour lookup) so the output is identical, and
+# never modifies the parsed tree.
+
+A_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+P_NS = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_RELS_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Same settings as python-pptx's parser, so text nodes come out the same
+XML_PARSER = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+
+# Children of p:spTree that python-pptx reports as shapes
+SHAPE_TAGS = {
+    f"{P_NS}{name}"
+    for name in ("sp", "grpSp", "graphicFrame", "cxnSp", "pic", "contentPart")
+}
+FILL_TAGS = {
+    f"{A_NS}{name}"
+    for name in ("noFill", "solidFill", "gradFill", "blipFill", "pattFill", "grpFill")
+}
+COLOR_TAGS = {
+    f"{A_NS}{name}"
+    for name in ("scrgbClr", "srgbClr", "hslClr", "sysClr", "schemeClr", "prstClr")
+}
+
+# Master placeholder type a layout placeholder inherits its geometry from
+LAYOUT_BASE_PLACEHOLDER = {
+    "body": "body",
+    "chart": "body",
+    "clipArt": "body",
+    "ctrTitle": "title",
+    "dgm": "body",
+    "dt": "dt",
+    "ftr": "ftr",
+    "media": "body",
+    "obj": "body",
+    "pic": "body",
+    "sldNum": "sldNum",
+    "subTitle": "body",
+    "tbl": "body",
+    "title": "title",
+}
+
+ALIGNMENT_NAMES = {"ctr": "CENTER", "r": "RIGHT", "just": "JUSTIFY"}
+
+# python-pptx's bodyPr inset defaults, in EMUs
+DEFAULT_INSETS = {"lIns": 91440, "rIns": 91440, "tIns": 45720, "bIns": 45720}
+
+
+def _centipoints_to_pt(value: str) -> float:
+    """Convert a centipoint attribute to points, rounding through EMUs."""
+    return int(int(value) * 127) / 12700.0
+
+
+def _xml_bool(value: Optional[str]) -> Optional[bool]:
+    return None if value is None else value in ("1", "true")
+
+
+def _first_child(element: Any, tags: set) -> Any:
+    for child in element:
+        if child.tag in tags:
+            return child
+    return None
+
+
+def get_xfrm_value(shape_element: Any, name: str, attr: str) -> Optional[int]:
+    """Read a:off/@x, a:ext/@cx, ... from a shape's own transform, if present."""
+    props = shape_element.find(
+        f"{P_NS}grpSpPr" if shape_element.tag == f"{P_NS}grpSp" else f"{P_NS}spPr"
+    )
+    xfrm = props.find(f"{A_NS}xfrm") if props is not None else None
+    part = xfrm.find(f"{A_NS}{name}") if xfrm is not None else None
+    if part is None:
+        return None
+    return int(part.get(attr))
+
+
+GEOMETRY = {
+    "left": ("off", "x"),
+    "top": ("off", "y"),
+    "width": ("ext", "cx"),
+    "height": ("ext", "cy"),
+}
+
+
+def get_placeholder(shape_element: Any) -> Any:
+    """Return the p:ph element of a shape, or None if it is not a placeholder."""
+    if len(shape_element) == 0:
+        return None
+    nv_pr = shape_element[0].find(f"{P_NS}nvPr")
+    return nv_pr.find(f"{P_NS}ph") if nv_pr is not None else None
+
+
+def get_placeholder_type(ph: Any) -> str:
+    """Return a p:ph element's type; placeholders without one are "obj"."""
+    return ph.get("type", "obj")
+
+
+def _placeholders(tree_element: Any) -> List[Tuple[Any, Any]]:
+    """Return (shape, p:ph) for the placeholders directly in a shape tree."""
+    placeholders = []
+    for child in tree_element.find(f"{P_NS}cSld/{P_NS}spTree"):
+        if child.tag in SHAPE_TAGS:
+            ph = get_placeholder(child)
+            if ph is not None:
+                placeholders.append((child, ph))
+    return placeholders
+
+
+def paragraph_text(p: Any) -> str:
+    """Return an a:p element's text: runs, fields and a vertical tab per a:br."""
+    parts = []
+    for child in p:
+        if child.tag == f"{A_NS}r" or child.tag == f"{A_NS}fld":
+            t = child.find(f"{A_NS}t")
+            parts.append((t.text or "") if t is not None else "")
+        elif child.tag == f"{A_NS}br":
+            parts.append("\v")
+    return "".join(parts)
+
+
+class XmlParagraphData(ParagraphData):
+    """ParagraphData read directly from an a:p element."""
+
+    __slots__ = ()
+
+    def _extract(self, paragraph: Any) -> None:
+        """Read text and formatting from the a:p element."""
+        self.text = paragraph_text(paragraph).strip()
+
+        pPr = paragraph.find(f"{A_NS}pPr")
+        if pPr is not None:
+            if (
+                pPr.find(f"{A_NS}buChar") is not None
+                or pPr.find(f"{A_NS}buAutoNum") is not None
+            ):
+                self.bullet = True
+                self.level = int(pPr.get("lvl", 0))
+
+            self.alignment = ALIGNMENT_NAMES.get(pPr.get("algn"))  # type: ignore
+
+            # Spacing before/after is only reported when given in points
+            for name, attr in (("spcBef", "space_before"), ("spcAft", "space_after")):
+                spc_pts = pPr.find(f"{A_NS}{name}/{A_NS}spcPts")
+                if spc_pts is not None and _centipoints_to_pt(spc_pts.get("val")):
+                    setattr(self, attr, _centipoints_to_pt(spc_pts.get("val")))
+
+        # Extract font properties from first run
+        run = paragraph.find(f"{A_NS}r")
+        rPr = run.find(f"{A_NS}rPr") if run is not None else None
+        if rPr is not None:
+            latin = rPr.find(f"{A_NS}latin")
+            if latin is not None and latin.get("typeface"):
+                self.font_name = sys.intern(latin.get("typeface"))
+            if rPr.get("sz") and _centipoints_to_pt(rPr.get("sz")):
+                self.font_size = _centipoints_to_pt(rPr.get("sz"))
+            self.bold = _xml_bool(rPr.get("b"))
+            self.italic = _xml_bool(rPr.get("i"))
+            underline = rPr.get("u")
+            if underline is not None:
+                self.underline = (
+                    underline != "none"
+                    if underline in ("none", "sng")
+                    else MSO_UNDERLINE.from_xml(underline)
+                )
+
+            # Only a solid fill carries a font colour
+            fill = _first_child(rPr, FILL_TAGS)
+            if fill is not None and fill.tag == f"{A_NS}solidFill":
+                color = _first_child(fill, COLOR_TAGS)
+                if color is not None and color.tag == f"{A_NS}srgbClr":
+                    self.color = sys.intern(str(RGBColor.from_string(color.get("val"))))
+                elif color is not None and color.tag == f"{A_NS}schemeClr":
+                    theme_color = MSO_THEME_COLOR.from_xml(color.get("val"))
+                    if theme_color:
+                        self.theme_color = theme_color.name
+
+        # Add line spacing if set
+        ln_spc = pPr.find(f"{A_NS}lnSpc") if pPr is not None else None
+        if ln_spc is not None:
+            spc_pts = ln_spc.find(f"{A_NS}spcPts")
+            spc_pct = ln_spc.find(f"{A_NS}spcPct")
+            if spc_pts is not None:
+                self.line_spacing = round(_centipoints_to_pt(spc_pts.get("val")), 2)
+            elif spc_pct is not None:
+                value = spc_pct.get("val")
+                if value.endswith("%"):
+                    lines = float(value[:-1]) / 100.0
+                else:
+                    lines = int(value) / 100000.0
+                # Multiplier - convert to points
+                font_size = self.font_size if self.font_size else 12.0
+                self.line_spacing = round(lines * font_size, 2)
+
+
+class XmlPresentation:
+    """Slide, layout and master XML read straight from a .pptx package.
+
+    Parts are parsed on first use and cached, so layouts and masters shared by
+    many slides are parsed once.
+    """
+
+    def __init__(self, pptx_path: Union[str, Path]):
+        self._zip = zipfile.ZipFile(pptx_path)
+        self._parts: Dict[str, Any] = {}
+        self._rels: Dict[str, List[Tuple[str, str, str]]] = {}
+
+        self.part_name = self.related("", "/officeDocument")
+        presentation = self.part(self.part_name)
+        sld_sz = presentation.find(f"{P_NS}sldSz")
+        self.slide_width = int(sld_sz.get("cx")) if sld_sz is not None else None
+        self.slide_height = int(sld_sz.get("cy")) if sld_sz is not None else None
+
+        targets = {
+            rel_id: target for rel_id, _, target in self.relationships(self.part_name)
+        }
+        sld_id_lst = presentation.find(f"{P_NS}sldIdLst")
+        self.slides = [
+            XmlSlide(self, targets[sld_id.get(f"{R_NS}id")])
+            for sld_id in (sld_id_lst if sld_id_lst is not None else [])
         ]
 
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
+    def part(self, part_name: str) -> Any:
+        """Return the parsed root element of a part."""
+        if part_name not in self._parts:
+            self._parts[part_name] = etree.fromstring(
+                self._zip.read(part_name), XML_PARSER
+            )
+        return self._parts[part_name]
+
+    def part_info(self, part_name: str) -> zipfile.ZipInfo:
+        """Return the zip entry of a part, with its CRC-32 and size."""
+        return self._zip.getinfo(part_name)
+
+    def relationships(self, part_name: str) -> List[Tuple[str, str, str]]:
+        """Return (id, type, target part name) for a part's internal relationships."""
+        if part_name not in self._rels:
+            directory, file_name = posixpath.split(part_name)
+            rels_name = posixpath.join(directory, "_rels", f"{file_name}.rels")
+            relationships = []
+            if rels_name in self._zip.NameToInfo:
+                root = etree.fromstring(self._zip.read(rels_name), XML_PARSER)
+                for rel in root.iter(f"{PKG_RELS_NS}Relationship"):
+                    if rel.get("TargetMode") == "External":
+                        continue
+                    target = rel.get("Target")
+                    if target.startswith("/"):
+                        target = target[1:]
+                    else:
+                        target = posixpath.normpath(posixpath.join(directory, target))
+                    relationships.append((rel.get("Id"), rel.get("Type"), target))
+            self._rels[part_name] = relationships
+        return self._rels[part_name]
+
+    def related(self, part_name: str, type_suffix: str) -> str:
+        """Return the target of the first relationship whose type ends with type_suffix."""
+        for _, rel_type, target in self.relationships(part_name):
+            if rel_type.endswith(type_suffix):
+                return target
+        raise KeyError(
+            f"{part_name or 'package'} has no {type_suffix[1:]} relationship"
+        )
+
+    def close(self) -> None:
+        self._zip.close()
 
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
+    def __enter__(self) -> "XmlPresentation":
+        return self
 
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
-        if not sorted_shapes:
-            continue
 
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
+class XmlSlide:
+    """One slide of an XmlPresentation with its layout and master."""
+
+    def __init__(self, presentation: XmlPresentation, part_name: str):
+        self.presentation = presentation
+        self.part_name = part_name
+
+    @property
+    def element(self) -> Any:
+        return self.presentation.part(self.part_name)
+
+    @property
+    def layout_name(self) -> str:
+        return self.presentation.related(self.part_name, "/slideLayout")
+
+    @property
+    def master_name(self) -> str:
+        return self.presentation.related(self.layout_name, "/slideMaster")
+
+    @property
+    def layout_element(self) -> Any:
+        return self.presentation.part(self.layout_name)
+
+    @property
+    def master_element(self) -> Any:
+        return self.presentation.part(self.master_name)
+
+    @property
+    def slide_width(self) -> Optional[int]:
+        return self.presentation.slide_width
+
+    @property
+    def slide_height(self) -> Optional[int]:
+        return self.presentation.slide_height
+
+    def inherited_geometry(self, ph: Any, name: str) -> Optional[int]:
+        """Return a placeholder dimension inherited from the layout or master."""
+        idx = int(ph.get("idx", 0))
+        for layout_shape, layout_ph in _placeholders(self.layout_element):
+            if int(layout_ph.get("idx", 0)) != idx:
+                continue
+            value = get_xfrm_value(layout_shape, *GEOMETRY[name])
+            if value is not None:
+                return value
+            base_type = LAYOUT_BASE_PLACEHOLDER.get(get_placeholder_type(layout_ph))
+            for master_shape, master_ph in _placeholders(self.master_element):
+                if get_placeholder_type(master_ph) == base_type:
+                    return get_xfrm_value(master_shape, *GEOMETRY[name])
+            return None
+        return None
+
+    def layout_default_font_size(self, ph_type: str) -> Optional[float]:
+        """Return the first defRPr size of the layout placeholder of this type."""
+        try:
+            for layout_shape, layout_ph in _placeholders(self.layout_element):
+                if get_placeholder_type(layout_ph) == ph_type:
+                    # Find first defRPr element with sz (size) attribute
+                    for elem in layout_shape.iter():
+                        if "defRPr" in elem.tag and (sz := elem.get("sz")):
+                            return float(sz) / 100.0  # Convert EMUs to points
+                    break
+        except Exception:
+            pass
+        return None
+
+
+class LoadedXmlSlide(XmlSlide):
+    """An XmlSlide over the in-memory XML of a slide opened with python-pptx.
+
+    Only the underlying lxml elements are read, so shapes can be re-inventoried
+    after edits without saving the presentation or touching its proxies.
+    """
+
+    def __init__(self, slide: Any):
+        self.slide = slide
+
+    @property
+    def element(self) -> Any:
+        return self.slide.element
+
+    @property
+    def layout_element(self) -> Any:
+        return self.slide.slide_layout.element
+
+    @property
+    def master_element(self) -> Any:
+        return self.slide.slide_layout.slide_master.element
+
+    @property
+    def slide_width(self) -> Optional[int]:
+        return ShapeData.get_slide_dimensions(self.slide)[0]
+
+    @property
+    def slide_height(self) -> Optional[int]:
+        return ShapeData.get_slide_dimensions(self.slide)[1]
+
+
+class XmlShapeData(ShapeData):
+    """ShapeData read directly from a p:sp element of an XmlSlide."""
+
+    __slots__ = ("_element", "_slide")
+
+    def __init__(
+        self,
+        element: Any,
+        absolute_left: int,
+        absolute_top: int,
+        slide: XmlSlide,
+        inherits_geometry: bool,
+    ):
+        """Initialize from a p:sp element.
+
+        Args:
+            element: The p:sp element (should be pre-validated)
+            absolute_left: Absolute left position in EMUs
+            absolute_top: Absolute top position in EMUs
+            slide: The slide, for dimensions, layout and master information
+            inherits_geometry: True for slide-level placeholders, which take
+                missing dimensions from their layout placeholder
+        """
+        self.shape = None  # No python-pptx shape behind this record
+        self.shape_id: str = ""  # Will be set after sorting
+        self._element = element
+        self._slide = slide
+        self.slide_width_emu = slide.slide_width
+        self.slide_height_emu = slide.slide_height
+
+        self.placeholder_type: Optional[str] = None
+        self.default_font_size: Optional[float] = None
+        ph = get_placeholder(element)
+        if ph is not None:
+            self.placeholder_type = PP_PLACEHOLDER.from_xml(
+                get_placeholder_type(ph)
+            ).name
+            self.default_font_size = slide.layout_default_font_size(
+                get_placeholder_type(ph)
+            )
+
+        def dimension(name: str) -> int:
+            value = get_xfrm_value(element, *GEOMETRY[name])
+            if value is None and ph is not None and inherits_geometry:
+                value = slide.inherited_geometry(ph, name)
+            return value or 0
+
+        self._set_geometry(
+            absolute_left, absolute_top, dimension("width"), dimension("height")
+        )
+
+        # Everything has been extracted; don't keep the slide's XML alive
+        self._element = None
+        self._slide = None
+
+    def _frame_paragraphs(self) -> List[Tuple[str, Any]]:
+        tx_body = self._element.find(f"{P_NS}txBody")
+        if tx_body is None:
+            return []
+        return [(paragraph_text(p), p) for p in tx_body.iterchildren(f"{A_NS}p")]
+
+    def _paragraph_data(self, paragraph: Any) -> ParagraphData:
+        return XmlParagraphData(paragraph)
+
+    def _frame_margins(self) -> Any:
+        body_pr = self._element.find(f"{P_NS}txBody/{A_NS}bodyPr")
+        insets = {
+            name: int(body_pr.get(name, default)) if body_pr is not None else default
+            for name, default in DEFAULT_INSETS.items()
         }
+        return SimpleNamespace(
+            margin_left=insets["lIns"],
+            margin_right=insets["rIns"],
+            margin_top=insets["tIns"],
+            margin_bottom=insets["bIns"],
+        )
 
-    return inventory
+    def _get_default_font_size(self) -> int:
+        try:
+            return master_default_font_size(
+                self._slide.master_element,
+                self.placeholder_type,
+            )
+        except Exception:
+            return 14
+
+
+def is_valid_xml_shape(element: Any) -> bool:
+    """Check if a p:sp element contains meaningful text content."""
+    tx_body = element.find(f"{P_NS}txBody")
+    if tx_body is None:
+        return False
+
+    text = "\n".join(
+        paragraph_text(p) for p in tx_body.iterchildren(f"{A_NS}p")
+    ).strip()
+    if not text:
+        return False
+
+    # Skip slide numbers and numeric footers
+    ph = get_placeholder(element)
+    if ph is not None:
+        placeholder_type = get_placeholder_type(ph)
+        if placeholder_type == "sldNum":
+            return False
+        if placeholder_type == "ftr" and text.isdigit():
+            return False
+
+    return True
+
+
+def collect_xml_shapes(
+    tree_element: Any,
+    slide: XmlSlide,
+    parent_left: int = 0,
+    parent_top: int = 0,
+) -> List[XmlShapeData]:
+    """Recursively collect the text shapes of a shape tree with absolute positions."""
+    top_level = tree_element.tag == f"{P_NS}spTree"
+    result = []
+    for child in tree_element:
+        if child.tag not in SHAPE_TAGS:
+            continue
+        if child.tag == f"{P_NS}grpSp":  # GroupShape
+            result.extend(
+                collect_xml_shapes(
+                    child,
+                    slide,
+                    parent_left + (get_xfrm_value(child, "off", "x") or 0),
+                    parent_top + (get_xfrm_value(child, "off", "y") or 0),
+                )
+            )
+        elif child.tag == f"{P_NS}sp" and is_valid_xml_shape(child):
+            ph = get_placeholder(child)
+            inherits_geometry = top_level and ph is not None
+            offsets = []
+            for name in ("left", "top"):
+                value = get_xfrm_value(child, *GEOMETRY[name])
+                if value is None and inherits_geometry:
+                    value = slide.inherited_geometry(ph, name)
+                offsets.append(value or 0)
+            result.append(
+                XmlShapeData(
+                    child,
+                    parent_left + offsets[0],
+                    parent_top + offsets[1],
+                    slide,
+                    inherits_geometry,
+                )
+            )
+    return result
 
 
-def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
+def extract_xml_slide_inventory(
+    slide: XmlSlide, issues_only: bool = False
+) -> Dict[str, ShapeData]:
+    """Extract the text shapes of one slide from its XML as {shape-N: ShapeData}."""
+    shape_data_list = collect_xml_shapes(
+        slide.element.find(f"{P_NS}cSld/{P_NS}spTree"), slide
+    )
+    if not shape_data_list:
+        return {}
+    return _build_slide_inventory(shape_data_list, issues_only)
+
+
+def reinventory_shapes(inventory: InventoryData) -> InventoryData:
+    """Re-read the shapes of an inventory from their current, in-memory XML.
+
+    Meant for checking a presentation after its text was edited through the
+    shapes referenced by extract_text_inventory (keep_shapes=True): only those
+    shapes are read, through their lxml elements, so nothing is added to the
+    tree and the presentation does not have to be saved and reloaded. Shape
+    keys and positions are kept from the given inventory; shapes that no
+    longer hold any text are left out, as a fresh extraction would.
+    """
+    slides: Dict[int, LoadedXmlSlide] = {}
+    updated: InventoryData = {}
+    for slide_key, shapes in inventory.items():
+        for shape_key, shape_data in shapes.items():
+            shape = shape_data.shape
+            if shape is None:
+                raise ValueError(f"{slide_key}/{shape_key} has no shape reference")
+            element = shape.element  # type: ignore
+            if not is_valid_xml_shape(element):
+                continue
+
+            slide = shape.part.slide  # type: ignore
+            xml_slide = slides.setdefault(id(slide), LoadedXmlSlide(slide))
+            top_level = element.getparent().tag == f"{P_NS}spTree"
+            updated_data = XmlShapeData(
+                element,
+                shape_data.left_emu,
+                shape_data.top_emu,
+                xml_slide,
+                top_level and get_placeholder(element) is not None,
+            )
+            updated_data.shape = shape
+            updated_data.shape_id = shape_key
+            updated.setdefault(slide_key, {})[shape_key] = updated_data
+    return updated
+
+
+# Engines for get_inventory_as_dict: "xml" reads the slide XML directly,
+# "python-pptx" goes through the python-pptx object model
+ENGINES = ("xml", "python-pptx")
+
+# Presentation opened once per worker process by _init_inventory_worker
+_worker_presentation: Optional[Any] = None
+
+
+def _open_presentation(pptx_path: Union[str, Path], engine: str) -> Any:
+    if engine == "xml":
+        return XmlPresentation(pptx_path)
+    return Presentation(str(pptx_path))
+
+
+def _extract_slide(slide: Any, issues_only: bool) -> Dict[str, ShapeData]:
+    if isinstance(slide, XmlSlide):
+        return extract_xml_slide_inventory(slide, issues_only)
+    return extract_slide_inventory(slide, issues_only, keep_shapes=False)
+
+
+def _init_inventory_worker(pptx_path: str, engine: str) -> None:
+    global _worker_presentation
+    _worker_presentation = _open_presentation(pptx_path, engine)
+
+
+def _inventory_slide_range(
+    task: Tuple[int, int, bool],
+) -> List[Tuple[int, Dict[str, ShapeDict]]]:
+    """Worker: extract slides [start, stop) as JSON-ready shape records."""
+    start, stop, issues_only = task
+    slides = _worker_presentation.slides  # type: ignore
+    records = []
+    for slide_idx in range(start, stop):
+        slide_inventory = _extract_slide(slides[slide_idx], issues_only)
+        if slide_inventory:
+            records.append(
+                (
+                    slide_idx,
+                    {
+                        shape_key: shape_data.to_dict()
+                        for shape_key, shape_data in slide_inventory.items()
+                    },
+                )
+            )
+    return records
+
+
+def get_inventory_as_dict(
+    pptx_path: Path, issues_only: bool = False, jobs: int = 1, engine: str = "xml"
+) -> InventoryDict:
     """Extract text inventory and return as JSON-serializable dictionaries.
 
     This is a convenience wrapper around extract_text_inventory that returns
@@ -984,18 +1677,69 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     Args:
         pptx_path: Path to the PowerPoint file
         issues_only: If True, only include shapes that have overflow or overlap issues
+        jobs: Worker processes; slides are split into contiguous ranges and
+            each worker opens the presentation once. 1 extracts serially,
+            0 or None uses all CPUs. The result is the same either way.
+        engine: "xml" (default) reads the slide XML directly with lxml, without
+            building or modifying python-pptx objects; "python-pptx" uses the
+            object model. Both produce the same inventory; see
+            check_inventory_parity.py.
 
     Returns:
         Nested dictionary with all data serialized for JSON
     """
-    inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown inventory engine: {engine}")
+
+    prs = _open_presentation(pptx_path, engine)
+    try:
+        if not jobs:
+            jobs = os.cpu_count() or 1
+        slide_count = len(prs.slides)
+        if jobs > 1 and slide_count > 1:
+            return _get_inventory_as_dict_parallel(
+                pptx_path, slide_count, issues_only, min(jobs, slide_count), engine
+            )
+
+        # Convert ShapeData objects to dictionaries
+        dict_inventory: InventoryDict = {}
+        for slide_idx, slide in enumerate(prs.slides):
+            slide_inventory = _extract_slide(slide, issues_only)
+            if slide_inventory:
+                dict_inventory[f"slide-{slide_idx}"] = {
+                    shape_key: shape_data.to_dict()
+                    for shape_key, shape_data in slide_inventory.items()
+                }
+        return dict_inventory
+    finally:
+        if isinstance(prs, XmlPresentation):
+            prs.close()
+
+
+def _get_inventory_as_dict_parallel(
+    pptx_path: Path,
+    slide_count: int,
+    issues_only: bool,
+    jobs: int,
+    engine: str,
+) -> InventoryDict:
+    """Extract slide ranges in worker processes and merge them in slide order."""
+    # A few ranges per worker keeps them busy when slides differ in cost
+    chunk_size = max(1, -(-slide_count // (jobs * 4)))
+    tasks = [
+        (start, min(start + chunk_size, slide_count), issues_only)
+        for start in range(0, slide_count, chunk_size)
+    ]
 
-    # Convert ShapeData objects to dictionaries
     dict_inventory: InventoryDict = {}
-    for slide_key, shapes in inventory.items():
-        dict_inventory[slide_key] = {
-            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
-        }
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_inventory_worker,
+        initargs=(str(pptx_path), engine),
+    ) as pool:
+        for records in pool.map(_inventory_slide_range, tasks):
+            for slide_idx, shapes in records:
+                dict_inventory[f"slide-{slide_idx}"] = shapes
 
     return dict_inventory
 
@@ -1012,8 +1756,13 @@ def save_inventory(inventory: InventoryData, output_path: Path) -> None:
             shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
         }
 
+    save_inventory_dict(json_inventory, output_path)
+
+
+def save_inventory_dict(inventory: InventoryDict, output_path: Path) -> None:
+    """Save an inventory that is already JSON-serializable."""
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(json_inventory, f, indent=2, ensure_ascii=False)
+        json.dump(inventory, f, indent=2, ensure_ascii=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Text measurement and line wrapping for overflow estimation.
+
+Lines are split into break units: space-separated words, and single characters
+inside CJK runs, where a line may break between any two characters. Unit widths
+are cached per font, line widths come from cumulative width arrays, and wrapping
+is a single greedy pass, so a line costs O(n) instead of re-measuring every
+growing prefix. Latin text wraps exactly where word-by-word measurement with
+PIL would; CJK ideographs are measured as one em each (full width), so
+estimates stay sensible even when no CJK font is installed.
+
+Main Functions:
+    get_measurer: Return the cached TextMeasurer for a PIL font
+    wrap_line: Wrap one line of text to a maximum width
+"""
+
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Tuple
+
+# Characters that break like ideographs (UAX #14 classes ID/CJ, roughly)
+CJK_RANGES = (
+    (0x1100, 0x11FF),  # Hangul Jamo
+    (0x2E80, 0x2FDF),  # CJK radicals
+    (0x2FF0, 0x303F),  # Ideographic description, CJK symbols and punctuation
+    (0x3040, 0x30FF),  # Hiragana, Katakana
+    (0x3100, 0x31FF),  # Bopomofo, Hangul compatibility Jamo, Katakana ext.
+    (0x3200, 0x9FFF),  # Enclosed CJK, CJK unified ideographs (+ ext. A)
+    (0xA960, 0xA97F),  # Hangul Jamo extended-A
+    (0xAC00, 0xD7FF),  # Hangul syllables
+    (0xF900, 0xFAFF),  # CJK compatibility ideographs
+    (0xFE30, 0xFE4F),  # CJK compatibility forms
+    (0xFF00, 0xFFEF),  # Halfwidth and fullwidth forms
+    (0x20000, 0x3FFFF),  # CJK unified ideographs ext. B and later
+)
+
+# Characters that may not start a line (kinsoku shori) ...
+NO_BREAK_BEFORE = set(
+    "!%),.:;?]}¢°·'\"’”…‥、。〃々〉》」』】〕〗〙〛〜ぁぃぅぇぉっゃゅょゎゕゖ"
+    "ァィゥェォッャュョヮヵヶ・ーヽヾ！％），．：；？］｝｡｣､･ｰ￠"
+)
+# ... and characters that may not end one
+NO_BREAK_AFTER = set("$([{£¥‘“〈《「『【〔〖〘〚（［｛｢￡￥")
+
+
+def is_cjk(char: str) -> bool:
+    """Check whether a character is an ideograph or other full-width CJK glyph."""
+    code = ord(char)
+    return any(start <= code <= end for start, end in CJK_RANGES)
+
+
+class TextMeasurer:
+    """Cached text widths for one PIL font."""
+
+    def __init__(self, font):
+        self.font = font
+        # Full-width advance; PIL's bitmap default font has no size attribute
+        self.em = float(getattr(font, "size", 0) or self._measure("M"))
+        self.space_width = self._measure(" ")
+        self._widths = {}
+
+    def _measure(self, text: str) -> float:
+        return float(self.font.getlength(text))
+
+    def width(self, text: str) -> float:
+        """Return the advance width of a break unit."""
+        width = self._widths.get(text)
+        if width is None:
+            if text and all(is_cjk(char) for char in text):
+                width = self.em * len(text)
+            else:
+                width = 0.0
+                for run, cjk in _runs(text):
+                    width += self.em * len(run) if cjk else self._measure(run)
+            self._widths[text] = width
+        return width
+
+
+@lru_cache(maxsize=256)
+def get_measurer(font) -> TextMeasurer:
+    """Return the measurer for a font; fonts are memoized, so are measurers."""
+    return TextMeasurer(font)
+
+
+def _runs(text: str) -> List[Tuple[str, bool]]:
+    """Split text into (run, is_cjk) runs."""
+    runs: List[Tuple[str, bool]] = []
+    for char in text:
+        cjk = is_cjk(char)
+        if runs and runs[-1][1] == cjk:
+            runs[-1] = (runs[-1][0] + char, cjk)
+        else:
+            runs.append((char, cjk))
+    return runs
+
+
+def break_units(line: str) -> List[Tuple[str, str]]:
+    """Split a line into (separator, text) break units.
+
+    Words are separated by single spaces (consecutive spaces give empty units,
+    as with str.split). Inside a word, each CJK character is its own unit with
+    an empty separator, except that punctuation which may not start or end a
+    line stays attached to its neighbour.
+    """
+    units: List[Tuple[str, str]] = []
+    for word_index, word in enumerate(line.split(" ")):
+        separator = " " if word_index else ""
+        pieces: List[str] = []
+        for run, cjk in _runs(word) or [("", False)]:
+            pieces.extend(run if cjk else [run])
+
+        # Merge pieces that kinsoku rules keep together
+        merged: List[str] = []
+        for piece in pieces:
+            if merged and (
+                piece[:1] in NO_BREAK_BEFORE
+                or merged[-1][-1:] in NO_BREAK_AFTER
+                or not (is_cjk(piece[0]) or is_cjk(merged[-1][-1]))
+            ):
+                merged[-1] += piece
+            else:
+                merged.append(piece)
+
+        for piece_index, piece in enumerate(merged):
+            units.append((separator if piece_index == 0 else "", piece))
+    return units
+
+
+def cumulative_widths(units: List[Tuple[str, str]], measurer: TextMeasurer) -> List[float]:
+    """Return prefix sums of unit widths, separators included."""
+    return [0.0] + list(
+        accumulate(
+            (measurer.space_width if separator else 0.0) + measurer.width(text)
+            for separator, text in units
+        )
+    )
+
+
+def wrap_line(line: str, max_width: float, measurer: TextMeasurer) -> List[str]:
+    """Wrap a single line of text to fit within max_width.
+
+    Greedy: each unit goes on the current line if the line still fits,
+    otherwise it starts a new line. A unit wider than max_width gets a line of
+    its own rather than being split.
+    """
+    if not line:
+        return [""]
+
+    units = break_units(line)
+    prefix = cumulative_widths(units, measurer)
+    if prefix[-1] <= max_width:
+        return [line]
+
+    wrapped = []
+    current = ""
+    start = 0  # Index of the first unit on the current line
+    for index, (separator, text) in enumerate(units):
+        if not current:
+            # Nothing visible yet: the line starts here, without a separator
+            start = index
+            current = text
+            continue
+        # Width of units start..index, minus the separator before the first
+        first_separator = measurer.space_width if units[start][0] else 0.0
+        width = prefix[index + 1] - prefix[start] - first_separator
+        if width <= max_width:
+            current += separator + text
+        else:
+            wrapped.append(current)
+            start = index
+            current = text
+
+    if current:
+        wrapped.append(current)
+    return wrapped
@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+Warm headless LibreOffice instances for document conversion and recalculation.
+
+Starting soffice costs seconds, so instead of one `soffice --headless` process
+per document, jobs are sent over UNO to instances that stay running. Each
+instance has its own user profile directory and pipe name, so several can run
+side by side. Instances are started on first use and live as long as the
+process; `python soffice_pool.py start` starts a shared pool that later runs
+(of this or any other script using this module) connect to instead.
+
+Where the `uno` module is missing (it ships with LibreOffice's Python bindings,
+e.g. python3-uno) or an instance cannot be started, conversions fall back to
+spawning `soffice --headless --convert-to` as before.
+
+This module is kept identical in pptx/scripts, pptx/ooxml/scripts and xlsx.
+
+Usage:
+    python soffice_pool.py start [--size N]
+    python soffice_pool.py status [--size N]
+    python soffice_pool.py stop [--size N]
+
+Main Functions:
+    convert: Convert a document with a warm instance, or by spawning soffice
+    get_pool: Return the process-wide pool, or None where UNO is unavailable
+"""
+
+import argparse
+import atexit
+import getpass
+import itertools
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.connection import NoConnectException
+    from com.sun.star.lang import DisposedException
+    from com.sun.star.uno import Exception as UnoException
+except ImportError:  # LibreOffice's Python bindings are not installed
+    uno = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+STARTUP_TIMEOUT = 30  # Seconds to wait for a new instance to accept connections
+DEFAULT_TIMEOUT = 120  # Seconds per job unless the caller gives a timeout
+SHARED_POOL_SIZE = 2  # Instances started by `soffice_pool.py start`
+
+# PDF export filter for each kind of document
+PDF_FILTERS = {
+    "com.sun.star.presentation.PresentationDocument": "impress_pdf_Export",
+    "com.sun.star.sheet.SpreadsheetDocument": "calc_pdf_Export",
+    "com.sun.star.text.TextDocument": "writer_pdf_Export",
+    "com.sun.star.drawing.DrawingDocument": "draw_pdf_Export",
+}
+
+_pool: Optional["OfficePool"] = None
+_pool_lock = threading.Lock()
+
+
+class ConversionError(RuntimeError):
+    """A document could not be loaded, converted or stored."""
+
+
+class OfficeUnavailable(ConversionError):
+    """No LibreOffice instance could be started or reached."""
+
+
+def _properties(**values):
+    """Return a tuple of UNO PropertyValues."""
+    properties = []
+    for name, value in values.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        properties.append(prop)
+    return tuple(properties)
+
+
+def _cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "office-skills"
+
+
+def _shared_pipe_name(index: int) -> str:
+    return f"office-skills-{getpass.getuser()}-{index}"
+
+
+def _claim_profile():
+    """Return (profile_dir, lock) for a private instance's user profile.
+
+    LibreOffice sets up a new profile on first start, which is slow, so
+    profiles are kept under the cache directory and reused, one per slot. The
+    returned open lock file keeps other processes off the profile until it is
+    closed.
+    """
+    for slot in itertools.count():
+        profile_dir = _cache_dir() / f"soffice-private-{slot}"
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        lock = open(profile_dir.with_name(f"{profile_dir.name}.lock"), "w")
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(lock.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock.close()  # In use by another instance
+            continue
+        return profile_dir, lock
+
+
+class OfficeInstance:
+    """One headless soffice reached over a named pipe."""
+
+    def __init__(self, pipe_name: str, process=None):
+        self.pipe_name = pipe_name
+        self.process = process  # None for an instance this process did not start
+        self.profile_lock = None  # Lock on a private profile, released on close
+        self.desktop = None
+
+    @classmethod
+    def start(
+        cls, pipe_name: str, profile_dir: Path, detach=False, timeout=STARTUP_TIMEOUT
+    ):
+        """Start soffice with its own profile and wait until it accepts connections."""
+        process = subprocess.Popen(
+            [
+                "soffice",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                "--nolockcheck",
+                f"-env:UserInstallation={profile_dir.as_uri()}",
+                f"--accept=pipe,name={pipe_name};urp;StarOffice.ComponentContext",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=detach,
+        )
+        instance = cls(pipe_name, None if detach else process)
+        deadline = time.monotonic() + timeout
+        while not instance.connect():
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                raise OfficeUnavailable("LibreOffice did not start")
+            time.sleep(0.1)
+        return instance
+
+    def connect(self) -> bool:
+        """Connect to the instance's pipe; False if nothing is listening."""
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        try:
+            context = resolver.resolve(
+                f"uno:pipe,name={self.pipe_name};urp;StarOffice.ComponentContext"
+            )
+        except NoConnectException:
+            return False
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+        return True
+
+    def _load(self, path: Path):
+        document = self.desktop.loadComponentFromURL(
+            Path(path).absolute().as_uri(), "_blank", 0, _properties(Hidden=True)
+        )
+        if document is None:
+            raise ConversionError(f"LibreOffice could not open {path}")
+        return document
+
+    def convert(self, path: Path, output_path: Path, filter_name: Optional[str]):
+        document = self._load(path)
+        try:
+            if not filter_name:
+                filter_name = next(
+                    (f for s, f in PDF_FILTERS.items() if document.supportsService(s)),
+                    None,
+                )
+                if filter_name is None:
+                    raise ConversionError(f"No PDF export for {path}")
+            document.storeToURL(
+                output_path.absolute().as_uri(), _properties(FilterName=filter_name)
+            )
+        finally:
+            document.close(True)
+
+    def recalc(self, path: Path):
+        document = self._load(path)
+        try:
+            document.calculateAll()
+            document.store()
+        finally:
+            document.close(True)
+
+    def kill(self):
+        if self.process is not None:
+            self.process.kill()
+            self.process.wait()
+        self._release_profile()
+
+    def close(self):
+        """Shut down an instance this process started."""
+        if self.process is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self._release_profile()
+
+    def _release_profile(self):
+        # The profile itself is kept so the next instance starts quickly
+        if self.profile_lock is not None:
+            self.profile_lock.close()
+            self.profile_lock = None
+
+
+class OfficePool:
+    """Up to `size` warm instances, each running one job at a time.
+
+    Running instances of the shared pool are used when found; otherwise
+    private instances are started on demand and shut down by close().
+    """
+
+    def __init__(self, size: int = 1):
+        self.size = max(1, size)
+        self._idle: "queue.Queue[OfficeInstance]" = queue.Queue()
+        self._instances: List[OfficeInstance] = []
+        self._lock = threading.Lock()
+
+        for index in range(self.size):
+            shared = OfficeInstance(_shared_pipe_name(index))
+            if shared.connect():
+                self._instances.append(shared)
+                self._idle.put(shared)
+
+    def _acquire(self, deadline: float) -> OfficeInstance:
+        """Return an idle instance, starting one if the pool is not full yet.
+
+        Raises subprocess.TimeoutExpired if no instance is ready by deadline, a
+        time.monotonic() value.
+        """
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                start = len(self._instances) < self.size
+                if start:
+                    self._instances.append(None)  # Reserve the slot
+            if start:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired("soffice", 0)
+            try:
+                return self._idle.get(timeout=min(1, remaining))
+            except queue.Empty:
+                continue  # Re-check: a broken instance may have left the pool
+
+        profile_dir, profile_lock = _claim_profile()
+        try:
+            startup_timeout = min(STARTUP_TIMEOUT, deadline - time.monotonic())
+            try:
+                instance = OfficeInstance.start(
+                    f"soffice-pool-{os.getpid()}-{profile_dir.name}",
+                    profile_dir,
+                    timeout=startup_timeout,
+                )
+            except OfficeUnavailable as e:
+                if time.monotonic() >= deadline:
+                    # Cut short by the caller's timeout, not a failed start
+                    raise subprocess.TimeoutExpired("soffice", startup_timeout) from e
+                raise
+        except BaseException:
+            profile_lock.close()
+            with self._lock:
+                self._instances.remove(None)
+            raise
+        instance.profile_lock = profile_lock
+        with self._lock:
+            self._instances[self._instances.index(None)] = instance
+        return instance
+
+    def _discard(self, instance: OfficeInstance):
+        with self._lock:
+            if instance in self._instances:
+                self._instances.remove(instance)
+        instance.kill()
+
+    def _run(self, job, timeout: Optional[float]):
+        """Run job(instance) on an idle instance, giving up after timeout seconds.
+
+        The timeout includes waiting for an idle instance or starting one.
+        """
+        timeout = timeout or DEFAULT_TIMEOUT
+        deadline = time.monotonic() + timeout
+        instance = self._acquire(deadline)
+        outcome = {}
+
+        def target():
+            try:
+                outcome["result"] = job(instance)
+            except ConversionError as e:
+                outcome["error"] = e
+            except DisposedException as e:
+                outcome["broken"] = e
+            except UnoException as e:
+                # LibreOffice rejected the document; the instance is fine
+                outcome["error"] = ConversionError(e.Message or type(e).__name__)
+            except BaseException as e:
+                outcome["broken"] = e
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        thread.join(max(0, deadline - time.monotonic()))
+        if thread.is_alive():
+            # A hung instance is killed (if ours) and never reused
+            self._discard(instance)
+            raise subprocess.TimeoutExpired("soffice", timeout)
+
+        if "broken" in outcome:
+            # The bridge itself failed (e.g. the instance crashed)
+            self._discard(instance)
+            raise ConversionError(str(outcome["broken"])) from outcome["broken"]
+        self._idle.put(instance)
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome.get("result")
+
+    def convert(self, path, out_dir, target="pdf", timeout=None) -> Path:
+        """Convert a document like `soffice --convert-to target --outdir out_dir`.
+
+        target is an extension optionally followed by a filter name, e.g.
+        "pdf" or "html:impress_html_Export". Returns the output path.
+        """
+        extension, _, filter_name = target.partition(":")
+        if not filter_name and extension != "pdf":
+            raise ValueError(f"Give an export filter for {extension}, e.g. html:HTML")
+        output_path = Path(out_dir) / f"{Path(path).stem}.{extension}"
+        self._run(
+            lambda instance: instance.convert(Path(path), output_path, filter_name),
+            timeout,
+        )
+        return output_path
+
+    def recalc(self, path, timeout=None):
+        """Recalculate all formulas of a spreadsheet and save it in place."""
+        self._run(lambda instance: instance.recalc(Path(path)), timeout)
+
+    def close(self):
+        with self._lock:
+            instances, self._instances = self._instances, []
+        for instance in instances:
+            if instance is not None:
+                instance.close()
+
+    def __enter__(self) -> "OfficePool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def get_pool(size: Optional[int] = None) -> Optional[OfficePool]:
+    """Return the process-wide pool, or None where UNO is unavailable.
+
+    The pool can hold up to `size` instances (default 1); asking again with a
+    larger size grows it. Setting SOFFICE_POOL=0 disables the pool.
+    """
+    global _pool
+    if uno is None or os.environ.get("SOFFICE_POOL") == "0":
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = OfficePool(size or 1)
+            atexit.register(_pool.close)
+        elif size and size > _pool.size:
+            _pool.size = size
+        return _pool
+
+
+def spawn_convert(path, out_dir, target="pdf", timeout=None) -> Path:
+    """Convert a document with a one-off `soffice --headless --convert-to`."""
+    path = Path(path)
+    result = subprocess.run(
+        [
+            "soffice",
+            "--headless",
+            "--convert-to",
+            target,
+            "--outdir",
+            str(out_dir),
+            str(path),
+        ],
+        capture_output=True,
+        timeout=timeout,
+        text=True,
+    )
+    output_path = Path(out_dir) / f"{path.stem}.{target.partition(':')[0]}"
+    if result.returncode != 0 or not output_path.exists():
+        raise ConversionError(result.stderr.strip() or f"Could not convert {path}")
+    return output_path
+
+
+def convert(path, out_dir, target="pdf", timeout=None) -> Path:
+    """Convert a document with a warm instance, falling back to spawning soffice.
+
+    Raises ConversionError if the conversion fails, FileNotFoundError if
+    LibreOffice is not installed and subprocess.TimeoutExpired on timeout.
+    """
+    if shutil.which("soffice") is None:
+        raise FileNotFoundError("soffice")
+    pool = get_pool()
+    extension, _, filter_name = target.partition(":")
+    deadline = time.monotonic() + timeout if timeout else None
+    if pool is not None and (filter_name or extension == "pdf"):
+        try:
+            return pool.convert(path, out_dir, target, timeout)
+        except OfficeUnavailable:
+            pass  # No instance would start; try a one-off process instead
+        if deadline is not None:
+            # The failed start counts against the caller's timeout
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired("soffice", timeout)
+            timeout = remaining
+    return spawn_convert(path, out_dir, target, timeout)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Manage a shared pool of warm headless LibreOffice instances."
+    )
+    parser.add_argument("command", choices=["start", "status", "stop"])
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=SHARED_POOL_SIZE,
+        help=f"Number of instances (default: {SHARED_POOL_SIZE})",
+    )
+    args = parser.parse_args()
+
+    if uno is None:
+        print("Error: LibreOffice's Python bindings (uno) are not installed")
+        sys.exit(1)
+
+    for index in range(args.size):
+        instance = OfficeInstance(_shared_pipe_name(index))
+        running = instance.connect()
+        if args.command == "start":
+            if not running:
+                profile_dir = _cache_dir() / f"soffice-profile-{index}"
+                profile_dir.mkdir(parents=True, exist_ok=True)
+                OfficeInstance.start(instance.pipe_name, profile_dir, detach=True)
+            print(f"  {instance.pipe_name}: running")
+        elif args.command == "status":
+            print(f"  {instance.pipe_name}: {'running' if running else 'stopped'}")
+        elif running:
+            try:
+                instance.desktop.terminate()
+            except Exception:
+                pass  # The bridge drops as the instance exits
+            print(f"  {instance.pipe_name}: stopped")
+
+
+if __name__ == "__main__":
+    main()
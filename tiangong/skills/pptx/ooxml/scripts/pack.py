@@ -3,29 +3,82 @@
 Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
 
 Example usage:
-    python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> [--force] [--jobs N]
+        [--keep-duplicate-media] [--image-dpi DPI]
 """
 
 import argparse
-import shutil
+import hashlib
+import os
+import posixpath
 import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
 import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import lxml.etree
+import soffice_pool
+
+# Parts that are already compressed gain nothing from deflate; store them as-is
+STORED_EXTENSIONS = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".wdp",
+    ".mp3",
+    ".m4a",
+    ".mp4",
+    ".m4v",
+    ".mov",
+    ".zip",
+}
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+CONTENT_TYPES_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/content-types"
+RELATIONSHIPS_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+XML_PARSER = lxml.etree.XMLParser(
+    resolve_entities=False, no_network=True, huge_tree=True
+)
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for condensing XML parts (0 = all CPUs)",
+    )
+    parser.add_argument(
+        "--keep-duplicate-media",
+        action="store_true",
+        help="Do not merge media parts with identical content",
+    )
+    parser.add_argument(
+        "--image-dpi",
+        type=int,
+        help="Downscale and recompress images larger than needed at this DPI",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            jobs=args.jobs,
+            dedupe_media=not args.keep_duplicate_media,
+            image_dpi=args.image_dpi,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +95,30 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(
+    input_dir,
+    output_file,
+    validate=False,
+    jobs=1,
+    compresslevel=None,
+    dedupe_media=True,
+    image_dpi=None,
+):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        jobs: Worker processes used to condense XML parts; 1 packs
+            serially, 0 or None uses all CPUs. Output is byte-identical
+            regardless of the number of jobs.
+        compresslevel: zlib compression level for deflated parts
+            (default: zlib's default level)
+        dedupe_media: If True, media parts with identical bytes are merged
+            into one part and relationships are pointed at it (default: True)
+        image_dpi: If set, PNG/JPEG media is downscaled to this resolution at
+            its rendered size and recompressed (see optimize_images.py)
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,32 +131,203 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    if not jobs:
+        jobs = os.cpu_count() or 1
+    if compresslevel is None:
+        compresslevel = zlib.Z_DEFAULT_COMPRESSION
+
+    # Stream each part straight into the zip; the source tree is never copied.
+    # Parts are condensed independently, possibly in worker processes, and
+    # compressed and written by this process in a fixed member order.
+    parts = iter_parts(input_dir)
+    replaced = {}
+    merged = {}
+    if dedupe_media:
+        parts, replaced, merged = dedupe_media_parts(parts)
+    if image_dpi:
+        # Imported here so Pillow is only needed when images are optimized
+        from optimize_images import recompress_images
+
+        replaced.update(
+            recompress_images(
+                input_dir,
+                dpi=image_dpi,
+                jobs=jobs,
+                part_names=[part_name for part_name, _ in parts],
+                merged=merged,
+            )
+        )
+    tasks = [(path, part_name, replaced.get(part_name)) for part_name, path in parts]
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
+        if jobs > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+                for info, data in pool.map(
+                    _prepare_task, tasks, chunksize=max(1, len(tasks) // (jobs * 4))
+                ):
+                    zf.writestr(info, data, compresslevel=compresslevel)
+        else:
+            for task in tasks:
+                info, data = _prepare_task(task)
+                zf.writestr(info, data, compresslevel=compresslevel)
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
+def iter_parts(input_dir):
+    """Return (part_name, path) for every file, [Content_Types].xml first.
+
+    Office applications expect the content types part to be the first zip
+    member; the remaining parts follow in sorted order so output is stable.
+    """
+    parts = sorted(
+        (path.relative_to(input_dir).as_posix(), path)
+        for path in input_dir.rglob("*")
+        if path.is_file()
+    )
+    parts.sort(key=lambda part: part[0] != CONTENT_TYPES_PART)
+    return parts
+
+
+def dedupe_media_parts(parts):
+    """Merge media parts that have identical content.
+
+    Parts in a media folder (ppt/media, word/media, xl/media) are grouped by
+    extension and SHA-256 digest. The first part of each group in member order
+    is kept; relationships that target the others are rewritten to point at
+    it, and their [Content_Types].xml overrides are dropped.
+
+    Args:
+        parts: (part_name, path) list as returned by iter_parts
+
+    Returns:
+        tuple: (remaining parts, {part_name: rewritten XML bytes},
+        {merged part_name: part_name it was merged into})
+    """
+    kept = {}
+    duplicates = {}  # duplicate part name -> part name it is merged into
+    for part_name, path in parts:
+        if posixpath.basename(posixpath.dirname(part_name)) != "media":
+            continue
+        key = (path.suffix.lower(), _file_digest(path))
+        if key in kept:
+            duplicates[part_name] = kept[key]
+        else:
+            kept[key] = part_name
+
+    if not duplicates:
+        return parts, {}, {}
+
+    replaced = {}
+    for part_name, path in parts:
+        if part_name.endswith(".rels"):
+            data = _retarget_relationships(path.read_bytes(), part_name, duplicates)
+        elif part_name == CONTENT_TYPES_PART:
+            data = _drop_content_type_overrides(path.read_bytes(), duplicates)
+        else:
+            continue
+        if data is not None:
+            replaced[part_name] = data
+
+    remaining = [part for part in parts if part[0] not in duplicates]
+    return remaining, replaced, duplicates
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _retarget_relationships(data, rels_name, duplicates):
+    """Point relationships at merged media parts; None if nothing changed."""
+    # ppt/slides/_rels/slide1.xml.rels describes ppt/slides/slide1.xml
+    source_dir = posixpath.dirname(posixpath.dirname(rels_name))
+    root = lxml.etree.fromstring(data, XML_PARSER)
+    changed = False
+    for rel in root.iter(f"{{{RELATIONSHIPS_NAMESPACE}}}Relationship"):
+        target = rel.get("Target")
+        if not target or rel.get("TargetMode") == "External":
+            continue
+        if target.startswith("/"):
+            resolved = posixpath.normpath(target.lstrip("/"))
+        else:
+            resolved = posixpath.normpath(posixpath.join(source_dir, target))
+        if resolved not in duplicates:
+            continue
+
+        canonical = duplicates[resolved]
+        if target.startswith("/"):
+            rel.set("Target", "/" + canonical)
+        else:
+            rel.set("Target", posixpath.relpath(canonical, source_dir or "."))
+        changed = True
+
+    if not changed:
+        return None
+    return lxml.etree.tostring(
+        root.getroottree(),
+        xml_declaration=True,
+        encoding="UTF-8",
+        standalone=root.getroottree().docinfo.standalone,
+    )
+
+
+def _drop_content_type_overrides(data, duplicates):
+    """Remove overrides for merged media parts; None if nothing changed."""
+    root = lxml.etree.fromstring(data, XML_PARSER)
+    removed = False
+    for override in root.findall(f"{{{CONTENT_TYPES_NAMESPACE}}}Override"):
+        if override.get("PartName", "").lstrip("/") in duplicates:
+            _remove_preserving_tail(override)
+            removed = True
+
+    if not removed:
+        return None
+    return lxml.etree.tostring(
+        root.getroottree(),
+        xml_declaration=True,
+        encoding="UTF-8",
+        standalone=root.getroottree().docinfo.standalone,
+    )
+
+
+def prepare_part(path, part_name, data=None):
+    """Condense one part, ready to be written as a zip member.
+
+    Args:
+        path: Source file of the part
+        part_name: Member name inside the package
+        data: Replacement content for the part (read from path if None)
+
+    Returns a (ZipInfo, data) tuple for ZipFile.writestr: already-compressed
+    media is marked to be stored as-is, everything else to be deflated.
+    """
+    if data is None:
+        data = path.read_bytes()
+    if path.name.endswith((".xml", ".rels")):
+        data = condense_xml_bytes(data)
+
+    info = zipfile.ZipInfo.from_file(path, part_name)
+    if path.suffix.lower() in STORED_EXTENSIONS:
+        info.compress_type = zipfile.ZIP_STORED
+    else:
+        info.compress_type = zipfile.ZIP_DEFLATED
+    return info, data
+
+
+def _prepare_task(task):
+    return prepare_part(*task)
+
+
 def validate_document(doc_path):
     """Validate document by converting to HTML with soffice."""
     # Determine the correct filter based on file extension
@@ -100,25 +341,13 @@ def validate_document(doc_path):
 
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
-            result = subprocess.run(
-                [
-                    "soffice",
-                    "--headless",
-                    "--convert-to",
-                    filter_name,
-                    "--outdir",
-                    temp_dir,
-                    str(doc_path),
-                ],
-                capture_output=True,
-                timeout=10,
-                text=True,
-            )
-            if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
-                error_msg = result.stderr.strip() or "Document validation failed"
-                print(f"Validation error: {error_msg}", file=sys.stderr)
-                return False
+            # A warm LibreOffice instance where available, else a new process
+            soffice_pool.convert(doc_path, temp_dir, filter_name, timeout=10)
             return True
+        except soffice_pool.ConversionError as e:
+            error_msg = str(e) or "Document validation failed"
+            print(f"Validation error: {error_msg}", file=sys.stderr)
+            return False
         except FileNotFoundError:
             print("Warning: soffice not found. Skipping validation.", file=sys.stderr)
             return True
@@ -132,27 +361,54 @@ def validate_document(doc_path):
 
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
+    xml_file = Path(xml_file)
+    xml_file.write_bytes(condense_xml_bytes(xml_file.read_bytes()))
 
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
+
+def condense_xml_bytes(data):
+    """Return serialized XML with pretty-printing whitespace and comments removed.
+
+    Whitespace-only text is dropped everywhere except inside text elements
+    (w:t, a:t, t, ...), whose content is significant.
+    """
+    tree = lxml.etree.ElementTree(lxml.etree.fromstring(data, XML_PARSER))
+    strip_formatting(tree.getroot())
+    return lxml.etree.tostring(
+        tree,
+        xml_declaration=True,
+        encoding="UTF-8",
+        standalone=tree.docinfo.standalone,
+    )
+
+
+def strip_formatting(root, remove_comments=True):
+    """Remove whitespace-only text outside text elements (and comments) in place."""
+    if remove_comments:
+        for comment in root.xpath("//comment()"):
+            _remove_preserving_tail(comment)
+
+    for element in root.iter(lxml.etree.Element):
+        if lxml.etree.QName(element).localname == "t":
             continue
+        if element.text is not None and element.text.strip() == "":
+            element.text = None
+        for child in element:
+            if child.tail is not None and child.tail.strip() == "":
+                child.tail = None
+
 
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+def _remove_preserving_tail(node):
+    """Remove a node, keeping the text that follows it in its parent."""
+    parent = node.getparent()
+    if parent is None:
+        return
+    if node.tail:
+        previous = node.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + node.tail
+        else:
+            parent.text = (parent.text or "") + node.tail
+    parent.remove(node)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Font lookup and loading for text measurement.
+
+Font files are indexed once per process: the platform font directories are
+walked a single time and, where fontconfig is installed, `fc-list` supplies
+family names. The index is kept in a module-level cache and snapshotted to disk
+(under $XDG_CACHE_HOME or ~/.cache) so later runs skip the scan until a font
+directory changes. Loaded ImageFont objects are memoized per (path, size).
+
+Main Functions:
+    find_font_path: Resolve a font name (e.g. 'Arial') to a font file
+    get_font: Return a PIL font for a font name and size
+"""
+
+import json
+import os
+import platform
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PIL import ImageFont
+
+SNAPSHOT_VERSION = 1
+
+# Styles preferred when fontconfig lists several files for one family
+REGULAR_STYLES = ("regular", "book", "normal", "roman", "medium")
+
+_index: Optional["FontIndex"] = None
+
+
+def font_directories() -> Tuple[List[Path], List[str]]:
+    """Return the font directories and file extensions for this platform."""
+    if platform.system() == "Darwin":  # macOS
+        font_dirs = [
+            "/System/Library/Fonts/",
+            "/Library/Fonts/",
+            "~/Library/Fonts/",
+        ]
+        extensions = [".ttf", ".otf", ".ttc", ".dfont"]
+    else:  # Linux
+        font_dirs = [
+            "/usr/share/fonts/truetype/",
+            "/usr/local/share/fonts/",
+            "~/.fonts/",
+        ]
+        extensions = [".ttf", ".otf"]
+    return [Path(font_dir).expanduser() for font_dir in font_dirs], extensions
+
+
+class FontIndex:
+    """Font files by file name and by fontconfig family name."""
+
+    def __init__(
+        self,
+        files: List[Tuple[str, str]],
+        families: Dict[str, str],
+        signature: List[List],
+    ):
+        self.files = files  # (lowercase file name, path) in directory order
+        self.families = families  # lowercase family name -> path
+        self.signature = signature  # Directory mtimes the index was built from
+        self._by_name = {name: path for name, path in reversed(files)}
+
+    @classmethod
+    def build(cls) -> "FontIndex":
+        """Scan the font directories and fontconfig."""
+        font_dirs, extensions = font_directories()
+        files = []
+        for font_dir in font_dirs:
+            if not font_dir.is_dir():
+                continue
+            # Top-level files first, then subdirectories, as in a direct lookup
+            top_level, nested = [], []
+            for root, dirs, filenames in os.walk(font_dir):
+                dirs.sort()
+                for filename in sorted(filenames):
+                    if filename.lower().endswith(tuple(extensions)):
+                        entry = (filename.lower(), os.path.join(root, filename))
+                        (top_level if root == str(font_dir) else nested).append(entry)
+            files.extend(top_level + nested)
+        return cls(files, _fontconfig_families(), _directory_signature(font_dirs))
+
+    def find(self, font_name: str) -> Optional[str]:
+        """Return the path of the best matching font file, or None."""
+        _, extensions = font_directories()
+
+        # First try exact file name matches
+        for variant in (
+            font_name,
+            font_name.lower(),
+            font_name.replace(" ", ""),
+            font_name.replace(" ", "-"),
+        ):
+            for ext in extensions:
+                path = self._by_name.get(f"{variant}{ext}".lower())
+                if path:
+                    return path
+
+        # Then the family names reported by fontconfig
+        path = self.families.get(font_name.lower())
+        if path:
+            return path
+
+        # Then fuzzy matching - files containing the font name
+        font_name_lower = font_name.lower().replace(" ", "")
+        for file_name, path in self.files:
+            if font_name_lower in file_name:
+                return path
+        return None
+
+    def to_json(self) -> dict:
+        return {
+            "version": SNAPSHOT_VERSION,
+            "signature": self.signature,
+            "files": self.files,
+            "families": self.families,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> Optional["FontIndex"]:
+        if data.get("version") != SNAPSHOT_VERSION:
+            return None
+        return cls(
+            [tuple(entry) for entry in data["files"]],
+            data["families"],
+            data["signature"],
+        )
+
+
+def _fontconfig_families() -> Dict[str, str]:
+    """Map lowercase family names to font files using fc-list, if available."""
+    try:
+        result = subprocess.run(
+            ["fc-list", "--format", "%{family}\t%{style}\t%{file}\n"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+        return {}
+    if result.returncode != 0:
+        return {}
+
+    families: Dict[str, Tuple[int, str]] = {}
+    for line in sorted(result.stdout.splitlines()):
+        parts = line.split("\t")
+        if len(parts) != 3:
+            continue
+        family_names, styles, path = parts
+        style_names = [style.strip().lower() for style in styles.split(",")]
+        # Lower rank is better: regular faces win over bold/italic ones
+        rank = 0 if any(style in REGULAR_STYLES for style in style_names) else 1
+        for family in family_names.split(","):
+            key = family.strip().lower()
+            if key and (key not in families or rank < families[key][0]):
+                families[key] = (rank, path)
+    return {family: path for family, (_, path) in families.items()}
+
+
+def _directory_signature(font_dirs: List[Path]) -> List[List]:
+    """Return the mtimes of the font directories and their subdirectories."""
+    signature = []
+    for font_dir in font_dirs:
+        if not font_dir.is_dir():
+            continue
+        for root, dirs, _ in os.walk(font_dir):
+            dirs.sort()
+            try:
+                signature.append([root, os.stat(root).st_mtime_ns])
+            except OSError:
+                continue
+    return signature
+
+
+def _snapshot_path() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "pptx-skill" / "font-index.json"
+
+
+def get_font_index() -> FontIndex:
+    """Return the process-wide font index, loading or building it once."""
+    global _index
+    if _index is not None:
+        return _index
+
+    font_dirs, _ = font_directories()
+    signature = _directory_signature(font_dirs)
+    snapshot = _snapshot_path()
+    try:
+        index = FontIndex.from_json(json.loads(snapshot.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError):
+        index = None
+
+    if index is None or index.signature != signature:
+        index = FontIndex.build()
+        try:
+            snapshot.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = snapshot.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(json.dumps(index.to_json()), encoding="utf-8")
+            temp_path.replace(snapshot)
+        except OSError:
+            pass  # The snapshot is only an optimization
+
+    _index = index
+    return index
+
+
+@lru_cache(maxsize=None)
+def find_font_path(font_name: str) -> Optional[str]:
+    """Get the font file path for a given font name.
+
+    Args:
+        font_name: Name of the font (e.g., 'Arial', 'Calibri')
+
+    Returns:
+        Path to the font file, or None if not found
+    """
+    return get_font_index().find(font_name)
+
+
+@lru_cache(maxsize=256)
+def load_font(font_path: Optional[str], size: int):
+    """Load a TrueType font, falling back to PIL's default font."""
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size=size)
+        except Exception:
+            pass
+    return ImageFont.load_default()
+
+
+def get_font(font_name: str, size: int):
+    """Return a PIL font for a font name and size (PIL's default if not found)."""
+    return load_font(find_font_path(font_name), size)
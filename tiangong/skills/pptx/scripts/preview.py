@@ -0,0 +1,662 @@
+#!/usr/bin/env python3
+"""
+Render fast, approximate slide previews with Pillow, without LibreOffice.
+
+Slides are drawn straight from their XML: background, shape boxes with their
+fills and outlines (rectangles, rounded rectangles, ellipses and lines), text,
+and the extents of pictures, charts and tables. Text goes through the same font
+index and line wrapping as the inventory's overflow estimate, so text that
+overflows its box in the inventory does so in the preview too. Master and
+layout decorations are drawn under the slide's own shapes; empty placeholders,
+effects, rotation and picture content are not rendered.
+
+Slides render in worker processes, each opening the deck once, so previews are
+cheap enough for layout checks and regression runs over whole libraries.
+
+Usage:
+    python preview.py input.pptx output_dir [--width 960] [--slides 0,3,5] [--jobs N]
+
+Main Functions:
+    render_slide: Render one slide of an XmlPresentation
+    render_slides: Render slides of a deck, in parallel
+"""
+
+import argparse
+import colorsys
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from fonts import find_font_path, load_font
+from inventory import (
+    A_NS,
+    COLOR_TAGS,
+    FILL_TAGS,
+    GEOMETRY,
+    P_NS,
+    SHAPE_TAGS,
+    XmlParagraphData,
+    XmlPresentation,
+    XmlSlide,
+    get_placeholder,
+    get_placeholder_type,
+    get_xfrm_value,
+    master_default_font_size,
+    paragraph_text,
+)
+from measure import get_measurer, is_cjk, wrap_line
+from PIL import Image, ImageDraw, ImageFont
+
+RGB = Tuple[int, int, int]
+Color = Tuple[int, ...]  # RGB, or RGBA for translucent colours
+
+RENDERER_VERSION = 1  # Part of thumbnail cache keys; bump when output changes
+SUPERSAMPLE = 2  # Slides are drawn this much larger, then downscaled
+MIN_SLIDES_PER_JOB = 8  # Fewer slides per worker render faster in-process
+EMU_PER_POINT = 12700
+
+PICTURE_FILL = (217, 217, 217)
+PICTURE_LINE = (166, 166, 166)
+FRAME_FILL = (242, 242, 242)
+FRAME_LINE = (191, 191, 191)
+
+# python-pptx's bodyPr inset defaults, in EMUs
+DEFAULT_INSETS = {"lIns": 91440, "tIns": 45720, "rIns": 91440, "bIns": 45720}
+
+PRESET_COLORS = {"black": (0, 0, 0), "white": (255, 255, 255)}
+
+# Theme font reference suffix per script, as in +mn-lt and +mn-ea
+SCRIPT_SUFFIXES = {"latin": "lt", "ea": "ea"}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render approximate slide previews with Pillow."
+    )
+    parser.add_argument("input", help="Input PowerPoint file (.pptx)")
+    parser.add_argument("output_dir", help="Directory for slide-N.png images")
+    parser.add_argument(
+        "--width", type=int, default=960, help="Image width in pixels (default: 960)"
+    )
+    parser.add_argument(
+        "--slides", help="Comma-separated 0-based slide indices (default: all)"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker processes (default: 0 = all CPUs)",
+    )
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    if not input_path.exists() or input_path.suffix.lower() != ".pptx":
+        print(f"Error: Invalid PowerPoint file: {args.input}")
+        sys.exit(1)
+
+    with XmlPresentation(input_path) as presentation:
+        slide_count = len(presentation.slides)
+    try:
+        slides = (
+            [int(index) for index in args.slides.split(",")]
+            if args.slides
+            else list(range(slide_count))
+        )
+    except ValueError:
+        print(f"Error: Invalid slide list: {args.slides}")
+        sys.exit(1)
+    invalid = [index for index in slides if not 0 <= index < slide_count]
+    if invalid:
+        print(f"Error: Slide indices out of range (0-{slide_count - 1}): {invalid}")
+        sys.exit(1)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    for slide_idx, image in render_slides(input_path, slides, args.width, args.jobs):
+        image.save(output_dir / f"slide-{slide_idx}.png")
+    elapsed = time.perf_counter() - start
+    print(f"Rendered {len(slides)} slide(s) to {output_dir} in {elapsed:.2f}s")
+
+
+@lru_cache(maxsize=256)
+def get_preview_font(font_name: str, size: int):
+    """Return a font from the font index, or Pillow's scalable default font."""
+    path = find_font_path(font_name)
+    if path:
+        return load_font(path, size)
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:  # Pillow < 10.1 has only the bitmap default font
+        return ImageFont.load_default()
+
+
+class Theme:
+    """Colours and fonts of a slide master's theme, with its colour map applied."""
+
+    def __init__(self, presentation: XmlPresentation, master_name: str):
+        master = presentation.part(master_name)
+        theme = presentation.part(presentation.related(master_name, "/theme"))
+        elements = theme.find(f"{A_NS}themeElements")
+
+        scheme: Dict[str, RGB] = {}
+        for color in elements.find(f"{A_NS}clrScheme"):
+            value = color[0].get("lastClr") or color[0].get("val") or "000000"
+            scheme[color.tag[len(A_NS) :]] = _hex(value)
+        self.colors = dict(scheme)
+        clr_map = master.find(f"{P_NS}clrMap")
+        if clr_map is not None:
+            for alias, name in clr_map.attrib.items():
+                if name in scheme:
+                    self.colors[alias] = scheme[name]
+
+        self.fonts: Dict[str, str] = {}
+        font_scheme = elements.find(f"{A_NS}fontScheme")
+        for prefix, tag in (("mj", "majorFont"), ("mn", "minorFont")):
+            for script, suffix in SCRIPT_SUFFIXES.items():
+                font = font_scheme.find(f"{A_NS}{tag}/{A_NS}{script}")
+                if font is not None and font.get("typeface"):
+                    self.fonts[f"+{prefix}-{suffix}"] = font.get("typeface")
+
+        # Background fills referenced by p:bgRef idx 1001 and up
+        fmt_scheme = elements.find(f"{A_NS}fmtScheme")
+        bg_styles = (
+            fmt_scheme.find(f"{A_NS}bgFillStyleLst") if fmt_scheme is not None else None
+        )
+        self.background_styles = list(bg_styles) if bg_styles is not None else []
+
+    def font(self, typeface: Optional[str]) -> Optional[str]:
+        """Resolve theme font references such as +mn-lt."""
+        if typeface and typeface.startswith("+"):
+            return self.fonts.get(typeface)
+        return typeface
+
+    def color(
+        self, element: Any, placeholder: Optional[Color] = None
+    ) -> Optional[Color]:
+        """Return the colour of an a:srgbClr, a:schemeClr, ... element."""
+        tag = element.tag[len(A_NS) :]
+        if tag == "srgbClr":
+            rgb = _hex(element.get("val", "000000"))
+        elif tag == "schemeClr":
+            name = element.get("val")
+            rgb = placeholder if name == "phClr" else self.colors.get(name)
+        elif tag == "sysClr":
+            rgb = _hex(element.get("lastClr") or "000000")
+        elif tag == "prstClr":
+            rgb = PRESET_COLORS.get(element.get("val"), (0, 0, 0))
+        elif tag == "scrgbClr":
+            rgb = tuple(
+                round(int(element.get(name, 0)) * 255 / 100000) for name in "rgb"
+            )
+        else:
+            rgb = None
+        return _modify(rgb, element) if rgb is not None else None
+
+    def fill(self, parent: Any, placeholder: Optional[Color] = None) -> Any:
+        """Return the fill colour under parent, None for no fill, ... if unset.
+
+        Picture fills come out light grey; gradients use their first stop.
+        """
+        if parent is None:
+            return ...
+        for child in parent:
+            if child.tag not in FILL_TAGS:
+                continue
+            tag = child.tag[len(A_NS) :]
+            if tag == "noFill":
+                return None
+            if tag == "solidFill":
+                color = _first(child, COLOR_TAGS)
+                return self.color(color, placeholder) if color is not None else None
+            if tag == "gradFill":
+                stop = child.find(f"{A_NS}gsLst/{A_NS}gs")
+                color = _first(stop, COLOR_TAGS) if stop is not None else None
+                return self.color(color, placeholder) if color is not None else None
+            if tag == "pattFill":
+                color = child.find(f"{A_NS}fgClr")
+                color = _first(color, COLOR_TAGS) if color is not None else None
+                return self.color(color, placeholder) if color is not None else None
+            if tag == "blipFill":
+                return PICTURE_FILL
+            return ...  # grpFill: the group's fill is not tracked
+        return ...
+
+    def style_color(self, shape: Any, ref: str) -> Optional[Color]:
+        """Return the colour of a p:style reference (fillRef, lnRef, fontRef)."""
+        element = shape.find(f"{P_NS}style/{A_NS}{ref}")
+        if element is None or element.get("idx") == "0":
+            return None
+        color = _first(element, COLOR_TAGS)
+        return self.color(color) if color is not None else None
+
+
+def _hex(value: str) -> RGB:
+    try:
+        return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
+    except (ValueError, IndexError):
+        return 0, 0, 0
+
+
+def _first(element: Any, tags: set) -> Any:
+    for child in element:
+        if child.tag in tags:
+            return child
+    return None
+
+
+def _modify(rgb: Color, element: Any) -> Color:
+    """Apply lumMod/lumOff, tint, shade and alpha modifiers to a colour.
+
+    Translucent colours come out as RGBA tuples.
+    """
+    r, g, b = (channel / 255.0 for channel in rgb[:3])
+    alpha = 1.0
+    for modifier in element:
+        name = modifier.tag[len(A_NS) :]
+        value = int(modifier.get("val", 100000)) / 100000.0
+        if name in ("lumMod", "lumOff"):
+            h, l, s = colorsys.rgb_to_hls(r, g, b)
+            l = l * value if name == "lumMod" else l + value
+            r, g, b = colorsys.hls_to_rgb(h, min(1.0, max(0.0, l)), s)
+        elif name == "tint":
+            r, g, b = (c + (1 - c) * (1 - value) for c in (r, g, b))
+        elif name == "shade":
+            r, g, b = (c * value for c in (r, g, b))
+        elif name == "alpha":
+            alpha = value
+    channels = (r, g, b) if alpha >= 1.0 else (r, g, b, alpha)
+    return tuple(round(min(1.0, max(0.0, c)) * 255) for c in channels)
+
+
+def _shape_xfrm_value(shape: Any, name: str) -> Optional[int]:
+    """Read a dimension from a shape's transform; graphic frames have p:xfrm."""
+    if shape.tag != f"{P_NS}graphicFrame":
+        return get_xfrm_value(shape, *GEOMETRY[name])
+    tag, attr = GEOMETRY[name]
+    element = shape.find(f"{P_NS}xfrm/{A_NS}{tag}")
+    return int(element.get(attr)) if element is not None else None
+
+
+class _Transform:
+    """Maps shape coordinates (EMUs) to image pixels, through groups."""
+
+    def __init__(self, scale: float, x: float = 0.0, y: float = 0.0, sx=1.0, sy=1.0):
+        self.scale = scale
+        self.x, self.y = x, y  # Pixel position of the coordinate origin
+        self.sx, self.sy = sx, sy  # Pixels per EMU, as a multiple of scale
+
+    def box(self, left: int, top: int, width: int, height: int):
+        x0 = self.x + left * self.scale * self.sx
+        y0 = self.y + top * self.scale * self.sy
+        return (
+            x0,
+            y0,
+            x0 + width * self.scale * self.sx,
+            y0 + height * self.scale * self.sy,
+        )
+
+    def group(self, group: Any) -> "_Transform":
+        """Return the transform for the children of a p:grpSp."""
+        xfrm = group.find(f"{P_NS}grpSpPr/{A_NS}xfrm")
+        if xfrm is None:
+            return self
+        values = {}
+        for name in ("off", "ext", "chOff", "chExt"):
+            element = xfrm.find(f"{A_NS}{name}")
+            if element is None:
+                return self
+            values[name] = [int(value) for value in element.attrib.values()]
+        (off_x, off_y), (ext_x, ext_y) = values["off"], values["ext"]
+        (ch_x, ch_y), (ch_cx, ch_cy) = values["chOff"], values["chExt"]
+        kx = ext_x / ch_cx if ch_cx else 1.0
+        ky = ext_y / ch_cy if ch_cy else 1.0
+        return _Transform(
+            self.scale,
+            self.x + (off_x - ch_x * kx) * self.scale * self.sx,
+            self.y + (off_y - ch_y * ky) * self.scale * self.sy,
+            self.sx * kx,
+            self.sy * ky,
+        )
+
+
+class SlideRenderer:
+    """Draws the slides of one presentation; themes are read once per master."""
+
+    def __init__(self, presentation: XmlPresentation):
+        self.presentation = presentation
+        self._themes: Dict[str, Theme] = {}
+
+    def theme(self, master_name: str) -> Theme:
+        if master_name not in self._themes:
+            self._themes[master_name] = Theme(self.presentation, master_name)
+        return self._themes[master_name]
+
+    def render(self, slide: XmlSlide, width: int) -> Image.Image:
+        """Render a slide to an RGB image of the given width."""
+        slide_width = self.presentation.slide_width or 9144000
+        slide_height = self.presentation.slide_height or 5143500
+        height = max(1, round(width * slide_height / slide_width))
+        canvas_size = (width * SUPERSAMPLE, height * SUPERSAMPLE)
+        theme = self.theme(slide.master_name)
+
+        parts = [slide.element, slide.layout_element, slide.master_element]
+        background = (255, 255, 255)
+        for part in parts:
+            fill = self._background(part, theme)
+            if fill is not ...:
+                background = fill or background
+                break
+
+        image = Image.new("RGB", canvas_size, background[:3])
+        # RGBA drawing blends translucent fills, lines and text
+        draw = ImageDraw.Draw(image, "RGBA")
+        transform = _Transform(canvas_size[0] / slide_width)
+
+        # Master and layout decorations go under the slide's own shapes
+        show_master = slide.element.get("showMasterSp") != "0"
+        if show_master and slide.layout_element.get("showMasterSp") != "0":
+            self._draw_tree(draw, parts[2], theme, transform, slide, decorations=True)
+        if show_master:
+            self._draw_tree(draw, parts[1], theme, transform, slide, decorations=True)
+        self._draw_tree(draw, parts[0], theme, transform, slide, decorations=False)
+
+        # Box-filter downscaling by a whole factor antialiases edges and text
+        return image.reduce(SUPERSAMPLE)
+
+    def _background(self, part: Any, theme: Theme) -> Any:
+        bg = part.find(f"{P_NS}cSld/{P_NS}bg")
+        if bg is None:
+            return ...
+        bg_pr = bg.find(f"{P_NS}bgPr")
+        if bg_pr is not None:
+            return theme.fill(bg_pr)
+        bg_ref = bg.find(f"{P_NS}bgRef")
+        if bg_ref is None:
+            return ...
+        color = _first(bg_ref, COLOR_TAGS)
+        placeholder = theme.color(color) if color is not None else None
+        index = int(bg_ref.get("idx", 0)) - 1001
+        if 0 <= index < len(theme.background_styles):
+            style = theme.background_styles[index]
+            fill = theme.fill([style], placeholder)
+            if fill is not ...:
+                return fill
+        return placeholder
+
+    def _draw_tree(self, draw, part, theme, transform, slide, decorations):
+        """Draw the shapes of a part's shape tree.
+
+        For layouts and masters (decorations=True) placeholders are skipped.
+        Placeholders at the top of the slide's own tree inherit missing
+        geometry from the layout.
+        """
+        tree = part.find(f"{P_NS}cSld/{P_NS}spTree")
+        if tree is not None:
+            self._draw_shapes(draw, tree, theme, transform, slide, decorations)
+
+    def _draw_shapes(self, draw, tree, theme, transform, slide, decorations):
+        inherits_geometry = not decorations and tree.tag == f"{P_NS}spTree"
+        for shape in tree:
+            if shape.tag not in SHAPE_TAGS:
+                continue
+            if shape.tag == f"{P_NS}grpSp":
+                self._draw_shapes(
+                    draw, shape, theme, transform.group(shape), slide, decorations
+                )
+                continue
+            ph = get_placeholder(shape)
+            if decorations and ph is not None:
+                continue
+
+            geometry = []
+            for name in ("left", "top", "width", "height"):
+                value = _shape_xfrm_value(shape, name)
+                if value is None and ph is not None and inherits_geometry:
+                    value = slide.inherited_geometry(ph, name)
+                geometry.append(value or 0)
+            box = transform.box(*geometry)
+
+            if shape.tag == f"{P_NS}pic":
+                self._draw_picture(draw, box)
+            elif shape.tag == f"{P_NS}graphicFrame":
+                self._draw_frame(draw, shape, box, transform)
+            elif shape.tag == f"{P_NS}cxnSp":
+                self._draw_connector(draw, shape, box, theme, transform)
+            elif shape.tag == f"{P_NS}sp":
+                self._draw_shape(draw, shape, box, theme, transform)
+                self._draw_text(draw, shape, box, theme, transform, slide, ph)
+
+    def _draw_picture(self, draw, box):
+        x0, y0, x1, y1 = box
+        draw.rectangle(box, fill=PICTURE_FILL, outline=PICTURE_LINE, width=SUPERSAMPLE)
+        draw.line([(x0, y0), (x1, y1)], fill=PICTURE_LINE, width=SUPERSAMPLE)
+        draw.line([(x0, y1), (x1, y0)], fill=PICTURE_LINE, width=SUPERSAMPLE)
+
+    def _draw_frame(self, draw, shape, box, transform):
+        """Draw a chart, table or other graphic frame as its extent."""
+        draw.rectangle(box, fill=FRAME_FILL, outline=FRAME_LINE, width=SUPERSAMPLE)
+        table = shape.find(f"{A_NS}graphic/{A_NS}graphicData/{A_NS}tbl")
+        if table is None:
+            return
+        x0, y0, x1, y1 = box
+        x = x0
+        for column in table.iterfind(f"{A_NS}tblGrid/{A_NS}gridCol"):
+            x += int(column.get("w", 0)) * transform.scale * transform.sx
+            if x < x1:
+                draw.line([(x, y0), (x, y1)], fill=FRAME_LINE, width=SUPERSAMPLE)
+        y = y0
+        for row in table.iterfind(f"{A_NS}tr"):
+            y += int(row.get("h", 0)) * transform.scale * transform.sy
+            if y < y1:
+                draw.line([(x0, y), (x1, y)], fill=FRAME_LINE, width=SUPERSAMPLE)
+
+    def _line_style(self, shape, theme, transform):
+        """Return (colour, width in pixels) of a shape's outline, colour None if none."""
+        sp_pr = shape.find(f"{P_NS}spPr")
+        ln = sp_pr.find(f"{A_NS}ln") if sp_pr is not None else None
+        color = theme.fill(ln)
+        if color is ...:
+            color = theme.style_color(shape, "lnRef")
+        width = int(ln.get("w", EMU_PER_POINT)) if ln is not None else EMU_PER_POINT
+        return color, max(1, round(width * transform.scale))
+
+    def _draw_connector(self, draw, shape, box, theme, transform):
+        color, width = self._line_style(shape, theme, transform)
+        if color is None:
+            return
+        x0, y0, x1, y1 = box
+        xfrm = shape.find(f"{P_NS}spPr/{A_NS}xfrm")
+        if xfrm is not None and xfrm.get("flipH") == "1":
+            x0, x1 = x1, x0
+        if xfrm is not None and xfrm.get("flipV") == "1":
+            y0, y1 = y1, y0
+        draw.line([(x0, y0), (x1, y1)], fill=color, width=width)
+
+    def _draw_shape(self, draw, shape, box, theme, transform):
+        sp_pr = shape.find(f"{P_NS}spPr")
+        fill = theme.fill(sp_pr)
+        if fill is ...:
+            fill = theme.style_color(shape, "fillRef")
+        outline, width = self._line_style(shape, theme, transform)
+        if fill is None and outline is None:
+            return
+
+        x0, y0, x1, y1 = box
+        box = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+        geometry = sp_pr.find(f"{A_NS}prstGeom") if sp_pr is not None else None
+        preset = geometry.get("prst") if geometry is not None else "rect"
+        if preset == "line":
+            if outline is not None:
+                draw.line([(x0, y0), (x1, y1)], fill=outline, width=width)
+        elif preset == "ellipse":
+            draw.ellipse(box, fill=fill, outline=outline, width=width)
+        elif preset == "roundRect":
+            radius = min(box[2] - box[0], box[3] - box[1]) * 0.16667
+            draw.rounded_rectangle(
+                box, radius=radius, fill=fill, outline=outline, width=width
+            )
+        else:
+            draw.rectangle(box, fill=fill, outline=outline, width=width)
+
+    def _draw_text(self, draw, shape, box, theme, transform, slide, ph):
+        tx_body = shape.find(f"{P_NS}txBody")
+        if tx_body is None:
+            return
+        paragraphs = list(tx_body.iterchildren(f"{A_NS}p"))
+        if not any(paragraph_text(p).strip() for p in paragraphs):
+            return
+
+        body_pr = tx_body.find(f"{A_NS}bodyPr")
+        insets = {
+            name: int(body_pr.get(name, default)) if body_pr is not None else default
+            for name, default in DEFAULT_INSETS.items()
+        }
+        scale = transform.scale * transform.sx
+        x0, y0, x1, y1 = box
+        left = x0 + insets["lIns"] * scale
+        right = x1 - insets["rIns"] * scale
+        top = y0 + insets["tIns"] * scale
+        bottom = y1 - insets["bIns"] * scale
+        wrap = body_pr is None or body_pr.get("wrap") != "none"
+
+        # Same default size as the inventory: layout placeholder, then master
+        default_size: Optional[float] = None
+        placeholder_type = None
+        if ph is not None:
+            placeholder_type = get_placeholder_type(ph)
+            default_size = slide.layout_default_font_size(placeholder_type)
+        if default_size is None:
+            title = placeholder_type in ("title", "ctrTitle")
+            default_size = master_default_font_size(
+                slide.master_element, "TITLE" if title else None
+            )
+        font_scale = 1.0
+        autofit = body_pr.find(f"{A_NS}normAutofit") if body_pr is not None else None
+        if autofit is not None and autofit.get("fontScale"):
+            font_scale = int(autofit.get("fontScale")) / 100000.0
+        default_color = theme.style_color(shape, "fontRef") or theme.colors.get(
+            "tx1", (0, 0, 0)
+        )
+
+        # Lay out every line first, so the block can be anchored
+        px_per_point = EMU_PER_POINT * scale
+        lines = []  # (text, font, colour, alignment, y offset)
+        y = 0.0
+        for index, p in enumerate(paragraphs):
+            text = paragraph_text(p).replace("\v", "\n")
+            data = XmlParagraphData(p)
+            size = (data.font_size or default_size) * font_scale
+            font = get_preview_font(
+                self._font_name(p, text, theme),
+                max(1, round(size * px_per_point)),
+            )
+            line_height = (data.line_spacing or size) * px_per_point
+            if index > 0 and data.space_before:
+                y += data.space_before * px_per_point
+            if data.bullet and text.strip():
+                text = "• " + text
+            color = self._text_color(p, theme) or default_color
+            for line in text.split("\n"):
+                wrapped = (
+                    wrap_line(line, right - left, get_measurer(font))
+                    if wrap
+                    else [line]
+                )
+                for segment in wrapped:
+                    lines.append((segment, font, color, data.alignment, y))
+                    y += line_height
+            if data.space_after:
+                y += data.space_after * px_per_point
+
+        anchor = body_pr.get("anchor", "t") if body_pr is not None else "t"
+        if anchor == "ctr":
+            top += (bottom - top - y) / 2
+        elif anchor == "b":
+            top = bottom - y
+
+        for segment, font, color, alignment, offset in lines:
+            if not segment:
+                continue
+            x = left
+            if alignment in ("CENTER", "RIGHT"):
+                free = right - left - get_measurer(font).width(segment)
+                x += free / 2 if alignment == "CENTER" else free
+            draw.text((x, top + offset), segment, fill=color, font=font)
+
+    def _font_name(self, p: Any, text: str, theme: Theme) -> str:
+        """Return the typeface of a paragraph's first run, East Asian for CJK text."""
+        script = "ea" if any(is_cjk(char) for char in text) else "latin"
+        r_pr = p.find(f"{A_NS}r/{A_NS}rPr")
+        font = r_pr.find(f"{A_NS}{script}") if r_pr is not None else None
+        typeface = theme.font(font.get("typeface")) if font is not None else None
+        return typeface or theme.font(f"+mn-{SCRIPT_SUFFIXES[script]}") or "Arial"
+
+    def _text_color(self, p: Any, theme: Theme) -> Optional[Color]:
+        r_pr = p.find(f"{A_NS}r/{A_NS}rPr")
+        fill = theme.fill(r_pr) if r_pr is not None else ...
+        return fill if fill is not ... else None
+
+
+def render_slide(slide: XmlSlide, width: int) -> Image.Image:
+    """Render one slide of an XmlPresentation to an image of the given width."""
+    return SlideRenderer(slide.presentation).render(slide, width)
+
+
+_worker_renderer: Optional[SlideRenderer] = None
+
+
+def _init_preview_worker(pptx_path: str) -> None:
+    global _worker_renderer
+    _worker_renderer = SlideRenderer(XmlPresentation(pptx_path))
+
+
+def _render_slide_chunk(task: Tuple[List[int], int]) -> List[Tuple[int, Image.Image]]:
+    """Worker: render a chunk of slides."""
+    slides, width = task
+    presentation = _worker_renderer.presentation  # type: ignore
+    return [
+        (slide_idx, _worker_renderer.render(presentation.slides[slide_idx], width))  # type: ignore
+        for slide_idx in slides
+    ]
+
+
+def render_slides(
+    pptx_path, slides: Sequence[int], width: int, jobs: Optional[int] = 0
+) -> Iterator[Tuple[int, Image.Image]]:
+    """Yield (slide index, image) for the given slides, in order.
+
+    jobs: worker processes; 0 or None uses all CPUs. Small batches render in
+    this process, where starting workers would cost more than it saves.
+    """
+    slides = list(slides)
+    jobs = min(jobs or os.cpu_count() or 1, len(slides) // MIN_SLIDES_PER_JOB)
+    if jobs <= 1:
+        with XmlPresentation(pptx_path) as presentation:
+            renderer = SlideRenderer(presentation)
+            for slide_idx in slides:
+                yield slide_idx, renderer.render(presentation.slides[slide_idx], width)
+        return
+
+    # A few chunks per worker keeps them busy when slides differ in cost
+    chunk_size = max(1, -(-len(slides) // (jobs * 4)))
+    tasks = [
+        (slides[start : start + chunk_size], width)
+        for start in range(0, len(slides), chunk_size)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_preview_worker,
+        initargs=(str(pptx_path),),
+    ) as pool:
+        for images in pool.map(_render_slide_chunk, tasks):
+            yield from images
+
+
+if __name__ == "__main__":
+    main()
@@ -12,10 +12,12 @@ Slides can be repeated (e.g., 34 appears twice).
 import argparse
 import shutil
 import sys
-from copy import deepcopy
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, List, Tuple
 
-import six
+from assemble import PartCloner
 from pptx import Presentation
 
 
@@ -72,78 +74,59 @@ Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
         sys.exit(1)
 
 
-def duplicate_slide(pres, index):
-    """Duplicate a slide in the presentation."""
-    source = pres.slides[index]
-
-    # Use source's layout to preserve formatting
-    new_slide = pres.slides.add_slide(source.slide_layout)
-
-    # Collect all image and media relationships from the source slide
-    image_rels = {}
-    for rel_id, rel in six.iteritems(source.part.rels):
-        if "image" in rel.reltype or "media" in rel.reltype:
-            image_rels[rel_id] = rel
-
-    # CRITICAL: Clear placeholder shapes to avoid duplicates
-    for shape in new_slide.shapes:
-        sp = shape.element
-        sp.getparent().remove(sp)
-
-    # Copy all shapes from source
-    for shape in source.shapes:
-        el = shape.element
-        new_el = deepcopy(el)
-        new_slide.shapes._spTree.insert_element_before(new_el, "p:extLst")
-
-        # Handle picture shapes - need to update the blip reference
-        # Look for all blip elements (they can be in pic or other contexts)
-        # Using the element's own xpath method without namespaces argument
-        blips = new_el.xpath(".//a:blip[@r:embed]")
-        for blip in blips:
-            old_rId = blip.get(
-                "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed"
-            )
-            if old_rId in image_rels:
-                # Create a new relationship in the destination slide for this image
-                old_rel = image_rels[old_rId]
-                # get_or_add returns the rId directly, or adds and returns new rId
-                new_rId = new_slide.part.rels.get_or_add(
-                    old_rel.reltype, old_rel._target
-                )
-                # Update the blip's embed reference to use the new relationship ID
-                blip.set(
-                    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed",
-                    new_rId,
-                )
-
-    # Copy any additional image/media relationships that might be referenced elsewhere
-    for rel_id, rel in image_rels.items():
-        try:
-            new_slide.part.rels.get_or_add(rel.reltype, rel._target)
-        except Exception:
-            pass  # Relationship might already exist
+def duplicate_slide(pres, index, cloner=None):
+    """Duplicate a slide in the presentation.
 
+    Images, media and the layout are shared with the source slide; notes,
+    charts and their embedded workbooks, SmartArt and other per-slide parts
+    are copied. Pass one PartCloner when duplicating many slides so the
+    package is indexed once.
+    """
+    own_cloner = cloner is None
+    if own_cloner:
+        cloner = PartCloner(pres)
+    source = pres.element.get_or_add_sldIdLst()[index]
+    new_slide = cloner.add_slide(pres.part.related_part(source.rId)).slide
+    if own_cloner:
+        cloner.finish()
     return new_slide
 
 
-def delete_slide(pres, index):
-    """Delete a slide from the presentation."""
-    rId = pres.slides._sldIdLst[index].rId
-    pres.part.drop_rel(rId)
-    del pres.slides._sldIdLst[index]
+@dataclass
+class RearrangePlan:
+    """Operations that turn a template's slides into a requested sequence."""
+
+    # Template index -> number of duplicates to create, in order of first use
+    copies: Dict[int, int]
+    # Template indices that do not appear in the sequence
+    unused: List[int]
+    # (template index, copy number) for each output slide; copy 0 is the original
+    final: List[Tuple[int, int]]
 
 
-def reorder_slides(pres, slide_index, target_index):
-    """Move a slide from one position to another."""
-    slides = pres.slides._sldIdLst
+def plan_rearrangement(slide_sequence: List[int], total_slides: int) -> RearrangePlan:
+    """Compute the duplicate, delete and reorder operations for a sequence.
+
+    The first occurrence of a slide index uses the original slide and each
+    repeat uses the next duplicate, in order. Runs in linear time.
+    """
+    # Validate indices
+    for idx in slide_sequence:
+        if idx < 0 or idx >= total_slides:
+            raise ValueError(f"Slide index {idx} out of range (0-{total_slides - 1})")
 
-    # Remove slide element from current position
-    slide_element = slides[slide_index]
-    slides.remove(slide_element)
+    counts = Counter(slide_sequence)  # Keys in order of first occurrence
+    seen: Counter = Counter()
+    final = []
+    for idx in slide_sequence:
+        final.append((idx, seen[idx]))
+        seen[idx] += 1
 
-    # Insert at target position
-    slides.insert(target_index, slide_element)
+    return RearrangePlan(
+        copies={idx: count - 1 for idx, count in counts.items() if count > 1},
+        unused=[idx for idx in range(total_slides) if idx not in counts],
+        final=final,
+    )
 
 
 def rearrange_presentation(template_path, output_path, slide_sequence):
@@ -162,69 +145,60 @@ def rearrange_presentation(template_path, output_path, slide_sequence):
     else:
         prs = Presentation(template_path)
 
-    total_slides = len(prs.slides)
-
-    # Validate indices
-    for idx in slide_sequence:
-        if idx < 0 or idx >= total_slides:
-            raise ValueError(f"Slide index {idx} out of range (0-{total_slides - 1})")
-
-    # Track original slides and their duplicates
-    slide_map = []  # List of actual slide indices for final presentation
-    duplicated = {}  # Track duplicates: original_idx -> [duplicate_indices]
+    sld_id_lst = prs.element.get_or_add_sldIdLst()
+    originals = list(sld_id_lst)
+    plan = plan_rearrangement(slide_sequence, len(originals))
 
     # Step 1: DUPLICATE repeated slides
     print(f"Processing {len(slide_sequence)} slides from template...")
-    for i, template_idx in enumerate(slide_sequence):
-        if template_idx in duplicated and duplicated[template_idx]:
-            # Already duplicated this slide, use the duplicate
-            slide_map.append(duplicated[template_idx].pop(0))
+    copies: Dict[int, list] = {}
+    cloner = PartCloner(prs)
+    for template_idx, count in plan.copies.items():
+        copies[template_idx] = []
+        for _ in range(count):
+            duplicate_slide(prs, template_idx, cloner)
+            copies[template_idx].append(sld_id_lst[-1])
+    cloner.finish()
+    for i, (template_idx, copy_number) in enumerate(plan.final):
+        if copy_number:
             print(f"  [{i}] Using duplicate of slide {template_idx}")
-        elif slide_sequence.count(template_idx) > 1 and template_idx not in duplicated:
-            # First occurrence of a repeated slide - create duplicates
-            slide_map.append(template_idx)
-            duplicates = []
-            count = slide_sequence.count(template_idx) - 1
+        elif template_idx in plan.copies:
             print(
-                f"  [{i}] Using original slide {template_idx}, creating {count} duplicate(s)"
+                f"  [{i}] Using original slide {template_idx}, "
+                f"creating {plan.copies[template_idx]} duplicate(s)"
             )
-            for _ in range(count):
-                duplicate_slide(prs, template_idx)
-                duplicates.append(len(prs.slides) - 1)
-            duplicated[template_idx] = duplicates
         else:
-            # Unique slide or first occurrence already handled, use original
-            slide_map.append(template_idx)
             print(f"  [{i}] Using original slide {template_idx}")
 
-    # Step 2: DELETE unwanted slides (work backwards)
-    slides_to_keep = set(slide_map)
-    print(f"\nDeleting {len(prs.slides) - len(slides_to_keep)} unused slides...")
-    for i in range(len(prs.slides) - 1, -1, -1):
-        if i not in slides_to_keep:
-            delete_slide(prs, i)
-            # Update slide_map indices after deletion
-            slide_map = [idx - 1 if idx > i else idx for idx in slide_map]
-
-    # Step 3: REORDER to final sequence
-    print(f"Reordering {len(slide_map)} slides to final sequence...")
-    for target_pos in range(len(slide_map)):
-        # Find which slide should be at target_pos
-        current_pos = slide_map[target_pos]
-        if current_pos != target_pos:
-            reorder_slides(prs, current_pos, target_pos)
-            # Update slide_map: the move shifts other slides
-            for i in range(len(slide_map)):
-                if slide_map[i] > current_pos and slide_map[i] <= target_pos:
-                    slide_map[i] -= 1
-                elif slide_map[i] < current_pos and slide_map[i] >= target_pos:
-                    slide_map[i] += 1
-            slide_map[target_pos] = target_pos
-
-    # Save the presentation
+    # Step 2: DELETE unwanted slides and Step 3: REORDER, by rebuilding the
+    # slide list once in its final order
+    print(f"\nDeleting {len(plan.unused)} unused slides...")
+    print(f"Reordering {len(plan.final)} slides to final sequence...")
+    final_ids = [
+        (
+            copies[template_idx][copy_number - 1]
+            if copy_number
+            else originals[template_idx]
+        )
+        for template_idx, copy_number in plan.final
+    ]
+    for sld_id in list(sld_id_lst):
+        sld_id_lst.remove(sld_id)
+    sld_id_lst.extend(final_ids)
+
+    # Drop the relationships of deleted slides (so their parts are not saved)
+    # unless something else in presentation.xml still refers to them
+    referenced = set(prs.element.xpath("//@r:id"))
+    for idx in plan.unused:
+        rId = originals[idx].rId
+        if rId not in referenced:
+            prs.part.rels.pop(rId)
+
+    # Save the presentation (accessing slides renumbers the slide parts)
+    final_count = len(prs.slides)
     prs.save(output_path)
     print(f"\nSaved rearranged presentation to: {output_path}")
-    print(f"Final presentation has {len(prs.slides)} slides")
+    print(f"Final presentation has {final_count} slides")
 
 
 if __name__ == "__main__":
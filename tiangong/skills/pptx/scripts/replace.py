@@ -3,18 +3,26 @@
 
 Usage:
     python replace.py <input.pptx> <replacements.json> <output.pptx>
+    python replace.py --batch <template.pptx> <output_dir> <replacements.json>... [-j N]
+
+Batch mode fills one template with many replacement JSONs, writing
+<output_dir>/<json name>.pptx for each and printing one summary at the end.
 
 The replacements JSON should have the structure output by inventory.py.
 ALL text shapes identified by inventory.py will have their text cleared
 unless "paragraphs" is specified in the replacements for that shape.
 """
 
+import argparse
+import copy
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
-from inventory import InventoryData, extract_text_inventory
+from inventory import InventoryData, extract_text_inventory, reinventory_shapes
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_THEME_COLOR
@@ -211,35 +219,20 @@ def check_duplicate_keys(pairs):
     return result
 
 
-def apply_replacements(pptx_file: str, json_file: str, output_file: str):
-    """Apply text replacements from JSON to PowerPoint presentation."""
-
-    # Load presentation
-    prs = Presentation(pptx_file)
-
-    # Get inventory of all text shapes (returns ShapeData objects)
-    # Pass prs to use same Presentation instance
-    inventory = extract_text_inventory(Path(pptx_file), prs)
-
-    # Detect text overflow in original presentation
-    original_overflow = detect_frame_overflow(inventory)
-
-    # Load replacement data with duplicate key detection
+def load_replacements(json_file: str) -> Dict:
+    """Load replacement data with duplicate key detection."""
     with open(json_file, "r") as f:
-        replacements = json.load(f, object_pairs_hook=check_duplicate_keys)
+        return json.load(f, object_pairs_hook=check_duplicate_keys)
 
-    # Validate replacements
-    errors = validate_replacements(inventory, replacements)
-    if errors:
-        print("ERROR: Invalid shapes in replacement JSON:")
-        for error in errors:
-            print(f"  - {error}")
-        print("\nPlease check the inventory and update your replacement JSON.")
-        print(
-            "You can regenerate the inventory with: python inventory.py <input.pptx> <output.json>"
-        )
-        raise ValueError(f"Found {len(errors)} validation error(s)")
 
+def fill_shapes(
+    prs: Any, inventory: InventoryData, replacements: Dict
+) -> Tuple[int, int, int]:
+    """Clear all inventoried shapes and add the replacement paragraphs.
+
+    Returns:
+        Tuple of (shapes processed, shapes cleared, shapes replaced)
+    """
     # Track statistics
     shapes_processed = 0
     shapes_cleared = 0
@@ -288,20 +281,21 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
                 apply_paragraph_properties(p, para_data)
 
-    # Check for issues after replacements
-    # Save to a temporary file and reload to avoid modifying the presentation during inventory
-    # (extract_text_inventory accesses font.color which adds empty <a:solidFill/> elements)
-    import tempfile
+    return shapes_processed, shapes_cleared, shapes_replaced
 
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        prs.save(str(tmp_path))
 
-    try:
-        updated_inventory = extract_text_inventory(tmp_path)
-        updated_overflow = detect_frame_overflow(updated_inventory)
-    finally:
-        tmp_path.unlink()  # Clean up temp file
+def find_replacement_issues(
+    inventory: InventoryData, original_overflow: Dict[str, Dict[str, float]]
+) -> Tuple[List[str], List[str]]:
+    """Check the filled shapes for worsened overflow and formatting warnings.
+
+    Returns:
+        Tuple of (overflow errors, warnings) as printable messages
+    """
+    # Re-read the edited shapes from their in-memory XML; unlike the python-pptx
+    # proxies this adds nothing to the tree, so no save-and-reload is needed
+    updated_inventory = reinventory_shapes(inventory)
+    updated_overflow = detect_frame_overflow(updated_inventory)
 
     # Check if any text overflow got worse
     overflow_errors = []
@@ -326,6 +320,43 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
                 for warning in shape_data.warnings:
                     warnings.append(f"{slide_key}/{shape_key}: {warning}")
 
+    return overflow_errors, warnings
+
+
+def apply_replacements(pptx_file: str, json_file: str, output_file: str):
+    """Apply text replacements from JSON to PowerPoint presentation."""
+
+    # Load presentation
+    prs = Presentation(pptx_file)
+
+    # Get inventory of all text shapes (returns ShapeData objects)
+    # Pass prs to use same Presentation instance
+    inventory = extract_text_inventory(Path(pptx_file), prs)
+
+    # Detect text overflow in original presentation
+    original_overflow = detect_frame_overflow(inventory)
+
+    replacements = load_replacements(json_file)
+
+    # Validate replacements
+    errors = validate_replacements(inventory, replacements)
+    if errors:
+        print("ERROR: Invalid shapes in replacement JSON:")
+        for error in errors:
+            print(f"  - {error}")
+        print("\nPlease check the inventory and update your replacement JSON.")
+        print(
+            "You can regenerate the inventory with: python inventory.py <input.pptx> <output.json>"
+        )
+        raise ValueError(f"Found {len(errors)} validation error(s)")
+
+    shapes_processed, shapes_cleared, shapes_replaced = fill_shapes(
+        prs, inventory, replacements
+    )
+
+    # Check for issues after replacements
+    overflow_errors, warnings = find_replacement_issues(inventory, original_overflow)
+
     # Fail if there are any issues
     if overflow_errors or warnings:
         print("\nERROR: Issues detected in replacement output:")
@@ -353,8 +384,195 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
     print(f"  - Shapes replaced: {shapes_replaced}")
 
 
+def snapshot_text_bodies(inventory: InventoryData) -> List[Tuple[Any, Any]]:
+    """Copy the pristine p:txBody of every inventoried shape."""
+    return [
+        (shape_data.shape, copy.deepcopy(shape_data.shape.element.txBody))
+        for shapes_dict in inventory.values()
+        for shape_data in shapes_dict.values()
+        if shape_data.shape is not None
+    ]
+
+
+def restore_text_bodies(snapshot: List[Tuple[Any, Any]]) -> None:
+    """Put fresh copies of the snapshotted text bodies back into their shapes.
+
+    Filling only ever edits the text bodies of inventoried shapes, so this
+    returns the template to its pristine state.
+    """
+    for shape, pristine in snapshot:
+        current = shape.element.txBody
+        current.getparent().replace(current, copy.deepcopy(pristine))
+
+
+# Template state loaded once per batch worker process by _init_batch_worker:
+# (presentation, inventory, original overflow, text body snapshot)
+_worker_template: Optional[Tuple[Any, InventoryData, Dict, List]] = None
+
+
+def _init_batch_worker(pptx_file: str) -> None:
+    global _worker_template
+    prs = Presentation(pptx_file)
+    inventory = extract_text_inventory(Path(pptx_file), prs)
+    _worker_template = (
+        prs,
+        inventory,
+        detect_frame_overflow(inventory),
+        snapshot_text_bodies(inventory),
+    )
+
+
+def _fill_template(task: Tuple[str, str]) -> Dict[str, Any]:
+    """Worker: fill the pristine template with one replacement JSON."""
+    json_file, output_file = task
+    prs, inventory, original_overflow, snapshot = _worker_template  # type: ignore
+    result: Dict[str, Any] = {
+        "replacements": json_file,
+        "output": output_file,
+        "saved": False,
+        "errors": [],
+        "overflow_errors": [],
+        "warnings": [],
+    }
+
+    restore_text_bodies(snapshot)
+    try:
+        replacements = load_replacements(json_file)
+        result["errors"] = validate_replacements(inventory, replacements)
+        if result["errors"]:
+            return result
+
+        result["stats"] = fill_shapes(prs, inventory, replacements)
+        overflow_errors, warnings = find_replacement_issues(
+            inventory, original_overflow
+        )
+        result["overflow_errors"] = overflow_errors
+        result["warnings"] = warnings
+        if not (overflow_errors or warnings):
+            prs.save(output_file)
+            result["saved"] = True
+    except Exception as e:
+        result["errors"] = [f"{type(e).__name__}: {e}"]
+    return result
+
+
+def apply_replacements_batch(
+    pptx_file: str, json_files: List[str], output_dir: str, jobs: int = 1
+) -> List[Dict[str, Any]]:
+    """Fill one template with many replacement JSONs.
+
+    The template is loaded and inventoried once per worker process. Before
+    each fill the inventoried text bodies are restored from a snapshot, so
+    every output starts from the pristine template and only the edited parts
+    are copied. Each output is named after its JSON file (a.json -> a.pptx) and
+    is only saved if it passes the same checks as a single replacement run.
+
+    Args:
+        pptx_file: Template presentation
+        json_files: Replacement JSON files, one per output
+        output_dir: Directory for the filled presentations
+        jobs: Worker processes (0 = all CPUs, 1 = fill in this process)
+
+    Returns:
+        One result dictionary per JSON file, in the given order
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    tasks = [
+        (str(json_file), str(output_path / f"{Path(json_file).stem}.pptx"))
+        for json_file in json_files
+    ]
+    outputs = [output for _, output in tasks]
+    if len(set(outputs)) != len(outputs):
+        raise ValueError("Replacement JSON files must have distinct names")
+
+    if not jobs:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(tasks))
+    if jobs <= 1:
+        _init_batch_worker(pptx_file)
+        return [_fill_template(task) for task in tasks]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_batch_worker,
+        initargs=(pptx_file,),
+    ) as pool:
+        return list(pool.map(_fill_template, tasks))
+
+
+def print_batch_summary(results: List[Dict[str, Any]]) -> None:
+    """Print one line per output, with the issues of those that failed."""
+    print("\nBatch summary:")
+    for result in results:
+        if result["saved"]:
+            processed, cleared, replaced = result["stats"]
+            print(
+                f"  OK     {result['output']} "
+                f"({replaced} of {processed} shapes replaced)"
+            )
+            continue
+
+        print(f"  FAILED {result['replacements']}")
+        for error in result["errors"]:
+            print(f"    - {error}")
+        for error in result["overflow_errors"]:
+            print(f"    - overflow worsened: {error}")
+        for warning in result["warnings"]:
+            print(f"    - warning: {warning}")
+
+    saved = sum(1 for result in results if result["saved"])
+    print(f"\nSaved {saved} of {len(results)} presentations")
+
+
+def batch_main(argv: List[str]):
+    """Command-line entry point for --batch."""
+    parser = argparse.ArgumentParser(
+        prog="replace.py --batch",
+        description="Fill one template with many replacement JSONs.",
+    )
+    parser.add_argument("template", help="Template PowerPoint file (.pptx)")
+    parser.add_argument("output_dir", help="Directory for the filled presentations")
+    parser.add_argument("replacements", nargs="+", help="Replacement JSON files")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for filling and saving (0 = all CPUs)",
+    )
+    args = parser.parse_args(argv)
+
+    if not Path(args.template).exists():
+        print(f"Error: Template file '{args.template}' not found")
+        sys.exit(1)
+    missing = [path for path in args.replacements if not Path(path).exists()]
+    if missing:
+        print(f"Error: Replacements JSON file(s) not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    try:
+        results = apply_replacements_batch(
+            args.template, args.replacements, args.output_dir, jobs=args.jobs
+        )
+    except Exception as e:
+        print(f"Error applying replacements: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
+
+    print_batch_summary(results)
+    if not all(result["saved"] for result in results):
+        sys.exit(1)
+
+
 def main():
     """Main entry point for command-line usage."""
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        batch_main(sys.argv[2:])
+        return
+
     if len(sys.argv) != 4:
         print(__doc__)
         sys.exit(1)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Per-slide thumbnail cache, so that unchanged slides are not rendered again.
+
+Each slide gets a content key: a hash over the slide part and every part it
+reaches through its relationships (layout, master, theme, pictures, charts and
+other media), plus the presentation settings that affect rendering. Parts are
+identified by the CRC-32 and size in the zip directory, so keys are computed
+without inflating any media. Thumbnails are stored by key (under
+$XDG_CACHE_HOME or ~/.cache); editing a slide, or a layout or picture it uses,
+changes its key and only that slide has to be rendered again. The least
+recently used thumbnails are removed once the cache exceeds MAX_CACHE_BYTES.
+Slides with date or time fields show when they were rendered and are never
+cached.
+
+Main Functions:
+    slide_keys: Return the cache key of each slide of a deck
+    TileCache: Slide thumbnails on disk, by slide key, pruned to a size limit
+    write_reduced_deck: Copy a deck with all but some slides hidden
+"""
+
+import hashlib
+import os
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from inventory import A_NS, P_NS, XmlPresentation
+from lxml import etree
+from PIL import Image
+
+CACHE_VERSION = 1
+MAX_CACHE_BYTES = 256 * 1024 * 1024  # Least recently used thumbnails go beyond this
+
+# Relationships that do not change how a slide looks: links to other slides,
+# notes and comments
+IGNORED_RELATIONSHIPS = ("/slide", "/notesSlide", "/comments")
+
+# Keeps whitespace, which is significant in slide text
+SLIDE_PARSER = etree.XMLParser(resolve_entities=False)
+
+# Key of visible slides that are rendered every time, never cached
+NOT_CACHED = ""
+
+
+class _KeyBuilder:
+    """Content digests of the parts of one package, computed once per part."""
+
+    def __init__(self, presentation: XmlPresentation):
+        self.presentation = presentation
+        self._digests: Dict[str, Optional[str]] = {}
+
+    def digest(self, part_name: str) -> str:
+        """Return the digest of a part and everything it relates to."""
+        if part_name in self._digests:
+            # None marks a part whose digest is being computed (a cycle)
+            return self._digests[part_name] or part_name
+
+        try:
+            info = self.presentation.part_info(part_name)
+        except KeyError:
+            return f"missing {part_name}"
+
+        self._digests[part_name] = None
+        is_master = "/slideMasters/" in f"/{part_name}"
+        related = []
+        for rel_id, rel_type, target in self.presentation.relationships(part_name):
+            if rel_type.endswith(IGNORED_RELATIONSHIPS):
+                continue
+            # A master relates to all of its layouts; only the slide's own
+            # layout matters, and it is reached from the slide
+            if is_master and rel_type.endswith("/slideLayout"):
+                continue
+            related.append(f"{rel_id} {rel_type} {self.digest(target)}")
+
+        digest = hashlib.sha1(
+            "\n".join([f"{info.CRC:08x} {info.file_size}", *related]).encode()
+        ).hexdigest()
+        self._digests[part_name] = digest
+        return digest
+
+
+def _shows_time(slide) -> bool:
+    """Whether a slide, its layout or its master has a date or time field."""
+    elements = [slide.element]
+    try:
+        elements += [slide.layout_element, slide.master_element]
+    except KeyError:
+        pass
+    return any(
+        field.get("type", "").startswith("datetime")
+        for element in elements
+        for field in element.iter(f"{A_NS}fld")
+    )
+
+
+def slide_keys(pptx_path, salt: str = "") -> List[Optional[str]]:
+    """Return the cache key of each slide, or None for hidden slides.
+
+    salt distinguishes renderings of the same slide, e.g. thumbnail sizes.
+    Slides with a slide number field also key on their position; slides with
+    a date or time field get NOT_CACHED.
+    """
+    with XmlPresentation(pptx_path) as presentation:
+        # Slide size and default text style apply to every slide
+        root = presentation.part(presentation.part_name)
+        settings = [f"{CACHE_VERSION}", salt]
+        for tag in ("sldSz", "defaultTextStyle"):
+            element = root.find(f"{P_NS}{tag}")
+            if element is not None:
+                settings.append(etree.tostring(element).decode())
+        base = hashlib.sha1("\n".join(settings).encode()).hexdigest()
+
+        builder = _KeyBuilder(presentation)
+        keys: List[Optional[str]] = []
+        for slide_idx, slide in enumerate(presentation.slides):
+            element = slide.element
+            if element.get("show") == "0":
+                keys.append(None)
+                continue
+            if _shows_time(slide):
+                keys.append(NOT_CACHED)
+                continue
+            parts = [base, builder.digest(slide.part_name)]
+            if element.find(f".//{A_NS}fld[@type='slidenum']") is not None:
+                parts.append(f"slide {slide_idx}")
+            keys.append(hashlib.sha1("\n".join(parts).encode()).hexdigest())
+        return keys
+
+
+def _cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "pptx-skill" / "thumbnails"
+
+
+class TileCache:
+    """Slide thumbnails on disk, by slide key.
+
+    Entries are marked as used when looked up; prune() removes the least
+    recently used ones once the cache grows beyond max_bytes.
+    """
+
+    def __init__(self, directory=None, max_bytes: int = MAX_CACHE_BYTES):
+        self.directory = Path(directory) if directory else _cache_dir()
+        self.max_bytes = max_bytes
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.png"
+
+    def lookup(self, keys: List[Optional[str]]) -> Dict[int, Path]:
+        """Return {slide index: thumbnail path} for the slides in the cache.
+
+        Entries are checked to be readable PNGs; damaged ones are dropped, so
+        their slides are rendered again.
+        """
+        found = {}
+        for slide_idx, key in enumerate(keys):
+            if key and self._check(self.path(key)):
+                found[slide_idx] = self.path(key)
+        return found
+
+    def _check(self, path: Path) -> bool:
+        """Whether an entry is a readable PNG; marks it as recently used."""
+        if not path.is_file():
+            return False
+        try:
+            with Image.open(path) as img:
+                img.verify()
+            os.utime(path)
+            return True
+        except (OSError, ValueError, SyntaxError):
+            path.unlink(missing_ok=True)
+            return False
+
+    def load(self, path: Path) -> Optional[Image.Image]:
+        """Load a cached thumbnail; unreadable entries are dropped."""
+        try:
+            with Image.open(path) as img:
+                return img.convert("RGB")
+        except (OSError, ValueError):
+            path.unlink(missing_ok=True)
+            return None
+
+    def store(self, key: str, tile: Image.Image) -> None:
+        path = self.path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tile.save(temp_path, "PNG")
+            temp_path.replace(path)
+        except OSError:
+            pass  # The cache is only an optimization
+
+    def prune(self) -> None:
+        """Remove the least recently used thumbnails beyond max_bytes."""
+        entries = []
+        for path in self.directory.glob("*/*.png"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Removed meanwhile, e.g. by another run
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                continue
+            total -= size
+
+
+def write_reduced_deck(pptx_path, output_path, slides: Iterable[int]) -> None:
+    """Copy a deck with every slide but the given ones hidden.
+
+    Exporters skip hidden slides, so the copy exports just those slides, while
+    slide numbers stay those of the full deck.
+    """
+    keep = set(slides)
+    with XmlPresentation(pptx_path) as presentation:
+        hide = {
+            slide.part_name
+            for slide_idx, slide in enumerate(presentation.slides)
+            if slide_idx not in keep
+        }
+
+    with zipfile.ZipFile(pptx_path) as source, zipfile.ZipFile(
+        output_path, "w"
+    ) as target:
+        for info in source.infolist():
+            data = source.read(info)
+            if info.filename in hide:
+                root = etree.fromstring(data, SLIDE_PARSER)
+                root.set("show", "0")
+                data = etree.tostring(
+                    root, xml_declaration=True, encoding="UTF-8", standalone=True
+                )
+            target.writestr(info, data)
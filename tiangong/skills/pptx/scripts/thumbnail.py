@@ -8,6 +8,14 @@ slides, multiple numbered grid files are created automatically.
 
 The program outputs the names of all files created.
 
+Slide thumbnails are cached by slide content (see slide_cache.py): when a deck
+is thumbnailed again after an edit, only the slides that changed are rendered.
+Use --no-cache to render every slide.
+
+Slides are rendered by LibreOffice. Without soffice, or with --renderer preview,
+they are drawn by the Pillow preview renderer (preview.py) instead: much faster,
+but approximate, for checking layouts rather than the final look.
+
 Output:
 - Single grid: {prefix}.jpg (if slides fit in one grid)
 - Multiple grids: {prefix}-1.jpg, {prefix}-2.jpg, etc.
@@ -20,6 +28,7 @@ Grid limits by column count:
 
 Usage:
     python thumbnail.py input.pptx [output_prefix] [--cols N] [--outline-placeholders]
+        [--no-cache] [--renderer auto|soffice|preview]
 
 Examples:
     python thumbnail.py presentation.pptx
@@ -41,18 +50,29 @@ Examples:
 """
 
 import argparse
+import math
+import os
+import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
 
-from inventory import extract_text_inventory
+import preview
+import soffice_pool
+from inventory import XmlPresentation, extract_xml_slide_inventory
 from PIL import Image, ImageDraw, ImageFont
-from pptx import Presentation
+from slide_cache import TileCache, slide_keys, write_reduced_deck
 
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
-CONVERSION_DPI = 100  # DPI for PDF to image conversion
+CONVERSION_DPI = 100  # Reference DPI for full-size slide images
+RASTER_OVERSAMPLE = 2  # Rasterize pages at this multiple of the thumbnail width
+MAX_PAGES_PER_JOB = 10  # Most pages per pdftoppm process
 MAX_COLS = 6  # Maximum number of columns
 DEFAULT_COLS = 5  # Default number of columns
 JPEG_QUALITY = 95  # JPEG compression quality
@@ -86,6 +106,18 @@ def main():
         action="store_true",
         help="Outline text placeholders with a colored border",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render every slide, without using the thumbnail cache",
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=("auto", "soffice", "preview"),
+        default="auto",
+        help="soffice renders with LibreOffice; preview draws fast approximations "
+        "of shapes and text (default: soffice if installed, else preview)",
+    )
 
     args = parser.parse_args()
 
@@ -103,38 +135,76 @@ def main():
     # Construct output path (always JPG)
     output_path = Path(f"{args.output_prefix}.jpg")
 
+    renderer = args.renderer
+    if renderer == "auto":
+        renderer = "soffice" if shutil.which("soffice") else "preview"
+        if renderer == "preview":
+            print("soffice not found; drawing approximate previews instead")
+
     print(f"Processing: {args.input}")
 
     try:
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Get placeholder regions if outlining is enabled
-            placeholder_regions = None
-            slide_dimensions = None
-            if args.outline_placeholders:
-                print("Extracting placeholder regions...")
-                placeholder_regions, slide_dimensions = get_placeholder_regions(
-                    input_path
+            # Unchanged slides rendered before come from the thumbnail cache
+            tiles = None
+            if not args.no_cache:
+                tiles = CachedTiles.lookup(
+                    TileCache(), input_path, THUMBNAIL_WIDTH, renderer
+                )
+                if tiles.paths:
+                    print(f"Reusing {len(tiles.paths)} cached slide thumbnail(s)")
+
+            print("Analyzing presentation...")
+            temp_dir = Path(temp_dir)
+            if renderer == "soffice":
+                # Convert to PDF; the slide XML is read meanwhile
+                exported = tiles.slides_to_render() if tiles else None
+                pdf_path, analysis = convert_to_pdf(
+                    input_path,
+                    temp_dir,
+                    text_regions=args.outline_placeholders,
+                    slides=exported,
                 )
-                if placeholder_regions:
-                    print(f"Found placeholders on {len(placeholder_regions)} slides")
+                render = partial(
+                    render_deck_pages,
+                    input_path,
+                    pdf_path,
+                    exported,
+                    temp_dir,
+                    analysis.slide_dimensions,
+                )
+            else:
+                analysis = analyze_presentation(
+                    input_path, text_regions=args.outline_placeholders
+                )
+                render = partial(render_previews, input_path)
 
-            # Convert slides to images
-            slide_images = convert_to_images(input_path, Path(temp_dir), CONVERSION_DPI)
-            if not slide_images:
+            print(f"Total slides: {analysis.total_slides}")
+            if analysis.hidden_slides:
+                print(f"Hidden slides: {sorted(analysis.hidden_slides)}")
+            if not analysis.total_slides:
                 print("Error: No slides found")
                 sys.exit(1)
 
-            print(f"Found {len(slide_images)} slides")
+            if args.outline_placeholders and analysis.placeholder_regions:
+                print(
+                    f"Found placeholders on {len(analysis.placeholder_regions)} slides"
+                )
+
+            print(f"Found {analysis.total_slides} slides")
 
-            # Create grids (max cols×(cols+1) images per grid)
-            grid_files = create_grids(
-                slide_images,
+            # Render slides and create grids (max cols×(cols+1) images per grid)
+            grid_files = render_grids(
+                render,
+                analysis,
                 cols,
                 THUMBNAIL_WIDTH,
                 output_path,
-                placeholder_regions,
-                slide_dimensions,
+                outline_placeholders=args.outline_placeholders,
+                tiles=tiles,
             )
+            if tiles:
+                tiles.cache.prune()
 
             # Print saved files
             print(f"Created {len(grid_files)} grid(s):")
@@ -156,294 +226,468 @@ def create_hidden_slide_placeholder(size):
     return img
 
 
-def get_placeholder_regions(pptx_path):
-    """Extract ALL text regions from the presentation.
+@dataclass
+class SlideAnalysis:
+    """What thumbnailing needs to know about a deck besides its rendering."""
 
-    Returns a tuple of (placeholder_regions, slide_dimensions).
-    text_regions is a dict mapping slide indices to lists of text regions.
-    Each region is a dict with 'left', 'top', 'width', 'height' in inches.
-    slide_dimensions is a tuple of (width_inches, height_inches).
+    total_slides: int
+    # 1-based numbers of hidden slides
+    hidden_slides: Set[int]
+    # Slide index -> text regions, each a dict with 'left', 'top', 'width'
+    # and 'height' in inches; None unless text regions were requested
+    placeholder_regions: Optional[Dict[int, List[dict]]]
+    # (width_inches, height_inches)
+    slide_dimensions: Tuple[float, float]
+
+
+def analyze_presentation(pptx_path, text_regions=False):
+    """Read hidden slides and, optionally, text regions from the slide XML.
+
+    One pass over the slides of the package; no python-pptx load. Text regions
+    are the shapes of the text inventory, as read by the XML engine.
     """
-    prs = Presentation(str(pptx_path))
-    inventory = extract_text_inventory(pptx_path, prs)
-    placeholder_regions = {}
-
-    # Get actual slide dimensions in inches (EMU to inches conversion)
-    slide_width_inches = (prs.slide_width or 9144000) / 914400.0
-    slide_height_inches = (prs.slide_height or 5143500) / 914400.0
-
-    for slide_key, shapes in inventory.items():
-        # Extract slide index from "slide-N" format
-        slide_idx = int(slide_key.split("-")[1])
-        regions = []
-
-        for shape_key, shape_data in shapes.items():
-            # The inventory only contains shapes with text, so all shapes should be highlighted
-            regions.append(
+    with XmlPresentation(pptx_path) as presentation:
+        hidden_slides = set()
+        placeholder_regions = {} if text_regions else None
+        for slide_idx, slide in enumerate(presentation.slides):
+            if slide.element.get("show") == "0":
+                hidden_slides.add(slide_idx + 1)
+            if not text_regions:
+                continue
+
+            # The inventory only contains shapes with text, so all shapes
+            # should be highlighted
+            regions = [
                 {
                     "left": shape_data.left,
                     "top": shape_data.top,
                     "width": shape_data.width,
                     "height": shape_data.height,
                 }
-            )
+                for shape_data in extract_xml_slide_inventory(slide).values()
+            ]
+            if regions:
+                placeholder_regions[slide_idx] = regions
+
+        # Get actual slide dimensions in inches (EMU to inches conversion)
+        slide_dimensions = (
+            (presentation.slide_width or 9144000) / 914400.0,
+            (presentation.slide_height or 5143500) / 914400.0,
+        )
+        return SlideAnalysis(
+            len(presentation.slides),
+            hidden_slides,
+            placeholder_regions,
+            slide_dimensions,
+        )
 
-        if regions:
-            placeholder_regions[slide_idx] = regions
 
-    return placeholder_regions, (slide_width_inches, slide_height_inches)
+@dataclass
+class CachedTiles:
+    """Cache keys of a deck's slides and the slides already in the cache."""
+
+    cache: TileCache
+    # Per slide; None for hidden slides, NOT_CACHED for slides never cached
+    keys: List[Optional[str]]
+    # Slide index -> cached thumbnail
+    paths: Dict[int, Path]
+
+    @classmethod
+    def lookup(cls, cache, pptx_path, width, renderer="soffice"):
+        if renderer == "preview":
+            # Previews change with the preview renderer itself
+            renderer = f"preview{preview.RENDERER_VERSION}"
+        keys = slide_keys(pptx_path, salt=f"{renderer}:{width}:{RASTER_OVERSAMPLE}")
+        return cls(cache, keys, cache.lookup(keys))
+
+    def slides_to_render(self):
+        """Return the visible slides not in the cache, or None for all of them."""
+        if not self.paths:
+            return None
+        return [
+            slide_idx
+            for slide_idx, key in enumerate(self.keys)
+            if key is not None and slide_idx not in self.paths
+        ]
+
+
+def convert_to_pdf(pptx_path, temp_dir, text_regions=False, slides=None):
+    """Convert PowerPoint to PDF, analyzing the deck meanwhile.
+
+    The slide XML is analyzed in a background thread while soffice converts
+    the deck. Returns (pdf_path, analysis); hidden slides are not in the PDF.
+    With slides, only those slide indices are exported, from a copy of the deck
+    with the other slides hidden; pdf_path is None if slides is empty.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        analysis_future = executor.submit(analyze_presentation, pptx_path, text_regions)
 
+        pdf_path = None
+        if slides is None or slides:
+            if slides is not None:
+                print(f"Rendering {len(slides)} changed slide(s)")
+            pdf_path = export_pdf(pptx_path, temp_dir, slides)
 
-def convert_to_images(pptx_path, temp_dir, dpi):
-    """Convert PowerPoint to images via PDF, handling hidden slides."""
-    # Detect hidden slides
-    print("Analyzing presentation...")
-    prs = Presentation(str(pptx_path))
-    total_slides = len(prs.slides)
+        analysis = analysis_future.result()
 
-    # Find hidden slides (1-based indexing for display)
-    hidden_slides = {
-        idx + 1
-        for idx, slide in enumerate(prs.slides)
-        if slide.element.get("show") == "0"
-    }
+    return pdf_path, analysis
 
-    print(f"Total slides: {total_slides}")
-    if hidden_slides:
-        print(f"Hidden slides: {sorted(hidden_slides)}")
 
-    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
+def export_pdf(pptx_path, out_dir, slides=None):
+    """Export a deck to PDF in out_dir, or with slides, just those slide indices."""
+    deck_path = pptx_path
+    if slides is not None:
+        deck_path = out_dir / "changed" / pptx_path.name
+        deck_path.parent.mkdir()
+        write_reduced_deck(pptx_path, deck_path, slides)
 
-    # Convert to PDF
+    # Convert to PDF (with a warm LibreOffice instance where available)
     print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
+    try:
+        return soffice_pool.convert(deck_path, out_dir, "pdf")
+    except soffice_pool.ConversionError:
         raise RuntimeError("PDF conversion failed")
 
-    # Convert PDF to images
-    print(f"Converting to images at {dpi} DPI...")
+
+def rasterization_dpi(width, slide_dimensions):
+    """DPI at which a page comes out RASTER_OVERSAMPLE times the thumbnail width."""
+    return max(1, math.ceil(width * RASTER_OVERSAMPLE / slide_dimensions[0]))
+
+
+def page_ranges(page_count, jobs):
+    """Split pages 1..page_count into contiguous (first, last) ranges."""
+    size = max(1, min(MAX_PAGES_PER_JOB, math.ceil(page_count / jobs)))
+    return [
+        (first, min(first + size - 1, page_count))
+        for first in range(1, page_count + 1, size)
+    ]
+
+
+def rasterize_pages(pdf_path, temp_dir, dpi, first, last):
+    """Rasterize one page range with pdftoppm; returns {page_number: path}."""
+    prefix = temp_dir / f"page{first}"
     result = subprocess.run(
-        ["pdftoppm", "-jpeg", "-r", str(dpi), str(pdf_path), str(temp_dir / "slide")],
+        [
+            "pdftoppm",
+            "-jpeg",
+            "-r",
+            str(dpi),
+            "-f",
+            str(first),
+            "-l",
+            str(last),
+            str(pdf_path),
+            str(prefix),
+        ],
         capture_output=True,
         text=True,
     )
     if result.returncode != 0:
         raise RuntimeError("Image conversion failed")
 
-    visible_images = sorted(temp_dir.glob("slide-*.jpg"))
-
-    # Create full list with placeholders for hidden slides
-    all_images = []
-    visible_idx = 0
-
-    # Get placeholder dimensions from first visible slide
-    if visible_images:
-        with Image.open(visible_images[0]) as img:
-            placeholder_size = img.size
-    else:
-        placeholder_size = (1920, 1080)
-
-    for slide_num in range(1, total_slides + 1):
-        if slide_num in hidden_slides:
-            # Create placeholder image for hidden slide
-            placeholder_path = temp_dir / f"hidden-{slide_num:03d}.jpg"
-            placeholder_img = create_hidden_slide_placeholder(placeholder_size)
-            placeholder_img.save(placeholder_path, "JPEG")
-            all_images.append(placeholder_path)
-        else:
-            # Use the actual visible slide image
-            if visible_idx < len(visible_images):
-                all_images.append(visible_images[visible_idx])
-                visible_idx += 1
+    # pdftoppm names pages {prefix}-{page number}.jpg
+    return {
+        int(path.stem.rsplit("-", 1)[1]): path
+        for path in temp_dir.glob(f"{prefix.name}-*.jpg")
+    }
 
-    return all_images
 
+def rasterize_pdf(pdf_path, temp_dir, dpi, page_count, jobs=None):
+    """Yield (page_number, image_path) as page ranges finish rasterizing.
 
-def create_grids(
-    image_paths,
+    Page ranges are rasterized by concurrent pdftoppm processes, one per CPU.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    print(f"Converting to images at {dpi} DPI...")
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(rasterize_pages, pdf_path, temp_dir, dpi, first, last)
+            for first, last in page_ranges(page_count, jobs)
+        ]
+        for future in as_completed(futures):
+            yield from sorted(future.result().items())
+
+
+def render_grids(
+    render,
+    analysis,
     cols,
     width,
     output_path,
-    placeholder_regions=None,
-    slide_dimensions=None,
+    outline_placeholders=False,
+    tiles=None,
 ):
-    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid."""
-    # Maximum images per grid is cols × (cols + 1) for better proportions
-    max_images_per_grid = cols * (cols + 1)
-    grid_files = []
+    """Render slide thumbnails and compose the grids as they come in.
 
+    render(slides, tile_size) yields (slide index, thumbnail) for a list of
+    visible slides, in any order. With tiles, slides in the cache are taken
+    from it and only the others are rendered; new thumbnails are added to the
+    cache. Returns the grid file names.
+    """
+    slide_dimensions = analysis.slide_dimensions
+    regions = (analysis.placeholder_regions or {}) if outline_placeholders else {}
+    writer = GridWriter(
+        analysis.total_slides,
+        cols,
+        width,
+        slide_dimensions[1] / slide_dimensions[0],
+        output_path,
+    )
     print(
-        f"Creating grids with {cols} columns (max {max_images_per_grid} images per grid)"
+        f"Creating grids with {cols} columns "
+        f"(max {writer.slides_per_grid} images per grid)"
     )
 
-    # Split images into chunks
-    for chunk_idx, start_idx in enumerate(
-        range(0, len(image_paths), max_images_per_grid)
-    ):
-        end_idx = min(start_idx + max_images_per_grid, len(image_paths))
-        chunk_images = image_paths[start_idx:end_idx]
-
-        # Create grid for this chunk
-        grid = create_grid(
-            chunk_images, cols, width, start_idx, placeholder_regions, slide_dimensions
-        )
-
-        # Generate output filename
-        if len(image_paths) <= max_images_per_grid:
-            # Single grid - use base filename without suffix
-            grid_filename = output_path
+    def add_tile(slide_idx, tile):
+        if slide_idx in regions:
+            outline_regions(tile, regions[slide_idx], slide_dimensions)
+        writer.add(slide_idx, tile)
+
+    # Hidden and cached slides are not rendered
+    cached = tiles.paths if tiles else {}
+    visible_slides = []
+    for slide_idx in range(analysis.total_slides):
+        if slide_idx + 1 in analysis.hidden_slides:
+            add_tile(slide_idx, hidden_slide_tile(writer.tile_size, slide_dimensions))
+        elif slide_idx in cached:
+            # An entry lost since the lookup (e.g. pruned by another run) is
+            # rendered after all
+            tile = tiles.cache.load(cached[slide_idx])
+            if tile is None:
+                visible_slides.append(slide_idx)
+            else:
+                add_tile(slide_idx, tile)
         else:
-            # Multiple grids - insert index before extension with dash
-            stem = output_path.stem
-            suffix = output_path.suffix
-            grid_filename = output_path.parent / f"{stem}-{chunk_idx + 1}{suffix}"
+            visible_slides.append(slide_idx)
 
-        # Save grid
-        grid_filename.parent.mkdir(parents=True, exist_ok=True)
-        grid.save(str(grid_filename), quality=JPEG_QUALITY)
-        grid_files.append(str(grid_filename))
+    if visible_slides:
+        for slide_idx, tile in render(visible_slides, writer.tile_size):
+            if tiles and tiles.keys[slide_idx]:
+                tiles.cache.store(tiles.keys[slide_idx], tile)
+            add_tile(slide_idx, tile)
 
-    return grid_files
+    return writer.close()
 
 
-def create_grid(
-    image_paths,
-    cols,
-    width,
-    start_slide_num=0,
-    placeholder_regions=None,
-    slide_dimensions=None,
+def render_deck_pages(
+    pptx_path, pdf_path, exported, temp_dir, slide_dimensions, slides, tile_size
 ):
-    """Create thumbnail grid from slide images with optional placeholder outlining."""
-    font_size = int(width * FONT_SIZE_RATIO)
-    label_padding = int(font_size * LABEL_PADDING_RATIO)
+    """Yield (slide index, thumbnail) for slides, most from an exported PDF.
 
-    # Get dimensions
-    with Image.open(image_paths[0]) as img:
-        aspect = img.height / img.width
-    height = int(width * aspect)
+    pdf_path has a page per slide in exported, or per visible slide if exported
+    is None. The other slides, whose cached thumbnails were lost since the
+    lookup, are exported again from a reduced copy of the deck.
+    """
+    if exported is None:
+        exported = slides
+    if pdf_path is not None:
+        yield from render_pdf_pages(
+            pdf_path, temp_dir, slide_dimensions, exported, tile_size
+        )
 
-    # Calculate grid size
-    rows = (len(image_paths) + cols - 1) // cols
-    grid_w = cols * width + (cols + 1) * GRID_PADDING
-    grid_h = rows * (height + font_size + label_padding * 2) + (rows + 1) * GRID_PADDING
+    in_pdf = set(exported)
+    missing = [slide_idx for slide_idx in slides if slide_idx not in in_pdf]
+    if missing:
+        print(f"Rendering {len(missing)} slide(s) missing from the cache")
+        out_dir = Path(tempfile.mkdtemp(dir=temp_dir))
+        pdf_path = export_pdf(pptx_path, out_dir, missing)
+        yield from render_pdf_pages(
+            pdf_path, out_dir, slide_dimensions, missing, tile_size
+        )
 
-    # Create grid
-    grid = Image.new("RGB", (grid_w, grid_h), "white")
-    draw = ImageDraw.Draw(grid)
 
-    # Load font with size based on thumbnail width
-    try:
-        # Use Pillow's default font with size
-        font = ImageFont.load_default(size=font_size)
-    except Exception:
-        # Fall back to basic default font if size parameter not supported
-        font = ImageFont.load_default()
-
-    # Place thumbnails
-    for i, img_path in enumerate(image_paths):
-        row, col = i // cols, i % cols
-        x = col * width + (col + 1) * GRID_PADDING
-        y_base = (
-            row * (height + font_size + label_padding * 2) + (row + 1) * GRID_PADDING
+def render_pdf_pages(pdf_path, temp_dir, slide_dimensions, slides, tile_size):
+    """Yield (slide index, thumbnail) for a PDF with one page per slide given."""
+    dpi = rasterization_dpi(tile_size[0], slide_dimensions)
+    for page_number, image_path in rasterize_pdf(pdf_path, temp_dir, dpi, len(slides)):
+        if page_number > len(slides):
+            continue
+        tile = load_tile(image_path, tile_size)
+        image_path.unlink()
+        yield slides[page_number - 1], tile
+
+
+def render_previews(pptx_path, slides, tile_size):
+    """Yield (slide index, thumbnail) drawn by the Pillow preview renderer."""
+    for slide_idx, tile in preview.render_slides(pptx_path, slides, tile_size[0]):
+        # Fit the grid cell, whose height is rounded down
+        tile.thumbnail(tile_size, Image.Resampling.LANCZOS)
+        yield slide_idx, tile
+
+
+def hidden_slide_tile(tile_size, slide_dimensions):
+    """Create the thumbnail for a hidden slide."""
+    full_size = tuple(round(inches * CONVERSION_DPI) for inches in slide_dimensions)
+    tile = create_hidden_slide_placeholder(full_size)
+    tile.thumbnail(tile_size, Image.Resampling.LANCZOS)
+    return tile
+
+
+def load_tile(image_path, tile_size):
+    """Decode a slide image at thumbnail size."""
+    with Image.open(image_path) as img:
+        # JPEG draft mode decodes at a reduced DCT scale, no smaller than needed
+        img.draft("RGB", tile_size)
+        tile = img.convert("RGB")
+    tile.thumbnail(tile_size, Image.Resampling.LANCZOS)
+    return tile
+
+
+def outline_regions(tile, regions, slide_dimensions):
+    """Draw red outlines around text regions on a slide thumbnail."""
+    slide_width_inches, slide_height_inches = slide_dimensions
+    x_scale = tile.width / slide_width_inches
+    y_scale = tile.height / slide_height_inches
+
+    # Keep the stroke as thick, relative to the slide, as when outlines were
+    # drawn on a full-size rendering at CONVERSION_DPI
+    full_size = min(slide_width_inches, slide_height_inches) * CONVERSION_DPI
+    stroke_width = max(1, round(max(5, full_size // 150) * x_scale / CONVERSION_DPI))
+
+    # Outlines are opaque, so they go straight onto the thumbnail
+    draw = ImageDraw.Draw(tile)
+    for region in regions:
+        # Convert from inches to pixels in the thumbnail
+        px_left = int(region["left"] * x_scale)
+        px_top = int(region["top"] * y_scale)
+        px_width = int(region["width"] * x_scale)
+        px_height = int(region["height"] * y_scale)
+        draw.rectangle(
+            [(px_left, px_top), (px_left + px_width, px_top + px_height)],
+            outline=(255, 0, 0),  # Bright red
+            width=stroke_width,
         )
 
-        # Add label with actual slide number
-        label = f"{start_slide_num + i}"
-        bbox = draw.textbbox((0, 0), label, font=font)
-        text_w = bbox[2] - bbox[0]
-        draw.text(
-            (x + (width - text_w) // 2, y_base + label_padding),
-            label,
-            fill="black",
-            font=font,
-        )
 
-        # Add thumbnail below label with proportional spacing
-        y_thumbnail = y_base + label_padding + font_size + label_padding
-
-        with Image.open(img_path) as img:
-            # Get original dimensions before thumbnail
-            orig_w, orig_h = img.size
-
-            # Apply placeholder outlines if enabled
-            if placeholder_regions and (start_slide_num + i) in placeholder_regions:
-                # Convert to RGBA for transparency support
-                if img.mode != "RGBA":
-                    img = img.convert("RGBA")
-
-                # Get the regions for this slide
-                regions = placeholder_regions[start_slide_num + i]
-
-                # Calculate scale factors using actual slide dimensions
-                if slide_dimensions:
-                    slide_width_inches, slide_height_inches = slide_dimensions
-                else:
-                    # Fallback: estimate from image size at CONVERSION_DPI
-                    slide_width_inches = orig_w / CONVERSION_DPI
-                    slide_height_inches = orig_h / CONVERSION_DPI
-
-                x_scale = orig_w / slide_width_inches
-                y_scale = orig_h / slide_height_inches
-
-                # Create a highlight overlay
-                overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
-                overlay_draw = ImageDraw.Draw(overlay)
-
-                # Highlight each placeholder region
-                for region in regions:
-                    # Convert from inches to pixels in the original image
-                    px_left = int(region["left"] * x_scale)
-                    px_top = int(region["top"] * y_scale)
-                    px_width = int(region["width"] * x_scale)
-                    px_height = int(region["height"] * y_scale)
-
-                    # Draw highlight outline with red color and thick stroke
-                    # Using a bright red outline instead of fill
-                    stroke_width = max(
-                        5, min(orig_w, orig_h) // 150
-                    )  # Thicker proportional stroke width
-                    overlay_draw.rectangle(
-                        [(px_left, px_top), (px_left + px_width, px_top + px_height)],
-                        outline=(255, 0, 0, 255),  # Bright red, fully opaque
-                        width=stroke_width,
-                    )
-
-                # Composite the overlay onto the image using alpha blending
-                img = Image.alpha_composite(img, overlay)
-                # Convert back to RGB for JPEG saving
-                img = img.convert("RGB")
-
-            img.thumbnail((width, height), Image.Resampling.LANCZOS)
-            w, h = img.size
-            tx = x + (width - w) // 2
-            ty = y_thumbnail + (height - h) // 2
-            grid.paste(img, (tx, ty))
-
-            # Add border
-            if BORDER_WIDTH > 0:
-                draw.rectangle(
-                    [
-                        (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
-                        (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
-                    ],
-                    outline="gray",
-                    width=BORDER_WIDTH,
+class GridWriter:
+    """Thumbnail grids of a deck, filled in one slide thumbnail at a time.
+
+    Each grid holds up to cols×(cols+1) slides. A grid is saved, and its image
+    released, as soon as its last thumbnail is placed, so slides can be added
+    in any order while only the grids in progress are held in memory.
+    """
+
+    def __init__(self, slide_count, cols, width, aspect, output_path):
+        self.slide_count = slide_count
+        self.cols = cols
+        self.width = width
+        self.height = int(width * aspect)
+        self.output_path = output_path
+        # Maximum images per grid is cols × (cols + 1) for better proportions
+        self.slides_per_grid = cols * (cols + 1)
+        self.grid_count = math.ceil(slide_count / self.slides_per_grid)
+
+        self.font_size = int(width * FONT_SIZE_RATIO)
+        self.label_padding = int(self.font_size * LABEL_PADDING_RATIO)
+        try:
+            # Use Pillow's default font with size
+            self.font = ImageFont.load_default(size=self.font_size)
+        except Exception:
+            # Fall back to basic default font if size parameter not supported
+            self.font = ImageFont.load_default()
+
+        # Grid index -> [image, thumbnails still missing]
+        self._open = {}
+        self._files = {}
+
+    @property
+    def tile_size(self):
+        return self.width, self.height
+
+    def grid_path(self, grid_idx):
+        """Return the output file name of a grid."""
+        if self.grid_count <= 1:
+            # Single grid - use base filename without suffix
+            return self.output_path
+        # Multiple grids - insert index before extension with dash
+        stem = self.output_path.stem
+        suffix = self.output_path.suffix
+        return self.output_path.parent / f"{stem}-{grid_idx + 1}{suffix}"
+
+    def _slot(self, slide_idx):
+        """Return the top-left corner of a slide's label area in its grid."""
+        i = slide_idx % self.slides_per_grid
+        row, col = i // self.cols, i % self.cols
+        x = col * self.width + (col + 1) * GRID_PADDING
+        y = (
+            row * (self.height + self.font_size + self.label_padding * 2)
+            + (row + 1) * GRID_PADDING
+        )
+        return x, y
+
+    def _grid(self, grid_idx):
+        """Return the image of a grid, creating it with its labels if needed."""
+        if grid_idx not in self._open:
+            first = grid_idx * self.slides_per_grid
+            count = min(self.slides_per_grid, self.slide_count - first)
+
+            # Calculate grid size
+            rows = (count + self.cols - 1) // self.cols
+            grid_w = self.cols * self.width + (self.cols + 1) * GRID_PADDING
+            grid_h = (
+                rows * (self.height + self.font_size + self.label_padding * 2)
+                + (rows + 1) * GRID_PADDING
+            )
+            grid = Image.new("RGB", (grid_w, grid_h), "white")
+
+            # Add labels with actual slide numbers
+            draw = ImageDraw.Draw(grid)
+            for slide_idx in range(first, first + count):
+                x, y = self._slot(slide_idx)
+                label = f"{slide_idx}"
+                bbox = draw.textbbox((0, 0), label, font=self.font)
+                text_w = bbox[2] - bbox[0]
+                draw.text(
+                    (x + (self.width - text_w) // 2, y + self.label_padding),
+                    label,
+                    fill="black",
+                    font=self.font,
                 )
+            self._open[grid_idx] = [grid, count]
+        return self._open[grid_idx][0]
+
+    def add(self, slide_idx, tile):
+        """Place a slide thumbnail; saves its grid once the grid is complete."""
+        grid_idx = slide_idx // self.slides_per_grid
+        grid = self._grid(grid_idx)
+
+        # Thumbnail goes below the label with proportional spacing
+        x, y = self._slot(slide_idx)
+        y += self.label_padding + self.font_size + self.label_padding
+        w, h = tile.size
+        tx = x + (self.width - w) // 2
+        ty = y + (self.height - h) // 2
+        grid.paste(tile, (tx, ty))
+
+        # Add border
+        if BORDER_WIDTH > 0:
+            ImageDraw.Draw(grid).rectangle(
+                [
+                    (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
+                    (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
+                ],
+                outline="gray",
+                width=BORDER_WIDTH,
+            )
+
+        self._open[grid_idx][1] -= 1
+        if self._open[grid_idx][1] == 0:
+            self._save(grid_idx)
 
-    return grid
+    def _save(self, grid_idx):
+        grid, _ = self._open.pop(grid_idx)
+        grid_filename = self.grid_path(grid_idx)
+        grid_filename.parent.mkdir(parents=True, exist_ok=True)
+        grid.save(str(grid_filename), quality=JPEG_QUALITY)
+        self._files[grid_idx] = str(grid_filename)
+
+    def close(self):
+        """Save grids with missing thumbnails as they are; returns all file names."""
+        for grid_idx in range(self.grid_count):
+            if grid_idx not in self._files:
+                self._grid(grid_idx)
+                self._save(grid_idx)
+        return [self._files[grid_idx] for grid_idx in range(self.grid_count)]
 
 
 if __name__ == "__main__":
@@ -2,19 +2,42 @@
 """
 Excel Formula Recalculation Script
 Recalculates all formulas in an Excel file using LibreOffice
+With --batch, recalculates many files in one LibreOffice session
 """
 
+import argparse
 import json
 import sys
 import subprocess
 import os
 import platform
+import posixpath
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from openpyxl import load_workbook
+from xml.etree import ElementTree
+from openpyxl.utils import coordinate_to_tuple, get_column_letter
+
+import soffice_pool
+
+EXCEL_ERRORS = ['#VALUE!', '#DIV/0!', '#REF!', '#NAME?', '#NULL!', '#NUM!', '#N/A']
+
+MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+MAX_LOCATIONS = 20  # Locations listed per error type
+
+WORKBOOK_PATTERNS = ['*.xlsx', '*.xlsm']  # Files picked up from a directory in batch mode
+
+_macro_ready = False
 
 
 def setup_libreoffice_macro():
     """Setup LibreOffice macro for recalculation if not already configured"""
+    global _macro_ready
+    if _macro_ready:
+        return True
+    
     if platform.system() == 'Darwin':
         macro_dir = os.path.expanduser('~/Library/Application Support/LibreOffice/4/user/basic/Standard')
     else:
@@ -25,6 +48,7 @@ def setup_libreoffice_macro():
     if os.path.exists(macro_file):
         with open(macro_file, 'r') as f:
             if 'RecalculateAndSave' in f.read():
+                _macro_ready = True
                 return True
     
     if not os.path.exists(macro_dir):
@@ -45,27 +69,127 @@ def setup_libreoffice_macro():
     try:
         with open(macro_file, 'w') as f:
             f.write(macro_content)
+        _macro_ready = True
         return True
     except Exception:
         return False
 
 
-def recalc(filename, timeout=30):
+def workbook_sheets(archive):
+    """Yield (sheet name, part name) for each worksheet of an open xlsx zip, in order"""
+    package_rels = ElementTree.fromstring(archive.read('_rels/.rels'))
+    workbook_part = next(
+        rel.get('Target') for rel in package_rels
+        if rel.get('Type', '').endswith('/officeDocument')
+    ).lstrip('/')
+    folder, _, name = workbook_part.rpartition('/')
+    rels = ElementTree.fromstring(archive.read(posixpath.join(folder, '_rels', f'{name}.rels')))
+    rels = {rel.get('Id'): rel for rel in rels}
+
+    workbook = ElementTree.fromstring(archive.read(workbook_part))
+    for sheet in workbook.iter(f'{MAIN_NS}sheet'):
+        rel = rels.get(sheet.get(f'{REL_NS}id'))
+        # Chartsheets and dialog sheets have no cells
+        if rel is None or not rel.get('Type', '').endswith('/worksheet'):
+            continue
+        target = rel.get('Target')
+        if target.startswith('/'):
+            part = target.lstrip('/')
+        else:
+            part = posixpath.normpath(posixpath.join(folder, target))
+        yield sheet.get('name'), part
+
+
+def scan_sheet(source, sheet_name, error_details):
+    """Stream one worksheet's XML, adding its error cells to error_details
+    
+    Cells are read row by row and dropped once seen, and only the first
+    MAX_LOCATIONS locations of each error type are kept, so memory use does not
+    grow with the sheet. Returns the number of formulas in the sheet.
     """
-    Recalculate formulas in Excel file and report any errors
+    formula_count = 0
+    sheet_data = None
+    row_number = 0
     
-    Args:
-        filename: Path to Excel file
-        timeout: Maximum time to wait for recalculation (seconds)
+    for event, elem in ElementTree.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if elem.tag == f'{MAIN_NS}sheetData':
+                sheet_data = elem
+            continue
+        if elem.tag != f'{MAIN_NS}row':
+            continue
+        
+        # Row and cell references are optional; missing ones follow on from the last
+        row_number = int(elem.get('r') or row_number + 1)
+        ref = None
+        for cell in elem.iter(f'{MAIN_NS}c'):
+            if cell.get('r'):
+                ref = cell.get('r')
+            else:
+                column = coordinate_to_tuple(ref)[1] + 1 if ref else 1
+                ref = f'{get_column_letter(column)}{row_number}'
+            
+            if cell.find(f'{MAIN_NS}f') is not None:
+                formula_count += 1
+            if cell.get('t') == 'e':
+                value = cell.findtext(f'{MAIN_NS}v') or ''
+                for err in EXCEL_ERRORS:
+                    if err in value:
+                        details = error_details[err]
+                        details['count'] += 1
+                        if len(details['locations']) < MAX_LOCATIONS:
+                            details['locations'].append(f"{sheet_name}!{ref}")
+                        break
+        
+        elem.clear()
+        if sheet_data is not None:
+            sheet_data.remove(elem)
+    
+    return formula_count
+
+
+def scan_workbook(filename):
+    """
+    Report the cached formula errors and the formula count of an Excel file
+    
+    Reads each sheet's XML once, in a single streaming pass, instead of loading
+    the workbook; cached values of type "e" are errors and <f> elements formulas.
     
     Returns:
         dict with error locations and counts
     """
-    if not Path(filename).exists():
-        return {'error': f'File {filename} does not exist'}
+    error_details = {err: {'count': 0, 'locations': []} for err in EXCEL_ERRORS}
+    formula_count = 0
     
-    abs_path = str(Path(filename).absolute())
+    with zipfile.ZipFile(filename) as archive:
+        for sheet_name, part in workbook_sheets(archive):
+            with archive.open(part) as source:
+                formula_count += scan_sheet(source, sheet_name, error_details)
     
+    total_errors = sum(details['count'] for details in error_details.values())
+    
+    # Build result summary
+    result = {
+        'status': 'success' if total_errors == 0 else 'errors_found',
+        'total_errors': total_errors,
+        'error_summary': {}
+    }
+    
+    # Add non-empty error categories
+    for err_type, details in error_details.items():
+        if details['count']:
+            result['error_summary'][err_type] = details
+    
+    result['total_formulas'] = formula_count
+    
+    return result
+
+
+def recalc_with_macro(abs_path, timeout):
+    """Recalculate a file with a one-off soffice run of the RecalculateAndSave macro
+    
+    Returns an error dict, or None on success
+    """
     if not setup_libreoffice_macro():
         return {'error': 'Failed to setup LibreOffice macro'}
     
@@ -98,66 +222,133 @@ def recalc(filename, timeout=30):
         else:
             return {'error': error_msg}
     
+    return None
+
+
+def recalc(filename, timeout=30):
+    """
+    Recalculate formulas in Excel file and report any errors
+    
+    Args:
+        filename: Path to Excel file
+        timeout: Maximum time to wait for recalculation (seconds)
+    
+    Returns:
+        dict with error locations and counts
+    """
+    if not Path(filename).exists():
+        return {'error': f'File {filename} does not exist'}
+    
+    abs_path = str(Path(filename).absolute())
+    
+    pool = soffice_pool.get_pool()
+    if pool is not None:
+        # A warm LibreOffice instance recalculates over UNO; no macro needed
+        try:
+            pool.recalc(abs_path, timeout)
+        except soffice_pool.OfficeUnavailable:
+            pool = None
+        except subprocess.TimeoutExpired:
+            pass  # Like the macro run's timeout: check what was saved
+        except soffice_pool.ConversionError as e:
+            return {'error': str(e)}
+    if pool is None:
+        error = recalc_with_macro(abs_path, timeout)
+        if error:
+            return error
+    
     # Check for Excel errors in the recalculated file - scan ALL cells
     try:
-        wb = load_workbook(filename, data_only=True)
-        
-        excel_errors = ['#VALUE!', '#DIV/0!', '#REF!', '#NAME?', '#NULL!', '#NUM!', '#N/A']
-        error_details = {err: [] for err in excel_errors}
-        total_errors = 0
-        
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            # Check ALL rows and columns - no limits
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.value is not None and isinstance(cell.value, str):
-                        for err in excel_errors:
-                            if err in cell.value:
-                                location = f"{sheet_name}!{cell.coordinate}"
-                                error_details[err].append(location)
-                                total_errors += 1
-                                break
-        
-        wb.close()
-        
-        # Build result summary
-        result = {
-            'status': 'success' if total_errors == 0 else 'errors_found',
-            'total_errors': total_errors,
-            'error_summary': {}
-        }
-        
-        # Add non-empty error categories
-        for err_type, locations in error_details.items():
-            if locations:
-                result['error_summary'][err_type] = {
-                    'count': len(locations),
-                    'locations': locations[:20]  # Show up to 20 locations
-                }
-        
-        # Add formula count for context - also check ALL cells
-        wb_formulas = load_workbook(filename, data_only=False)
-        formula_count = 0
-        for sheet_name in wb_formulas.sheetnames:
-            ws = wb_formulas[sheet_name]
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.value and isinstance(cell.value, str) and cell.value.startswith('='):
-                        formula_count += 1
-        wb_formulas.close()
-        
-        result['total_formulas'] = formula_count
-        
-        return result
-        
+        return scan_workbook(filename)
     except Exception as e:
         return {'error': str(e)}
 
 
+def workbook_paths(paths):
+    """Expand directories into the workbooks they contain, keeping the given order"""
+    files = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            found = {f for pattern in WORKBOOK_PATTERNS for f in path.glob(pattern)}
+            # Skip the lock files Excel leaves next to open workbooks
+            files.extend(sorted(f for f in found if not f.name.startswith('~$')))
+        else:
+            files.append(path)
+    return list(dict.fromkeys(str(f) for f in files))
+
+
+def recalc_batch(paths, timeout=30, jobs=1):
+    """
+    Recalculate many Excel files in one LibreOffice session and report errors
+    
+    Every file is opened, recalculated and stored by the same warm LibreOffice
+    instances (up to `jobs` of them, working in parallel), so soffice starts
+    once for the whole batch rather than once per file. Without LibreOffice's
+    Python bindings, files are recalculated one at a time with the macro.
+    
+    Args:
+        paths: Excel files, and directories whose .xlsx/.xlsm files are all included
+        timeout: Maximum time to wait for recalculation of each file (seconds)
+        jobs: Number of LibreOffice instances to use
+    
+    Returns:
+        dict with totals over all files and the recalc() result of each file
+    """
+    files = workbook_paths(paths)
+    
+    # One-off soffice runs share a user profile, so they cannot overlap
+    if soffice_pool.get_pool(jobs) is None:
+        jobs = 1
+    
+    def recalc_file(filename):
+        # One file failing (e.g. soffice crashing on it) must not end the batch
+        try:
+            return recalc(filename, timeout)
+        except Exception as e:
+            return {'error': str(e)}
+    
+    with ThreadPoolExecutor(max(1, jobs)) as executor:
+        results = dict(zip(files, executor.map(recalc_file, files)))
+    
+    failed = [f for f, result in results.items() if 'error' in result]
+    with_errors = [f for f, result in results.items() if result.get('total_errors')]
+    
+    return {
+        'status': 'success' if not failed and not with_errors else 'errors_found',
+        'total_files': len(files),
+        'files_with_errors': len(with_errors),
+        'failed_files': len(failed),
+        'total_errors': sum(result.get('total_errors', 0) for result in results.values()),
+        'total_formulas': sum(result.get('total_formulas', 0) for result in results.values()),
+        'files': results
+    }
+
+
+def batch_main(args):
+    parser = argparse.ArgumentParser(
+        prog='recalc.py --batch',
+        description='Recalculate many Excel files in one LibreOffice session'
+    )
+    parser.add_argument('paths', nargs='+', help='Excel files or directories of Excel files')
+    parser.add_argument('--timeout', type=int, default=30,
+                        help='Maximum seconds per file (default: 30)')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Number of LibreOffice instances to run in parallel (default: 1)')
+    args = parser.parse_args(args)
+    
+    result = recalc_batch(args.paths, args.timeout, args.jobs)
+    print(json.dumps(result, indent=2))
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--batch':
+        batch_main(sys.argv[2:])
+        return
+    
     if len(sys.argv) < 2:
         print("Usage: python recalc.py <excel_file> [timeout_seconds]")
+        print("       python recalc.py --batch <excel_file_or_directory>... [--timeout N] [--jobs N]")
         print("\nRecalculates all formulas in an Excel file using LibreOffice")
         print("\nReturns JSON with error details:")
         print("  - status: 'success' or 'errors_found'")
@@ -165,6 +356,8 @@ def main():
         print("  - total_formulas: Number of formulas in the file")
         print("  - error_summary: Breakdown by error type with locations")
         print("    - #VALUE!, #DIV/0!, #REF!, #NAME?, #NULL!, #NUM!, #N/A")
+        print("\nWith --batch, returns one JSON report with totals over all files")
+        print("and each file's result under 'files'")
         sys.exit(1)
     
     filename = sys.argv[1]